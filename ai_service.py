@@ -1,17 +1,17 @@
 # ai_service.py
 
-import os
 import json
 import time
-from newspaper import Article
-from openai import OpenAI
 
+# newspaper, openai는 임포트 비용이 커서 실제로 사용하는 시점에 불러옵니다.
 # Config 클래스는 news_collector.py 대신 여기서 바로 임포트
 from config import Config 
 
 class AIService:
 
     def __init__(self, config: Config):
+        from openai import OpenAI
+
         self.config = config
         self.client = OpenAI(api_key=config.OPENAI_API_KEY)
         self.model = config.GPT_MODEL
@@ -71,6 +71,8 @@ class AIService:
         """
         summary = None
         try:
+            from newspaper import Article
+
             # ✨ [핵심 개선] newspaper3k에 타임아웃과 캐시 비활성화 옵션을 추가하여 안정성 확보
             article_config = {
                 'memoize_articles': False,  # 캐시 사용 안 함
@@ -0,0 +1,78 @@
+# archive_assets.py
+
+import os
+import re
+import sys
+import base64
+import hashlib
+from config import Config
+
+MIME_EXTENSIONS = {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp', 'image/gif': 'gif'}
+DATA_URI_PATTERN = re.compile(r'src="data:(image/[a-z+]+);base64,([A-Za-z0-9+/=\s]+)"')
+
+
+class ArchiveAssetStore:
+    """웹 아카이브용 이미지를 내용 해시(sha256) 이름으로 archive/assets/에 한 번만 저장합니다.
+
+    같은 이미지(배너, 날짜가 바뀌어도 같은 기사 이미지 등)는 파일 하나를 함께 쓰므로
+    아카이브는 매일 새로 생긴 이미지 바이트만큼만 늘어나고, 페이지는 이미지를 따로 내려받아 점진적으로 표시됩니다.
+    """
+
+    def __init__(self, config: Config):
+        self.asset_dir = config.ARCHIVE_ASSET_DIR
+        # 아카이브 페이지(archive/*.html) 기준 상대 경로
+        self.url_prefix = os.path.relpath(self.asset_dir, config.ARCHIVE_DIR).replace(os.sep, '/')
+        self.written, self.reused = 0, 0
+
+    def store(self, data: bytes, mime='image/jpeg', digest=None):
+        """이미지를 저장하고 아카이브 페이지에서 쓸 상대 URL을 반환합니다. digest: 이미 계산한 sha256 hex"""
+        extension = MIME_EXTENSIONS.get(mime, 'bin')
+        filename = f"{(digest or hashlib.sha256(data).hexdigest())[:20]}.{extension}"
+        path = os.path.join(self.asset_dir, filename)
+        if os.path.exists(path):
+            self.reused += 1
+        else:
+            os.makedirs(self.asset_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self.written += 1
+        return f"{self.url_prefix}/{filename}"
+
+    def store_base64(self, b64_string, mime='image/png'):
+        return self.store(base64.b64decode(b64_string), mime)
+
+    def externalize_data_uris(self, html):
+        """HTML 안의 data: 이미지 URI를 에셋 파일 URL로 바꿉니다. (기존 아카이브 페이지 변환용)"""
+        def replace(match):
+            mime, b64_string = match.group(1), re.sub(r'\s+', '', match.group(2))
+            return f'src="{self.store_base64(b64_string, mime)}" loading="lazy"'
+        return DATA_URI_PATTERN.sub(replace, html)
+
+
+def migrate_archive(config: Config):
+    """기존 archive/*.html 에 들어 있는 Base64 이미지를 archive/assets/로 옮깁니다."""
+    store = ArchiveAssetStore(config)
+    saved_bytes = 0
+    for filename in sorted(os.listdir(config.ARCHIVE_DIR)):
+        if not filename.endswith('.html') or filename == 'index.html':
+            continue
+        path = os.path.join(config.ARCHIVE_DIR, filename)
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        new_html = store.externalize_data_uris(html)
+        if new_html != html:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(new_html)
+            saved_bytes += len(html.encode('utf-8')) - len(new_html.encode('utf-8'))
+            print(f"✅ {filename}: {len(html) / 1024:.0f}KB -> {len(new_html) / 1024:.0f}KB")
+    print(f"🎉 변환 완료: 페이지 {saved_bytes / 1024 / 1024:.1f}MB 감소, 에셋 새로 저장 {store.written}개 / 재사용 {store.reused}개")
+
+
+if __name__ == "__main__":
+    # 예: python archive_assets.py migrate
+    if len(sys.argv) > 1 and sys.argv[1] == 'migrate':
+        migrate_archive(Config())
+    else:
+        print("사용법: python archive_assets.py migrate")
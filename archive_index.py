@@ -0,0 +1,221 @@
+# archive_index.py
+
+import os
+import re
+import json
+import html
+import threading
+from datetime import date
+from urllib.parse import quote
+from config import Config
+
+DAILY_FILE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})\.html$')
+WEEKLY_FILE_PATTERN = re.compile(r'^(\d{4})년 (\d{1,2})월 (\d)주차\.html$')
+MODE_LABELS = {'daily': '일간', 'weekly': '주간'}
+DEFAULT_TITLES = {'daily': "로디와 함께하는 오늘의 물류 산책", 'weekly': "로디와 함께하는 주간 물류 산책"}
+ITEM_MARKER = 'alt="Article Thumbnail"'
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: sans-serif; margin: 40px; background-color: #f6f8fa; }}
+        .container {{ max-width: 600px; margin: 0 auto; background-color: #fff; border: 1px solid #e1e4e8; border-radius: 6px; padding: 20px 40px; }}
+        h1 {{ text-align: center; }}
+        ul {{ list-style: none; padding: 0; }}
+        li {{ margin: 15px 0; }}
+        a {{ text-decoration: none; font-size: 1.1em; color: #0366d6; }}
+        a:hover {{ text-decoration: underline; }}
+        .meta {{ color: #6a737d; font-size: 0.85em; margin-left: 6px; }}
+        .months {{ text-align: center; line-height: 2; }}
+        .months a {{ font-size: 0.95em; margin: 0 6px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{heading}</h1>
+{body}
+    </div>
+</body>
+</html>
+"""
+
+
+def weekly_issue_date(year, month, week_of_month):
+    """'YYYY년 M월 N주차'(utils.get_kst_week_str)를 해당 주의 첫 날짜로 되돌립니다. 정렬 용도의 근사값입니다."""
+    first_day = date(year, month, 1)
+    day = 7 * (week_of_month - 1) - (first_day.weekday() + 1)
+    return first_day.replace(day=min(max(day, 1), 28)).isoformat()
+
+
+def parse_issue_filename(filename):
+    """아카이브 파일 이름에서 (날짜 'YYYY-MM-DD', 모드)를 추출합니다. 뉴스레터 파일이 아니면 None."""
+    match = DAILY_FILE_PATTERN.match(filename)
+    if match:
+        return '-'.join(match.groups()), 'daily'
+    match = WEEKLY_FILE_PATTERN.match(filename)
+    if match:
+        year, month, week = (int(g) for g in match.groups())
+        return weekly_issue_date(year, month, week), 'weekly'
+    return None
+
+
+class ArchiveIndex:
+    """archive/manifest.jsonl 에 호별 정보(date, mode, title, item_count, size, file)를 한 줄씩 덧붙이고
+    월별로 나눈 목록 페이지(archive/index-YYYY-MM.html)와 archive/index.html을 만듭니다.
+
+    호를 추가할 때는 manifest에 한 줄을 덧붙이고 그 달의 페이지와 index.html만 다시 만들므로,
+    아카이브가 몇 년 치로 늘어나도 매 실행의 비용은 일정합니다. 같은 파일이 여러 줄에 있으면
+    마지막 줄이 유효하며, manifest 전체를 다시 쓰는 것은 rebuild()뿐입니다. 정렬은 파일 수정 시각이 아닌 manifest의 날짜를 따르므로
+    git checkout 후에도 순서가 유지됩니다.
+    """
+
+    def __init__(self, config: Config):
+        self.archive_dir = config.ARCHIVE_DIR
+        self.manifest_path = config.ARCHIVE_MANIFEST_FILE
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        """manifest를 읽어 {file: entry}를 반환합니다. 같은 파일은 나중 줄이 앞의 줄을 덮어씁니다."""
+        entries = {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        entries[entry['file']] = entry
+                    except (json.JSONDecodeError, KeyError, TypeError) as e:
+                        # 기록 중 중단되어 잘린 줄 등은 건너뜁니다.
+                        print(f"⚠️ 아카이브 manifest {line_no}번째 줄을 건너뜁니다: {e}")
+        except FileNotFoundError:
+            return None
+        return entries
+
+    def _append(self, entry):
+        """manifest 끝에 한 줄을 덧붙입니다."""
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        with open(self.manifest_path, 'ab+') as f:
+            # 이전 기록이 줄바꿈 없이 잘려 있으면 새 줄에서 시작해 그 줄과 섞이지 않게 합니다.
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+
+    def _rewrite_manifest(self):
+        """중복 줄 없이 날짜순으로 manifest 전체를 다시 씁니다. rebuild()에서만 사용합니다."""
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in reversed(self._sorted_entries()):
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.manifest_path)
+
+    def _sorted_entries(self, month=None):
+        entries = [e for e in self.entries.values() if month is None or e['date'][:7] == month]
+        return sorted(entries, key=lambda e: (e['date'], e['mode'] == 'weekly', e['file']), reverse=True)
+
+    def _describe_file(self, filename, mode=None, title=None, item_count=None, issue_date=None):
+        path = os.path.join(self.archive_dir, filename)
+        parsed = parse_issue_filename(filename)
+        if issue_date is None or mode is None:
+            if parsed is None:
+                raise ValueError(f"아카이브 파일 이름에서 날짜를 알 수 없습니다: {filename}")
+            issue_date, mode = issue_date or parsed[0], mode or parsed[1]
+        if item_count is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                item_count = f.read().count(ITEM_MARKER)
+        return {
+            'date': issue_date, 'mode': mode, 'title': title or DEFAULT_TITLES.get(mode, ''),
+            'item_count': item_count, 'size': os.path.getsize(path), 'file': filename,
+        }
+
+    def rebuild(self):
+        """기존 아카이브 파일을 모두 훑어서 manifest를 새로 쓰고, 모든 월별 페이지를 생성합니다.
+        manifest가 없을 때 한 번 자동으로 실행되며, 수동으로 정리할 때도 사용합니다."""
+        self.entries = {}
+        for filename in sorted(os.listdir(self.archive_dir)):
+            if parse_issue_filename(filename):
+                self.entries[filename] = self._describe_file(filename)
+        self._rewrite_manifest()
+        for month in {e['date'][:7] for e in self.entries.values()}:
+            self._write_month_page(month)
+        self._write_index_page()
+        print(f"✅ 기존 아카이브 {len(self.entries)}개 호로 manifest를 만들었습니다.")
+
+    def record_issue(self, filename, mode, title, item_count, issue_date):
+        """새로 저장한 호를 manifest에 추가(같은 파일이면 갱신)하고, 해당 월 페이지와 index.html만 다시 만듭니다."""
+        with self._lock:
+            if self.entries is None:
+                self.rebuild()
+            previous = self.entries.get(filename)
+            entry = self._describe_file(filename, mode, title, item_count, issue_date)
+            self.entries[filename] = entry
+            if entry != previous:
+                self._append(entry)
+            self._write_month_page(entry['date'][:7])
+            if previous and previous['date'][:7] != entry['date'][:7]:
+                self._write_month_page(previous['date'][:7])
+            self._write_index_page()
+
+    @staticmethod
+    def month_page_name(month):
+        return f"index-{month}.html"
+
+    def _month_counts(self):
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry['date'][:7]] = counts.get(entry['date'][:7], 0) + 1
+        return sorted(counts.items(), reverse=True)
+
+    def _render_month_nav(self, month_counts, current=None):
+        links = []
+        for month, count in month_counts:
+            label = f"{month[:4]}년 {int(month[5:])}월 ({count})"
+            links.append(f"<b>{label}</b>" if month == current else f'<a href="{self.month_page_name(month)}">{label}</a>')
+        return '        <p class="months">' + ' · '.join(links) + '</p>'
+
+    def _render_issue_list(self, entries):
+        lines = ['        <ul>']
+        for entry in entries:
+            label = html.escape(entry['file'][:-len('.html')])
+            meta = f"{MODE_LABELS.get(entry['mode'], entry['mode'])} · 기사 {entry['item_count']}건 · {entry['size'] / 1024:.0f}KB"
+            lines.append(f'            <li><a href="{quote(entry["file"])}" title="{html.escape(entry["title"])}">{label} 뉴스레터</a><span class="meta">{meta}</span></li>')
+        lines.append('        </ul>')
+        return '\n'.join(lines)
+
+    def _write_page(self, filename, title, body):
+        path = os.path.join(self.archive_dir, filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(PAGE_TEMPLATE.format(title=title, heading=title, body=body))
+        os.replace(tmp_path, path)
+
+    def _write_month_page(self, month):
+        title = f"{month[:4]}년 {int(month[5:])}월 뉴스레터"
+        body = '\n'.join([
+            '        <p class="months"><a href="index.html">← 전체 목록</a></p>',
+            self._render_issue_list(self._sorted_entries(month)),
+        ])
+        self._write_page(self.month_page_name(month), title, body)
+
+    def _write_index_page(self):
+        """index.html에는 월 목록과 가장 최근 달의 호만 싣습니다."""
+        month_counts = self._month_counts()
+        latest_month = month_counts[0][0] if month_counts else None
+        body = ['        <p class="months"><a href="search.html">🔍 기사 검색</a></p>', self._render_month_nav(month_counts, current=latest_month)]
+        if latest_month:
+            body.append(self._render_issue_list(self._sorted_entries(latest_month)))
+        self._write_page('index.html', "지난 뉴스레터 목록", '\n'.join(body))
+
+
+if __name__ == "__main__":
+    # manifest와 월별 페이지를 기존 아카이브 파일로부터 다시 만듭니다.
+    ArchiveIndex(Config()).rebuild()
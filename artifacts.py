@@ -0,0 +1,58 @@
+# artifacts.py
+
+import os
+import base64
+import hashlib
+import mimetypes
+from functools import cached_property
+
+
+class Artifact:
+    """실행 중 만들어진 결과물(유가 차트, 날씨 대시보드, 아카이브 페이지 등)을 메모리의 바이트로 들고 다닙니다.
+
+    웹 페이지용 Base64와 중복 확인용 sha256은 실제로 필요할 때 한 번만 계산하고,
+    파일은 write()를 부를 때 한 번만 씁니다. 그 뒤의 단계(템플릿, 메일 첨부, 아카이브 에셋)는
+    같은 파일을 다시 열지 않고 이 객체의 바이트를 그대로 사용합니다.
+    """
+
+    def __init__(self, data: bytes, name, mime=None):
+        self.data = data
+        self.name = name
+        self.mime = mime or mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.path = None
+
+    @classmethod
+    def from_file(cls, path, mime=None):
+        with open(path, 'rb') as f:
+            artifact = cls(f.read(), os.path.basename(path), mime)
+        artifact.path = path
+        return artifact
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    @cached_property
+    def base64(self):
+        return base64.b64encode(self.data).decode('utf-8')
+
+    @cached_property
+    def sha256(self):
+        return hashlib.sha256(self.data).hexdigest()
+
+    @property
+    def data_uri(self):
+        return f"data:{self.mime};base64,{self.base64}"
+
+    def write(self, directory):
+        """directory/name 에 한 번만 저장하고 경로를 반환합니다. 같은 위치에 다시 부르면 쓰지 않습니다."""
+        path = os.path.join(directory, self.name)
+        if self.path == path:
+            return path
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(self.data)
+        os.replace(tmp_path, path)
+        self.path = path
+        return path
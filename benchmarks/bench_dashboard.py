@@ -0,0 +1,58 @@
+# benchmarks/bench_dashboard.py
+"""권역 수에 따른 날씨 대시보드 렌더링 시간을 측정합니다.
+
+사용법: python benchmarks/bench_dashboard.py [권역수 ...]
+예: python benchmarks/bench_dashboard.py 4 8 16 32 64
+"""
+
+import os
+import sys
+import time
+import random
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')) # assets/ 상대경로 기준
+
+from config import Config
+from dashboard_renderer import render_dashboard_tiles
+
+
+def make_sample_data(hub_count, day_count):
+    regions = [f"권역{i + 1:02d}" for i in range(hub_count)]
+    days = [(datetime.now() + timedelta(days=i)).strftime('%Y%m%d') for i in range(day_count)]
+    icons = ['sunny', 'cloudy', 'rain', 'snow']
+    analyzed_data = {
+        day: {
+            region: {
+                'min_temp': str(random.randint(-5, 15)), 'max_temp': str(random.randint(16, 30)),
+                'icon_code': random.choice(icons), 'risk_level': random.choice(['안전', '주의', '위험']),
+                'risk_text': random.choice(['', '', '강풍', '비,강풍']),
+            } for region in regions
+        } for day in days
+    }
+    return regions, days, analyzed_data
+
+
+def main():
+    config = Config()
+    hub_counts = [int(arg) for arg in sys.argv[1:]] or [4, 8, 16, 32, 64]
+    day_count = min(config.WEATHER_FORECAST_DAYS, 10) + 1
+    print(f"일수: {day_count}, 장당 권역 수: {config.DASHBOARD_HUBS_PER_TILE}, 포맷: {config.DASHBOARD_IMAGE_FORMAT}")
+    print(f"{'권역수':>6} {'장수':>4} {'전체(ms)':>10} {'장당(ms)':>10} {'총 용량(KB)':>12}")
+
+    # 폰트/아이콘/배경 캐시를 데우기 위한 1회 실행
+    regions, days, analyzed_data = make_sample_data(config.DASHBOARD_HUBS_PER_TILE, day_count)
+    render_dashboard_tiles(analyzed_data, days, "업데이트: 벤치마크", regions, config.DASHBOARD_HUBS_PER_TILE, config.DASHBOARD_IMAGE_FORMAT)
+
+    for hub_count in hub_counts:
+        regions, days, analyzed_data = make_sample_data(hub_count, day_count)
+        start = time.perf_counter()
+        tiles = render_dashboard_tiles(analyzed_data, days, "업데이트: 벤치마크", regions, config.DASHBOARD_HUBS_PER_TILE, config.DASHBOARD_IMAGE_FORMAT)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        total_kb = sum(len(tile) for tile in tiles) / 1024
+        print(f"{hub_count:>6} {len(tiles):>4} {elapsed_ms:>10.1f} {elapsed_ms / len(tiles):>10.1f} {total_kb:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
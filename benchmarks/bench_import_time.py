@@ -0,0 +1,76 @@
+# benchmarks/bench_import_time.py
+"""모듈 임포트 시간을 `python -X importtime`으로 측정하고 예산을 넘으면 실패 코드로 종료합니다.
+
+사용법: python benchmarks/bench_import_time.py [반복 횟수]
+
+news_collector는 메인 프로세스와 테스트 모드가, scraper_workers는 기사 처리용 자식 프로세스가
+시작할 때마다 불러오므로 두 모듈의 임포트 시간이 곧 실행/프로세스 생성 비용입니다.
+"""
+
+import os
+import re
+import sys
+import subprocess
+from statistics import median
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# 모듈별 임포트 시간 예산 (ms, 반복 측정의 중앙값 기준)
+IMPORT_BUDGET_MS = {
+    'news_collector': 400,
+    'scraper_workers': 1500,
+}
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure_import(module_name):
+    """새 인터프리터에서 모듈을 임포트하고 (전체 ms, [(누적 ms, 최상위 하위 모듈명)]) 을 반환합니다."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    # importtime은 하위 모듈을 먼저 출력하므로, 대상 모듈 줄 직전까지 모인 한 단계 아래 모듈이 직접 임포트한 모듈입니다.
+    total_us, direct_imports = 0, []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent == 1:
+            if name == module_name:
+                total_us = cumulative_us
+                break
+            direct_imports = [] # 인터프리터 시작 시 불러오는 모듈(site 등)은 제외
+        elif indent == 3:
+            direct_imports.append((cumulative_us / 1000, name))
+    return total_us / 1000, sorted(direct_imports, reverse=True)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    over_budget = []
+    for module_name, budget_ms in IMPORT_BUDGET_MS.items():
+        try:
+            samples = [measure_import(module_name) for _ in range(repeat)]
+        except RuntimeError as e:
+            print(f"❌ {module_name} 임포트 실패: {e}")
+            over_budget.append(module_name)
+            continue
+        median_ms = median(total for total, _ in samples)
+        status = "✅" if median_ms <= budget_ms else "❌"
+        print(f"{status} {module_name}: {median_ms:.1f}ms (예산 {budget_ms}ms, {repeat}회 중앙값)")
+        for cumulative_ms, name in samples[-1][1][:8]:
+            print(f"     {cumulative_ms:8.1f}ms  {name}")
+        if median_ms > budget_ms:
+            over_budget.append(module_name)
+
+    if over_budget:
+        print(f"\n🚨 임포트 시간 예산 초과: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
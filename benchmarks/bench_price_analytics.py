@@ -0,0 +1,69 @@
+# benchmarks/bench_price_analytics.py
+"""여러 해 분량의 유가 이력에서 추세 지표를 계산하는 시간을 측정합니다.
+
+사용법: python benchmarks/bench_price_analytics.py [연수] [반복 횟수]
+전국 + TARGET_AREA_CODES 지역, 휘발유/경유의 일별 가상 이력을 만들고
+PriceAnalytics.from_records(3차원 배열 구성 + 전체 지표 계산)와 추세 문장 생성의 중앙값을 출력합니다.
+"""
+
+import os
+import sys
+import time
+from statistics import median
+from datetime import datetime, timedelta
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+
+ANALYTICS_BUDGET_MS = 200 # 이력 분석 한 번의 시간 예산
+
+from config import Config
+from price_history import NATIONAL_AREA_CODE
+from price_analytics import PriceAnalytics, PRODUCT_CODES
+
+
+def make_records(years, areas):
+    records = {}
+    start = datetime(2025, 1, 1) - timedelta(days=365 * years)
+    for day in range(365 * years):
+        date_str = (start + timedelta(days=day)).strftime('%Y%m%d')
+        for area_no, area in enumerate(areas):
+            if area != NATIONAL_AREA_CODE and day % 11 == area_no: # 지역별로 가끔 빠진 날을 둡니다.
+                continue
+            for product_no, product in enumerate(PRODUCT_CODES.values()):
+                records[(date_str, area, product)] = 1600 + product_no * 100 + area_no * 3 + (day * 7) % 50
+    return records
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    config = Config()
+    areas = [NATIONAL_AREA_CODE] + config.TARGET_AREA_CODES
+    area_names = {NATIONAL_AREA_CODE: '전국', **config.AREA_CODE_MAP}
+    records = make_records(years, areas)
+    print(f"이력 {years}년, {len(records):,}건 (지역 {len(areas)}개 x 유종 {len(PRODUCT_CODES)}개)")
+
+    start = time.perf_counter()
+    import numpy
+    print(f"numpy 임포트: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analytics = PriceAnalytics.from_records(records, config.TARGET_AREA_CODES)
+        analytics.trend_comment('diesel', area_names)
+        analytics.regional_series('diesel', config.PRICE_CHART_DAYS_WEEKLY, area_names)
+        samples.append((time.perf_counter() - start) * 1000)
+    median_ms = median(samples)
+    print(f"분석 {repeat}회 중앙값: {median_ms:.1f}ms")
+    print(f"추세 문장: {analytics.trend_comment('diesel', area_names)}")
+
+    if median_ms > ANALYTICS_BUDGET_MS:
+        print(f"🚨 분석 시간 예산({ANALYTICS_BUDGET_MS}ms) 초과")
+        sys.exit(1)
+    print(f"✅ 예산({ANALYTICS_BUDGET_MS}ms) 이내")
+
+
+if __name__ == '__main__':
+    main()
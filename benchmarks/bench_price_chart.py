@@ -0,0 +1,69 @@
+# benchmarks/bench_price_chart.py
+"""유가 추이 차트의 렌더링 시간을 측정합니다.
+
+사용법: python benchmarks/bench_price_chart.py [반복 횟수]
+Matplotlib 임포트, 첫 렌더링(폰트 로드 포함), 이후 반복 렌더링의 중앙값을
+7일 차트와 주간(누적 이력) 차트 각각에 대해 출력합니다.
+"""
+
+import os
+import sys
+import time
+from statistics import median
+from datetime import datetime, timedelta
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+os.chdir(ROOT_DIR) # assets/ 상대경로 기준
+
+RENDER_BUDGET_MS = 150 # 차트 한 장의 렌더링 시간 예산
+
+from price_chart import render_price_chart, load_font_properties
+
+# price_chart는 차트를 그릴 때 Matplotlib을 불러오므로, 임포트 시간을 따로 재기 위해 여기서 먼저 불러옵니다.
+start = time.perf_counter()
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import_ms = (time.perf_counter() - start) * 1000
+
+
+def make_series(days):
+    dates = [(datetime(2025, 1, 1) + timedelta(days=i)).strftime('%Y%m%d') for i in range(days)]
+    return {
+        'gasoline': [{'DATE': d, 'PRICE': f"{1700 + (i * 7) % 40:.2f}"} for i, d in enumerate(dates)],
+        'diesel': [{'DATE': d, 'PRICE': f"{1600 + (i * 5) % 30:.2f}"} for i, d in enumerate(dates)],
+    }
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"matplotlib 임포트: {import_ms:.1f}ms")
+
+    start = time.perf_counter()
+    load_font_properties()
+    print(f"폰트 로드: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    over_budget = False
+    for label, days in (("7일 차트", 7), ("주간 차트(누적 이력)", 28)):
+        series = make_series(days)
+        start = time.perf_counter()
+        png_bytes = render_price_chart(series)
+        first_ms = (time.perf_counter() - start) * 1000
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            render_price_chart(series)
+            samples.append((time.perf_counter() - start) * 1000)
+        median_ms = median(samples)
+        over_budget |= median_ms > RENDER_BUDGET_MS
+        print(f"{label}: 첫 렌더링 {first_ms:.1f}ms, 반복 {repeat}회 중앙값 {median_ms:.1f}ms ({len(png_bytes) / 1024:.0f}KB)")
+
+    if over_budget:
+        print(f"🚨 렌더링 시간 예산({RENDER_BUDGET_MS}ms) 초과")
+        sys.exit(1)
+    print(f"✅ 예산({RENDER_BUDGET_MS}ms) 이내")
+
+
+if __name__ == '__main__':
+    main()
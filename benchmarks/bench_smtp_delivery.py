@@ -0,0 +1,82 @@
+# benchmarks/bench_smtp_delivery.py
+"""로컬 SMTP 대역(sink) 서버로 메일 발송 처리량을 측정합니다.
+
+사용법: python benchmarks/bench_smtp_delivery.py [수신자 수] [서버 응답 지연(ms)]
+실제 메일은 보내지 않습니다. 127.0.0.1에 받은 메일을 버리기만 하는 SMTP 서버를 띄우고,
+연결 풀 크기(동시 발송 수)를 바꿔 가며 DeliveryService의 초당 발송 수를 출력합니다.
+"""
+
+import os
+import sys
+import time
+import threading
+import socketserver
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+
+from config import Config
+from delivery_service import DeliveryService
+
+POOL_SIZES = (1, 3, 5)
+MESSAGE_SIZE = 1024 * 1024 # 이미지가 포함된 뉴스레터 한 통 정도의 크기
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    """메일을 받고 버리는 최소한의 SMTP 서버. DATA 종료 후 응답 전에 server.delay_seconds 만큼 기다립니다."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        self.reply('220 sink ESMTP')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.strip().upper()
+            if command.startswith((b'EHLO', b'HELO')):
+                self.reply('250 sink')
+            elif command == b'DATA':
+                self.reply('354 end with .')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                time.sleep(self.server.delay_seconds)
+                self.server.received += 1
+                self.reply('250 queued')
+            elif command == b'QUIT':
+                self.reply('221 bye')
+                return
+            else: # MAIL, RCPT, RSET, NOOP
+                self.reply('250 ok')
+
+
+class SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def run(recipient_count, delay_ms):
+    server = SinkServer(('127.0.0.1', 0), SinkHandler)
+    server.delay_seconds, server.received = delay_ms / 1000, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    message = b'Subject: bench\r\n\r\n' + (b'x' * 998 + b'\r\n') * (MESSAGE_SIZE // 1000)
+    recipients = [f"user{i}@example.com" for i in range(recipient_count)]
+    print(f"수신자 {recipient_count}명, 메시지 {len(message) / 1024:.0f}KB, 서버 응답 지연 {delay_ms}ms")
+
+    for pool_size in POOL_SIZES:
+        config = Config()
+        config.SMTP_HOST, config.SMTP_PORT, config.SMTP_STARTTLS = '127.0.0.1', server.server_address[1], False
+        config.SMTP_POOL_SIZE, config.SMTP_MAX_SENDS_PER_SECOND = pool_size, 0
+        server.received = 0
+        start = time.perf_counter()
+        result = DeliveryService(config).deliver('bench@example.com', recipients, lambda recipient: message)
+        elapsed = time.perf_counter() - start
+        print(f"연결 {pool_size}개: {elapsed:.2f}초, {result['sent'] / elapsed:.1f}통/초 "
+              f"(성공 {result['sent']}, 실패 {len(result['failed'])}, 서버 수신 {server.received})")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50, int(sys.argv[2]) if len(sys.argv) > 2 else 50)
@@ -0,0 +1,75 @@
+# benchmarks/bench_template_render.py
+"""뉴스레터 한 호(웹 + 이메일)의 템플릿 렌더링 시간을 측정합니다.
+
+사용법: python benchmarks/bench_template_render.py [반복 횟수]
+첫 렌더링(Jinja 임포트, 템플릿 로드/컴파일 포함)과 이후 반복 렌더링의 호당 시간을 출력하고,
+반복 렌더링의 중앙값이 예산을 넘으면 실패 코드로 종료합니다.
+"""
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+from statistics import median
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+
+RENDER_BUDGET_MS = 10 # 호당(웹 + 이메일) 렌더링 시간 예산
+
+start = time.perf_counter()
+import template_engine
+from artifacts import Artifact
+import_ms = (time.perf_counter() - start) * 1000
+
+
+def make_sample_context(news_count=10):
+    fake_image = os.urandom(60 * 1024) # 기사 이미지 크기 정도의 바이트
+    fake_png = Artifact(os.urandom(80 * 1024), 'sample.png', 'image/png')
+    return {
+        "title": "렌더링 벤치마크", "today_date": "2025-01-01", "date": date,
+        "ai_briefing": "<p>" + "오늘의 물류 브리핑 " * 50 + "</p>",
+        "risk_events": [{"date_range": (date.today() + timedelta(days=d), date.today() + timedelta(days=d + 1)), "country": "한국",
+                         "name": "샘플 리스크", "risk_summary": "설명"} for d in range(1, 6)],
+        "price_indicators": {
+            "timestamp": "2025-01-01 08:00", "price_chart": fake_png,
+            "city_prices": [{"name": f"도시{i}", "gasoline": "1,700원", "diesel": "1,600원", "urea": "1,000원"} for i in range(8)],
+        },
+        "news_list": [
+            {"title": f"샘플 뉴스 {i}", "link": f"https://example.com/news/{i}", "ai_summary": "요약 문장입니다. " * 10,
+             "image_data": fake_image, "image_cid": f"news_image_{i}", "image_final_width": 640, "image_final_height": 360}
+            for i in range(news_count)
+        ],
+        "weather_dashboard_tiles": [{"artifact": fake_png, "cid": f"weather_dashboard_{i}"} for i in range(2)],
+        "has_weather_dashboard": True,
+        "zodiac_horoscopes": [{"name": "쥐", "fortune": "좋은 하루", "lucky_color": "파랑", "compatible_sign": "용"}] * 12,
+    }
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    context = make_sample_context()
+
+    start = time.perf_counter()
+    template_engine.render_targets(context)
+    first_ms = (time.perf_counter() - start) * 1000
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages = template_engine.render_targets(context)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    median_ms = median(samples)
+    print(f"template_engine 임포트: {import_ms:.1f}ms")
+    print(f"첫 렌더링 (Jinja 임포트, 템플릿 로드/컴파일 포함): {first_ms:.1f}ms")
+    print(f"반복 렌더링 {repeat}회: 중앙값 {median_ms:.2f}ms, 최대 {max(samples):.2f}ms "
+          f"(웹 {len(pages['web']) / 1024:.0f}KB, 이메일 {len(pages['email']) / 1024:.0f}KB)")
+    if median_ms > RENDER_BUDGET_MS:
+        print(f"🚨 렌더링 시간 예산({RENDER_BUDGET_MS}ms) 초과")
+        sys.exit(1)
+    print(f"✅ 예산({RENDER_BUDGET_MS}ms) 이내")
+
+
+if __name__ == '__main__':
+    main()
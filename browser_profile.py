@@ -0,0 +1,96 @@
+# browser_profile.py
+
+import json
+import random
+from selenium.webdriver.chrome.options import Options
+from config import Config
+
+
+def build_chrome_options(config: Config):
+    """기사 스크래핑용 헤드리스 Chrome 옵션을 만듭니다.
+
+    본문 DOM만 필요하므로 이미지/알림/자동재생을 끄고, 페이지별 전송량 집계를 위해 performance 로그를 켭니다.
+    """
+    chrome_options = Options()
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument("--headless=new") 
+    chrome_options.add_argument(f'--user-agent={random.choice(config.USER_AGENTS)}')
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--log-level=3") 
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false") 
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-features=MediaRouter,OptimizationHints,Translate")
+    chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+        'profile.default_content_setting_values.geolocation': 2,
+    })
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+
+def blocked_url_patterns(config: Config):
+    """Network.setBlockedURLs에 넘길 와일드카드 패턴 목록 (확장자 + 광고/추적 도메인)"""
+    patterns = [f"*.{ext}" for ext in config.BROWSER_BLOCKED_EXTENSIONS]
+    patterns += [f"*.{ext}?*" for ext in config.BROWSER_BLOCKED_EXTENSIONS]
+    for domain in config.BROWSER_BLOCKED_DOMAINS + config.AD_DOMAINS_BLACKLIST:
+        if '/' in domain: # 'facebook.com/tr' 처럼 경로까지 지정한 항목은 그대로 사용
+            patterns.append(f"*{domain}*")
+        else: # 도메인만 있으면 호스트에 고정해 'donate.com'이나 쿼리 문자열의 도메인 이름이 걸리지 않게 합니다.
+            patterns += [f"*://{domain}/*", f"*://*.{domain}/*"]
+    return patterns
+
+
+def apply_request_blocking(driver, config: Config):
+    """CDP 네트워크 인터셉션으로 폰트/스타일시트/미디어와 광고·추적 도메인 요청을 차단합니다."""
+    driver.execute_cdp_cmd('Network.enable', {})
+    if config.BROWSER_BLOCK_RESOURCES:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(config)})
+
+
+def drain_performance_log(driver):
+    """이전 페이지의 네트워크 로그를 비워 다음 페이지 통계에 섞이지 않게 합니다."""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def collect_page_stats(driver):
+    """직전 페이지 로드의 네트워크 통계와 Navigation Timing을 집계합니다.
+
+    반환값: {'load_ms', 'bytes', 'requests', 'blocked'}
+    (bytes: 실제 전송된 바이트, blocked: 차단 규칙에 걸려 보내지 않은 요청 수)
+    """
+    stats = {'load_ms': None, 'bytes': 0, 'requests': 0, 'blocked': 0}
+    try:
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                stats['requests'] += 1
+            elif method == 'Network.loadingFinished':
+                stats['bytes'] += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                stats['blocked'] += 1
+    except Exception:
+        pass
+    try:
+        timing = driver.execute_script(
+            "const n = performance.getEntriesByType('navigation')[0];"
+            "return n ? [n.domContentLoadedEventEnd, n.loadEventEnd] : null;"
+        )
+        if timing:
+            # 'eager' 로드 전략에서는 load 이벤트 전에 반환될 수 있으므로 DOMContentLoaded 시점을 기본으로 사용
+            stats['load_ms'] = round(timing[1] or timing[0])
+    except Exception:
+        pass
+    return stats
+
@@ -0,0 +1,93 @@
+# checkpoint_service.py
+
+import os
+import json
+import shutil
+import hashlib
+from config import Config
+
+
+class CheckpointService:
+    """실행 ID별로 파이프라인 단계 결과를 저장/복원하여 중단된 실행을 이어서 진행할 수 있게 합니다."""
+
+    def __init__(self, config: Config, run_id: str):
+        self.config = config
+        self.run_id = run_id
+        self.run_dir = os.path.join(config.CHECKPOINT_DIR, run_id)
+        self.image_dir = os.path.join(self.run_dir, 'images')
+
+    @staticmethod
+    def latest_run_id(config: Config, prefix: str):
+        """주어진 접두사(예: 'daily-')로 시작하는 가장 최근 실행 ID를 반환합니다."""
+        if not os.path.isdir(config.CHECKPOINT_DIR):
+            return None
+        run_ids = sorted(d for d in os.listdir(config.CHECKPOINT_DIR) if d.startswith(prefix))
+        return run_ids[-1] if run_ids else None
+
+    def _stage_path(self, stage):
+        return os.path.join(self.run_dir, f"{stage}.json")
+
+    def has(self, stage):
+        return os.path.exists(self._stage_path(stage))
+
+    def reset(self):
+        """이전 체크포인트를 모두 지우고 새 실행을 시작합니다."""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+        os.makedirs(self.image_dir, exist_ok=True)
+
+    def clear(self):
+        """모든 단계가 끝난 실행의 체크포인트를 정리합니다."""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    def save(self, stage, data):
+        os.makedirs(self.image_dir, exist_ok=True)
+        path = self._stage_path(stage)
+        tmp_path = path + '.tmp'
+        # 중간에 죽더라도 반쯤 쓰인 파일이 남지 않도록 임시 파일에 쓴 뒤 교체합니다.
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._dump(data), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def load(self, stage):
+        with open(self._stage_path(stage), 'r', encoding='utf-8') as f:
+            return self._restore(json.load(f))
+
+    def stage(self, stage, compute):
+        """체크포인트가 있으면 불러오고, 없으면 compute()를 실행해 결과를 저장합니다."""
+        if self.has(stage):
+            data = self.load(stage)
+            print(f"⏩ [{self.run_id}] '{stage}' 단계는 체크포인트에서 복원했습니다.")
+            return data
+        data = compute()
+        self.save(stage, data)
+        print(f"💾 [{self.run_id}] '{stage}' 단계 체크포인트를 저장했습니다.")
+        return data
+
+    def _dump(self, data):
+        """기사 dict의 image_data(bytes)는 이미지 파일로 분리하고 파일명(image_ref)만 남깁니다."""
+        if isinstance(data, list):
+            return [self._dump(item) for item in data]
+        if isinstance(data, dict):
+            item = dict(data)
+            image_data = item.pop('image_data', None)
+            if isinstance(image_data, bytes):
+                image_ref = hashlib.sha1(image_data).hexdigest() + '.jpg'
+                image_path = os.path.join(self.image_dir, image_ref)
+                if not os.path.exists(image_path):
+                    with open(image_path, 'wb') as f:
+                        f.write(image_data)
+                item['image_ref'] = image_ref
+            elif image_data is not None:
+                item['image_data'] = image_data
+            return item
+        return data
+
+    def _restore(self, data):
+        if isinstance(data, list):
+            return [self._restore(item) for item in data]
+        if isinstance(data, dict) and 'image_ref' in data:
+            item = dict(data)
+            with open(os.path.join(self.image_dir, item.pop('image_ref')), 'rb') as f:
+                item['image_data'] = f.read()
+            return item
+        return data
@@ -0,0 +1,60 @@
+# circuit_breaker.py
+
+import time
+import threading
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class CircuitBreaker:
+    """도메인(host) 단위 서킷 브레이커.
+
+    연속 실패가 failure_threshold번 쌓이면 회로를 열어(open) 그 도메인의 남은 기사를 바로 건너뛰고,
+    cooldown_seconds가 지나면 한 건만 시험 삼아 보내(half-open) 성공하면 다시 닫습니다(closed).
+
+    여러 워커 프로세스가 상태를 공유하려면 multiprocessing.Manager의 dict/Lock을 넘겨주세요.
+    (Manager dict 프록시는 안쪽 값의 변경을 감지하지 못하므로 항상 항목 전체를 다시 대입합니다.)
+    """
+
+    def __init__(self, failure_threshold, cooldown_seconds, state=None, lock=None):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = state if state is not None else {}
+        self.lock = lock if lock is not None else threading.Lock()
+
+    def _entry(self, host):
+        return dict(self.state.get(host) or {'state': CLOSED, 'failures': 0, 'opened_at': 0.0})
+
+    def allow(self, host):
+        """host로 요청을 보내도 되는지 반환합니다. 열린 회로는 쿨다운 후 시험 요청 한 건만 허용합니다."""
+        with self.lock:
+            entry = self._entry(host)
+            if entry['state'] == CLOSED:
+                return True
+            if entry['state'] == OPEN and time.time() - entry['opened_at'] >= self.cooldown_seconds:
+                entry['state'] = HALF_OPEN
+                self.state[host] = entry
+                print(f"   ㄴ> 🔁 '{host}' 회로 반개방: 시험 요청을 1건 보냅니다.")
+                return True
+            return False
+
+    def record_success(self, host):
+        with self.lock:
+            entry = self._entry(host)
+            if entry['state'] != CLOSED:
+                print(f"   ㄴ> ✅ '{host}' 회로를 다시 닫습니다.")
+            self.state[host] = {'state': CLOSED, 'failures': 0, 'opened_at': 0.0}
+
+    def record_failure(self, host):
+        with self.lock:
+            entry = self._entry(host)
+            entry['failures'] += 1
+            if entry['state'] == HALF_OPEN or entry['failures'] >= self.failure_threshold:
+                if entry['state'] != OPEN:
+                    print(f"   ㄴ> 🚫 '{host}' 연속 {entry['failures']}회 실패로 회로를 엽니다. ({self.cooldown_seconds}초 동안 건너뜀)")
+                entry.update(state=OPEN, opened_at=time.time())
+            self.state[host] = entry
+
+    def open_hosts(self):
+        """현재 열려 있는(또는 시험 중인) 도메인 목록"""
+        return sorted(host for host, entry in self.state.items() if entry['state'] != CLOSED)
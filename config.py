@@ -23,6 +23,20 @@ class Config:
     WEEKLY_RECIPIENT_LIST = [email.strip() for email in os.getenv('WEEKLY_RECIPIENT_LIST', '').split(',')]
     SENDER_EMAIL = "zzzfbwnsgh@gmail.com" # 실제 발신자 이메일로 변경 필요
     SENDER_NAME = "YLP 뉴스레터"
+    # 메일 발송 (SMTP 연결 풀, 동시 발송, 수신자별 재시도)
+    SMTP_HOST = os.getenv('SMTP_HOST', 'smtp.gmail.com')
+    SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
+    SMTP_STARTTLS = os.getenv('SMTP_STARTTLS', 'true').lower() != 'false'
+    SMTP_TIMEOUT = 30
+    SMTP_POOL_SIZE = 3                # 동시에 열어 둘 SMTP 연결(=발송 스레드) 수
+    SMTP_MAX_SENDS_PER_SECOND = 5     # 초당 최대 발송 수 (0이면 제한 없음)
+    SMTP_MAX_RETRIES = 3              # 수신자별 일시적 오류 재시도 횟수
+    SMTP_RETRY_BACKOFF_SECONDS = 2    # 재시도 대기 시간(초), 시도마다 두 배로 늘어남
+    EMAIL_IMAGE_BUDGET_KB = 3072      # 메일 한 통의 인라인 이미지 총 용량 예산. 넘으면 기사 JPEG 품질을 낮춤
+    EMAIL_JPEG_MIN_QUALITY = 50
+    EMAIL_JPEG_MAX_QUALITY = 85
+    EMAIL_ASSET_CACHE_DIR = 'cache/email_assets' # assets/ 고정 이미지의 재압축 결과 (원본 해시별)
+    DELIVERY_LEDGER_DIR = 'delivery_ledger' # 발송 건별 수신자(해시) 발송 결과. 재실행 시 실패한 수신자에게만 다시 보냄
     
 
     # 파일 경로
@@ -30,12 +44,40 @@ class Config:
     TOKEN_FILE = 'token.json'
     CREDENTIALS_FILE = 'credentials.json'
     WEEKLY_CANDIDATES_FILE = 'weekly_candidates.json'
+    CHECKPOINT_DIR = 'checkpoints' # 실행 ID별 단계 체크포인트 저장 폴더 (--resume 용)
+    ARCHIVE_DIR = 'archive' # 웹 아카이브 페이지 저장 폴더
+    ARCHIVE_MANIFEST_FILE = 'archive/manifest.jsonl' # 호별 한 줄씩 덧붙이는 날짜/모드/제목/기사 수/크기 목록 (월별 목록 페이지의 원본)
+    SEARCH_INDEX_DIR = 'archive/search' # 기사 검색용 역색인 샤드 (archive/search.html, search_index.py)
+    SEARCH_INDEX_SHARDS = 16 # 토큰 샤드 수. 바꾸면 `python search_index.py rebuild`로 다시 만들어야 합니다.
+    ARCHIVE_ASSET_DIR = 'archive/assets' # 웹 아카이브 이미지를 내용 해시 이름으로 한 번만 저장하는 폴더
+    METRICS_DIR = 'metrics' # 실행별 단계 소요 시간 보고서(<run_id>.json)와 Prometheus textfile(newsletter.prom)
 
     # --- 스크래핑 설정 ---
     MIN_IMAGE_WIDTH = 300
     MIN_IMAGE_HEIGHT = 150
     DEFAULT_IMAGE_URL = 'https://via.placeholder.com/600x300.png?text=News'
     MAX_ARTICLES_TO_PROCESS = 300 # 수집할 최대 기사 수
+    # 도메인별 스크래핑 통계 (p50/p95 지연, 실패율, JS 필요 여부) 파일과 이를 바탕으로 한 적응형 타임아웃/동시성 설정
+    DOMAIN_STATS_FILE = 'domain_stats.json'
+    DOMAIN_STATS_WINDOW = 30          # 도메인/종류별로 유지할 최근 시도 수
+    PAGE_WAIT_TIMEOUT = 20            # 통계가 없는 도메인의 본문 대기 시간(초), 통계가 있으면 p95 기반으로 줄어듦
+    PAGE_WAIT_TIMEOUT_MIN = 5
+    STATIC_FETCH_TIMEOUT = 5          # 브라우저 없이 HTML만 받아보는 시도의 타임아웃(초)
+    JS_REQUIRED_RECHECK_DAYS = 7      # JS가 필요하다고 기록된 도메인도 이 기간이 지나면 정적 HTML을 다시 시도
+    IMAGE_PROBE_TIMEOUT = 5
+    IMAGE_DOWNLOAD_TIMEOUT = 10
+    DOMAIN_MAX_CONCURRENCY = 2        # 한 도메인에 동시에 접속하는 최대 워커 수
+    DOMAIN_SLOW_P95_SECONDS = 10      # p95가 이보다 느리거나
+    DOMAIN_FLAKY_FAILURE_RATE = 0.3   # 실패율이 이보다 높은 도메인은 동시 접속 1개로 제한
+    DOMAIN_SKIP_MIN_ATTEMPTS = 4      # 최근 시도가 이 횟수 이상이고
+    DOMAIN_SKIP_FAILURE_RATE = 0.9    # 실패율이 이보다 높으면 건너뜀
+    DOMAIN_SKIP_RETRY_DAYS = 3        # 건너뛰는 도메인도 마지막 시도 후 이 기간이 지나면 다시 시도
+    # 실행 중 도메인 서킷 브레이커 (연속 실패 시 해당 도메인의 남은 기사를 건너뛰고, 쿨다운 후 1건만 시험)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS = 120
+    # 로컬 chromedriver 탐색 결과 캐시 (경로를 직접 지정하려면 CHROMEDRIVER_PATH 환경 변수 사용)
+    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')
+    CHROMEDRIVER_CACHE_FILE = 'cache/chromedriver.json'
     
      # ✨ [분리] 뉴스 수집 기간 설정
     NEWS_FETCH_HOURS_DAILY = 24
@@ -102,6 +144,16 @@ class Config:
 
     TARGET_AREA_CODES = ['01', '02', '03', '04', '05', '06', '07', '08']
 
+    # 오피넷 API 호출 설정 (동시 요청 수, 요청 시작 간 최소 간격(초))
+    OPINET_MAX_CONCURRENCY = 4
+    OPINET_MIN_REQUEST_INTERVAL = 0.5
+    # 오피넷 데이터는 하루 몇 번만 갱신되므로 같은 날(KST) 안에서는 TTL 동안 응답을 재사용
+    OPINET_CACHE_DIR = 'cache/opinet'
+    OPINET_CACHE_TTL_SECONDS = 3 * 60 * 60
+    # 일별 유가 누적 이력 (주간 뉴스레터/차트에서 7일보다 긴 기간 조회용)
+    PRICE_HISTORY_FILE = 'price_history.csv'
+    PRICE_CHART_DAYS_WEEKLY = 28
+
     # AI 모델 설정
     GEMINI_MODEL = 'gemini-1.5-flash-latest' # 혹은 gemini-1.5-flash 등 필요에 따라 변경
 
@@ -115,9 +167,41 @@ class Config:
         'ads.mtgroup.kr'
     ]
 
+    # 기사 페이지용 브라우저 프로필: CDP(Network.setBlockedURLs)로 아래 요청을 차단해 본문 대기 시간을 줄임
+    # (False로 두면 차단 없이 로드하므로, 페이지별 전송량/로드 시간 로그로 절감 효과를 비교할 수 있음)
+    BROWSER_BLOCK_RESOURCES = True
+    BROWSER_BLOCKED_EXTENSIONS = [
+        'woff', 'woff2', 'ttf', 'otf', 'eot',              # 폰트
+        'css',                                           # 스타일시트
+        'mp4', 'webm', 'm3u8', 'ts', 'mp3', 'm4a', 'ogg',  # 동영상/오디오
+        'jpg', 'jpeg', 'png', 'gif', 'webp', 'svg', 'ico', # 이미지 (대표 이미지는 HTML의 URL로 따로 받음)
+    ]
+    # 광고/추적/동영상 플레이어 등 기사 본문과 무관한 서드파티 도메인 (AD_DOMAINS_BLACKLIST도 함께 차단)
+    BROWSER_BLOCKED_DOMAINS = [
+        'google-analytics.com', 'googletagmanager.com', 'googlesyndication.com', 'googletagservices.com',
+        'adservice.google.com', 'pagead2.googlesyndication.com', 'imasdk.googleapis.com',
+        'facebook.net', 'facebook.com/tr', 'connect.facebook.net', 'platform.twitter.com', 'ads-twitter.com',
+        'criteo.com', 'criteo.net', 'adnxs.com', 'taboola.com', 'outbrain.com', 'dable.io', 'mobon.net',
+        'realclick.co.kr', 'adfit.kakao.com', 't1.daumcdn.net/kas', 'wcs.naver.net', 'analytics.naver.com',
+        'youtube.com/embed', 'youtube-nocookie.com', 'ytimg.com', 'player.vimeo.com', 'tv.naver.com/embed',
+        'scorecardresearch.com', 'hotjar.com', 'newrelic.com', 'nr-data.net', 'clarity.ms',
+    ]
+
     # 날씨 API 설정
     WEATHER_API_KEY = os.getenv('WEATHER_API_KEY') 
 
+    # 기상청 API 동시 요청 수 및 한 번의 수집에서 모든 요청이 공유하는 재시도 횟수
+    WEATHER_MAX_CONCURRENCY = 8
+    WEATHER_RETRY_BUDGET = 6
+    # 발표 기준시각별 예보 응답 캐시 (기준시각이 같으면 재요청하지 않음)
+    WEATHER_CACHE_DIR = 'cache/kma'
+    WEATHER_CACHE_MAX_AGE_DAYS = 3
+
+    # 날씨 대시보드 설정 (예보 범위: 오늘로부터 며칠 뒤까지, 중기예보 기준 최대 10일)
+    WEATHER_FORECAST_DAYS = 7
+    DASHBOARD_HUBS_PER_TILE = 6   # 이미지 한 장에 그릴 권역 수 (초과 시 여러 장으로 분할)
+    DASHBOARD_IMAGE_FORMAT = 'PNG' # 'PNG' (팔레트 압축) 또는 'WEBP'
+
     # 주요 물류 거점 좌표 (단기예보용 nx, ny / 중기예보용 regId)
     LOGISTICS_HUBS = {
         "수도권": {"nx": 60, "ny": 127, "regId_temp": "11B10101", "regId_land": "11B00000"},
@@ -127,8 +211,14 @@ class Config:
     }
 
     # 분석 대상 국가 코드 (Python 'holidays' 라이브러리 기준)
-    #RISK_BRIEFING_TARGET_COUNTRIES = ['KR', 'CN', 'US', 'VN', 'DE'] # 한국, 중국, 미국, 베트남, 독일
-    RISK_BRIEFING_TARGET_COUNTRIES = ['KR'] 
+    RISK_BRIEFING_TARGET_COUNTRIES = ['KR', 'CN', 'US', 'VN', 'DE'] # 한국, 중국, 미국, 베트남, 독일
+    RISK_BRIEFING_COUNTRY_NAMES = {'KR': '한국', 'CN': '중국', 'US': '미국', 'VN': '베트남', 'DE': '독일'}
+    RISK_BRIEFING_DAYS = 21 # 오늘로부터 며칠 뒤까지의 공휴일을 분석할지
+    # 국가·연도별 공휴일 달력 (한 번 계산해 저장, 워크플로에서 커밋) / 공휴일 이름 언어 우선순위
+    HOLIDAY_CALENDAR_FILE = 'holiday_calendar.json'
+    HOLIDAY_LANGUAGES = ['ko', 'en_US']
+    # (국가, 이벤트 이름, 기간)별 AI 리스크 요약 캐시 (워크플로에서 커밋)
+    RISK_SUMMARY_CACHE_FILE = 'risk_summaries.json'
 
 
 
@@ -0,0 +1,174 @@
+# dashboard_renderer.py
+
+import os
+import platform
+import threading
+from io import BytesIO
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw, ImageFont
+
+ICON_PATHS = {'sunny': 'assets/sunny.png', 'cloudy': 'assets/cloudy.png', 'rain': 'assets/rain.png', 'snow': 'assets/snow.png'}
+ICON_SIZE = 40
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+TITLE_PREFIX = "권역별 주간 날씨 체크 "
+RISK_CELL_COLORS = {'안전': '#FFFFFF', '주의': '#FFFBEB', '위험': '#FEF2F2'}
+RISK_TEXT_COLORS = {'주의': '#D97706', '위험': '#DC2626'}
+
+
+def get_font_path():
+    local_font_path = "assets/NanumGothicBold.ttf"
+    if os.path.exists(local_font_path): return local_font_path
+    system_name = platform.system()
+    if system_name == 'Windows': return 'malgun.ttf'
+    elif system_name == 'Darwin': return '/System/Library/Fonts/AppleSDGothicNeo.ttc'
+    else:
+        if os.path.exists('/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf'):
+            return '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf'
+    raise FileNotFoundError("적절한 한글 폰트를 찾을 수 없습니다. 'assets' 폴더에 NanumGothicBold.ttf를 넣어주세요.")
+
+
+@lru_cache(maxsize=None)
+def load_font(size):
+    """크기별 폰트를 프로세스당 한 번만 불러옵니다."""
+    return ImageFont.truetype(get_font_path(), size)
+
+
+@lru_cache(maxsize=None)
+def load_icon(icon_code):
+    """날씨 아이콘을 프로세스당 한 번만 디스크에서 읽고 크기를 맞춰 둡니다."""
+    path = ICON_PATHS.get(icon_code, ICON_PATHS['sunny'])
+    if not os.path.exists(path):
+        print(f"⚠️ 아이콘 파일 '{path}'을 찾을 수 없습니다.")
+        return None
+    with Image.open(path) as icon:
+        return icon.convert("RGBA").resize((ICON_SIZE, ICON_SIZE))
+
+
+class DashboardRenderer:
+    """권역별 날씨 대시보드를 그립니다.
+
+    제목 머리말, 권역 이름, 비어 있는 격자('정보 없음' 셀)처럼 매번 같은 부분은
+    (권역 목록, 일수) 별로 한 번만 그려 두고, 실행마다 날짜와 셀 내용만 덧그립니다.
+    """
+
+    MIN_WIDTH, MIN_CELL_WIDTH, CELL_HEIGHT, TOP_MARGIN, LEFT_MARGIN = 1000, 110, 100, 130, 100
+
+    _background_cache = {}
+    _background_lock = threading.Lock()
+
+    def __init__(self, regions, day_count):
+        self.regions = tuple(regions)
+        self.day_count = day_count
+        # 7~8일은 기존과 같은 1000px, 10일처럼 일수가 늘면 셀이 좁아지지 않도록 폭을 늘립니다.
+        self.img_width = max(self.MIN_WIDTH, self.LEFT_MARGIN + day_count * self.MIN_CELL_WIDTH)
+        self.cell_width = (self.img_width - self.LEFT_MARGIN) / day_count
+        self.img_height = self.TOP_MARGIN + self.CELL_HEIGHT * len(self.regions)
+        self.title_font = load_font(32)
+        self.header_font = load_font(18)
+        self.temp_font = load_font(16)
+        self.risk_text_font = load_font(14)
+
+    def _cell_origin(self, row, col):
+        return self.LEFT_MARGIN + col * self.cell_width, self.TOP_MARGIN + row * self.CELL_HEIGHT
+
+    def _get_background(self):
+        key = (self.regions, self.day_count)
+        with self._background_lock:
+            if key not in self._background_cache:
+                self._background_cache[key] = self._draw_background()
+            return self._background_cache[key]
+
+    def _draw_background(self):
+        image = Image.new('RGB', (self.img_width, self.img_height), '#F9FAFB')
+        draw = ImageDraw.Draw(image)
+        draw.text((50, 30), TITLE_PREFIX, font=self.title_font, fill='#111827')
+
+        empty_text_width = draw.textlength("정보 없음", font=self.header_font)
+        for j, region in enumerate(self.regions):
+            _, y = self._cell_origin(j, 0)
+            text_width = draw.textlength(region, font=self.header_font)
+            draw.text((50 - text_width/2 if 50 - text_width/2 > 0 else 5, y + self.CELL_HEIGHT/2 - 10), region, font=self.header_font, fill='#1F2937')
+            for i in range(self.day_count):
+                x, _ = self._cell_origin(j, i)
+                draw.rectangle([x, y, x + self.cell_width, y + self.CELL_HEIGHT], fill='#F3F4F6', outline='#E5E7EB')
+                draw.text((x + self.cell_width/2 - empty_text_width/2, y + self.CELL_HEIGHT/2 - 10), "정보 없음", font=self.header_font, fill='#9CA3AF')
+        return image
+
+    def render(self, analyzed_data, days, update_time_str, page=None):
+        """캐시된 배경 위에 기간, 업데이트 시각, 날짜 헤더와 데이터가 있는 셀만 그려 반환합니다.
+
+        page: 여러 장으로 나눠 그릴 때의 (현재 번호, 전체 장수)
+        """
+        image = self._get_background().copy()
+        draw = ImageDraw.Draw(image)
+
+        start_date = datetime.strptime(days[0], "%Y%m%d").strftime("%m/%d")
+        end_date = datetime.strptime(days[-1], "%Y%m%d").strftime("%m/%d")
+        title_suffix = f"({start_date} ~ {end_date})"
+        if page and page[1] > 1:
+            title_suffix += f" {page[0]}/{page[1]}"
+        title_prefix_width = draw.textlength(TITLE_PREFIX, font=self.title_font)
+        draw.text((50 + title_prefix_width, 30), title_suffix, font=self.title_font, fill='#111827')
+
+        update_text_width = draw.textlength(update_time_str, font=self.temp_font)
+        draw.text((self.img_width - update_text_width - 50, 45), update_time_str, font=self.temp_font, fill='#6B7280')
+
+        for i, day in enumerate(days):
+            dt = datetime.strptime(day, "%Y%m%d")
+            x, _ = self._cell_origin(0, i)
+            header_text = f"{dt.strftime('%m/%d')}({WEEKDAYS[dt.weekday()]})"
+            text_width = draw.textlength(header_text, font=self.header_font)
+            draw.text((x + self.cell_width/2 - text_width/2, self.TOP_MARGIN - 50), header_text, font=self.header_font, fill='#374151')
+
+        for j, region in enumerate(self.regions):
+            for i, day in enumerate(days):
+                data = analyzed_data.get(day, {}).get(region)
+                if data and data.get('min_temp'):
+                    self._draw_cell(image, draw, *self._cell_origin(j, i), data)
+        return image
+
+    def _draw_cell(self, image, draw, x, y, data):
+        cell_width = self.cell_width
+        risk_level = data.get('risk_level', '안전')
+        draw.rectangle([x, y, x + cell_width, y + self.CELL_HEIGHT], fill=RISK_CELL_COLORS.get(risk_level, '#FFFFFF'), outline='#E5E7EB')
+        weather_icon = load_icon(data.get('icon_code', 'sunny'))
+        if weather_icon: image.paste(weather_icon, (int(x + cell_width/2 - ICON_SIZE/2), int(y + 15)), weather_icon)
+        min_t, max_t = data.get('min_temp', '-'), data.get('max_temp', '-')
+        temp_text = f"{max_t}° / {min_t}°"
+        text_width = draw.textlength(temp_text, font=self.temp_font)
+        draw.text((x + cell_width/2 - text_width/2, y + 60), temp_text, font=self.temp_font, fill='#4B5563')
+        risk_text = data.get('risk_text', '')
+        if risk_text and risk_text not in ["비", "눈"]:
+            text_width = draw.textlength(risk_text, font=self.risk_text_font)
+            draw.text((x + cell_width/2 - text_width/2, y + 80), risk_text, font=self.risk_text_font, fill=RISK_TEXT_COLORS.get(risk_level))
+
+
+def encode_image(image, image_format='PNG'):
+    """이메일 용량에 맞게 압축된 이미지 바이트를 반환합니다."""
+    buffer = BytesIO()
+    if image_format.upper() == 'WEBP':
+        image.save(buffer, format='WEBP', quality=80, method=4)
+    else:
+        # 대시보드는 사용하는 색이 적어 팔레트 PNG로 줄여도 눈에 띄는 차이가 없습니다.
+        image.quantize(colors=128, method=Image.Quantize.FASTOCTREE).save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def render_dashboard_tiles(analyzed_data, days, update_time_str, regions, hubs_per_tile, image_format='PNG'):
+    """권역을 hubs_per_tile개씩 나눠 여러 장의 대시보드를 병렬로 그리고 압축된 바이트 목록으로 반환합니다.
+
+    한 장에 들어가는 권역 수가 고정되므로 권역이 늘어나도 장당 렌더링 시간은 일정하게 유지됩니다.
+    """
+    regions = list(regions)
+    hubs_per_tile = max(1, hubs_per_tile)
+    region_chunks = [regions[i:i + hubs_per_tile] for i in range(0, len(regions), hubs_per_tile)]
+
+    def render_tile(page_index):
+        renderer = DashboardRenderer(region_chunks[page_index], len(days))
+        image = renderer.render(analyzed_data, days, update_time_str, page=(page_index + 1, len(region_chunks)))
+        return encode_image(image, image_format)
+
+    with ThreadPoolExecutor(max_workers=min(len(region_chunks), os.cpu_count() or 1) or 1, thread_name_prefix='tile') as executor:
+        return list(executor.map(render_tile, range(len(region_chunks))))
@@ -0,0 +1,191 @@
+# delivery_service.py
+
+import os
+import json
+import time
+import queue
+import random
+import smtplib
+import hashlib
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+
+# 다시 보내도 결과가 같은 영구 오류(잘못된 주소 등)는 재시도하지 않습니다.
+PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPAuthenticationError)
+
+
+class SmtpConnectionPool:
+    """로그인까지 마친 SMTP 연결을 최대 size개까지 만들어 두고 스레드 간에 돌려 씁니다.
+
+    오류가 난 연결은 상태를 알 수 없으므로 풀에 돌려놓지 않고 닫으며, 다음 요청 때 새로 연결합니다.
+    """
+
+    def __init__(self, config: Config, username=None, password=None, size=1):
+        self.config = config
+        self.username, self.password = username, password
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+
+    def _connect(self):
+        server = smtplib.SMTP(self.config.SMTP_HOST, self.config.SMTP_PORT, timeout=self.config.SMTP_TIMEOUT)
+        if self.config.SMTP_STARTTLS:
+            server.starttls()
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        return server
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                server = self._connect()
+            try:
+                yield server
+            except Exception:
+                self._discard(server)
+                raise
+            self._idle.put(server)
+
+    @staticmethod
+    def _discard(server):
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    def close(self):
+        while True:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                server.quit()
+            except Exception:
+                self._discard(server)
+
+
+class DeliveryLedger:
+    """발송 건(예: 'daily-2025-01-01')별로 수신자별 발송 결과를 기록합니다.
+
+    다시 실행하면 이미 성공한 수신자는 건너뛰고 실패한 수신자에게만 보냅니다.
+    저장소에 커밋되는 파일이므로 이메일 주소 대신 주소의 해시만 남깁니다.
+    """
+
+    def __init__(self, config: Config, key):
+        self.path = os.path.join(config.DELIVERY_LEDGER_DIR, f"{key}.json")
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    @staticmethod
+    def recipient_key(recipient):
+        return hashlib.sha256(recipient.strip().lower().encode('utf-8')).hexdigest()[:16]
+
+    def is_sent(self, recipient):
+        return self.entries.get(self.recipient_key(recipient), {}).get('status') == 'sent'
+
+    def record(self, recipient, status, attempts, error=None):
+        with self._lock:
+            previous = self.entries.get(self.recipient_key(recipient), {})
+            self.entries[self.recipient_key(recipient)] = {
+                'status': status,
+                'attempts': previous.get('attempts', 0) + attempts,
+                'error': error,
+                'at': datetime.now(ZoneInfo('Asia/Seoul')).isoformat(timespec='seconds'),
+            }
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+class DeliveryService:
+    """미리 직렬화한 메시지를 여러 수신자에게 SMTP 연결 풀로 동시에 보냅니다.
+
+    - 초당 발송 수를 SMTP_MAX_SENDS_PER_SECOND로 제한합니다.
+    - 일시적인 오류는 수신자별로 지수 백오프 후 재시도하고, 한 수신자의 실패가 다른 수신자 발송을 막지 않습니다.
+    - ledger_key가 주어지면 결과를 DeliveryLedger에 남겨, 재실행 시 실패한 수신자에게만 다시 보냅니다.
+    """
+
+    def __init__(self, config: Config, username=None, password=None):
+        self.config = config
+        self.pool = SmtpConnectionPool(config, username, password, size=config.SMTP_POOL_SIZE)
+        self._rate_lock = threading.Lock()
+        self._next_send_at = 0.0
+
+    def _wait_for_rate_limit(self):
+        """발송 시작 간격이 1 / SMTP_MAX_SENDS_PER_SECOND 초 이상 벌어지도록 대기합니다."""
+        if not self.config.SMTP_MAX_SENDS_PER_SECOND:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_send_at)
+            self._next_send_at = start_at + 1.0 / self.config.SMTP_MAX_SENDS_PER_SECOND
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _send_one(self, sender, recipient, message_bytes):
+        """한 수신자에게 보냅니다. 반환값: (성공 여부, 시도 횟수, 오류 메시지)"""
+        max_attempts = max(1, self.config.SMTP_MAX_RETRIES + 1)
+        for attempt in range(1, max_attempts + 1):
+            self._wait_for_rate_limit()
+            try:
+                with self.pool.connection() as server:
+                    refused = server.sendmail(sender, [recipient], message_bytes(recipient))
+                if refused:
+                    return False, attempt, str(refused.get(recipient, refused))
+                return True, attempt, None
+            except PERMANENT_ERRORS as e:
+                return False, attempt, str(e)
+            except (smtplib.SMTPException, OSError) as e:
+                # 5xx 응답은 영구 오류, 4xx 응답과 연결 오류는 일시적인 오류로 봅니다.
+                if attempt == max_attempts or getattr(e, 'smtp_code', 0) >= 500:
+                    return False, attempt, str(e)
+                delay = self.config.SMTP_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+                print(f" -> ⚠️ {recipient} 발송 실패({e}), {delay:.1f}초 후 재시도합니다. ({attempt}/{max_attempts - 1})")
+                time.sleep(delay)
+
+    def deliver(self, sender, recipients, message_bytes, ledger_key=None):
+        """recipients에게 동시에 발송하고 {'sent', 'skipped', 'failed': [(수신자, 오류)]}를 반환합니다.
+
+        message_bytes: 수신자를 받아 보낼 메시지 바이트를 반환하는 함수
+        """
+        ledger = DeliveryLedger(self.config, ledger_key) if ledger_key else None
+        recipients = [r for r in dict.fromkeys(recipients) if r]
+        pending = [r for r in recipients if not (ledger and ledger.is_sent(r))]
+        result = {'sent': 0, 'skipped': len(recipients) - len(pending), 'failed': []}
+        if result['skipped']:
+            print(f"-> 발송 기록에 따라 이미 받은 수신자 {result['skipped']}명은 건너뜁니다.")
+
+        def send(recipient):
+            ok, attempts, error = self._send_one(sender, recipient, message_bytes)
+            if ledger:
+                ledger.record(recipient, 'sent' if ok else 'failed', attempts, error)
+            if ok:
+                print(f" -> ✅ 이메일 발송 성공: {recipient}")
+            else:
+                print(f" -> ❌ 이메일 발송 실패: {recipient} ({error})")
+            return recipient, ok, error
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.pool.size, thread_name_prefix='smtp') as executor:
+                for recipient, ok, error in executor.map(send, pending):
+                    if ok:
+                        result['sent'] += 1
+                    else:
+                        result['failed'].append((recipient, error))
+        finally:
+            self.pool.close()
+        return result
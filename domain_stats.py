@@ -0,0 +1,154 @@
+# domain_stats.py
+
+import os
+import json
+from datetime import datetime
+from urllib.parse import urlparse
+from config import Config
+from utils import get_kst_today_str
+
+SAMPLE_KINDS = ('page', 'image') # page: 기사 본문 확보, image: 대표 이미지 검증/다운로드
+
+
+def host_of(url):
+    """URL의 호스트를 'www.'를 뗀 소문자로 반환합니다."""
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def percentile(values, q):
+    """q(0~100) 백분위수 (nearest-rank). 값이 없으면 None."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100)) # ceil(n * q / 100)
+    return ordered[int(rank) - 1]
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+def default_host_policy(config: Config):
+    """통계가 없는 도메인에 적용하는 기본 정책"""
+    return {
+        'page_timeout': config.PAGE_WAIT_TIMEOUT,
+        'image_timeout': config.IMAGE_PROBE_TIMEOUT,
+        'download_timeout': config.IMAGE_DOWNLOAD_TIMEOUT,
+        'max_concurrency': config.DOMAIN_MAX_CONCURRENCY,
+        'js_required': None, # None: 아직 모름 (정적 HTML을 먼저 시도)
+        'skip': False,
+    }
+
+
+class DomainStatsStore:
+    """도메인별 스크래핑 시도 기록을 실행 간에 유지하고, 이를 바탕으로 타임아웃/동시성/건너뛰기 정책을 계산합니다.
+
+    파일 형식: {host: {'js_required': bool|None, 'js_checked': 'YYYY-MM-DD', 'page': {...}, 'image': {...}}}
+    js_checked는 정적 HTML로 JS 필요 여부를 마지막으로 확인한 날짜이며, JS_REQUIRED_RECHECK_DAYS가 지나면 다시 확인합니다.
+    각 종류에는 최근 DOMAIN_STATS_WINDOW번의 결과(outcomes: 1=성공, 0=실패)와 성공 시 지연(latencies, 초),
+    그리고 보기 쉽도록 계산해 둔 p50/p95/failure_rate, 마지막 시도 날짜가 들어 있습니다.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.filepath = config.DOMAIN_STATS_FILE
+        self.stats = self._load()
+
+    def _load(self):
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """도메인당 한 줄로 저장해 매일 커밋되는 diff가 바뀐 도메인만 보이도록 합니다."""
+        lines = [f"  {json.dumps(host)}: {json.dumps(self.stats[host], ensure_ascii=False, sort_keys=True)}" for host in sorted(self.stats)]
+        tmp_path = self.filepath + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("{\n" + ",\n".join(lines) + "\n}\n")
+            os.replace(tmp_path, self.filepath)
+        except OSError as e:
+            print(f"❌ 도메인 통계 저장 실패: {e}")
+
+    def record(self, samples):
+        """워커가 반환한 시도 기록({'host', 'kind', 'ok', 'latency', 'js_required'?})을 반영합니다."""
+        today_str = get_kst_today_str()
+        window = self.config.DOMAIN_STATS_WINDOW
+        for sample in samples:
+            host, kind = sample.get('host'), sample.get('kind')
+            if not host or kind not in SAMPLE_KINDS:
+                continue
+            entry = self.stats.setdefault(host, {'js_required': None})
+            kind_stats = entry.setdefault(kind, {'latencies': [], 'outcomes': []})
+            kind_stats['outcomes'] = (kind_stats['outcomes'] + [1 if sample['ok'] else 0])[-window:]
+            if sample['ok'] and sample.get('latency') is not None:
+                kind_stats['latencies'] = (kind_stats['latencies'] + [round(sample['latency'], 2)])[-window:]
+            kind_stats['last_attempt'] = today_str
+            if sample.get('js_required') is not None:
+                entry['js_required'] = sample['js_required']
+                entry['js_checked'] = today_str
+
+            latencies, outcomes = kind_stats['latencies'], kind_stats['outcomes']
+            kind_stats['p50'] = percentile(latencies, 50)
+            kind_stats['p95'] = percentile(latencies, 95)
+            kind_stats['failure_rate'] = round(1 - sum(outcomes) / len(outcomes), 2)
+
+    @staticmethod
+    def _days_since(date_str):
+        today = datetime.strptime(get_kst_today_str(), '%Y-%m-%d').date()
+        return (today - datetime.strptime(date_str, '%Y-%m-%d').date()).days
+
+    def policy(self, host):
+        """도메인 통계로부터 타임아웃, 동시 접속 수, 건너뛰기 여부를 계산합니다."""
+        config = self.config
+        policy = default_host_policy(config)
+        entry = self.stats.get(host)
+        if not entry:
+            return policy
+        policy['js_required'] = entry.get('js_required')
+        if policy['js_required'] is True:
+            # JS가 필요하다고 기록된 도메인도 일정 기간이 지나면 정적 HTML을 다시 시도합니다.
+            checked = entry.get('js_checked')
+            if not checked or self._days_since(checked) >= config.JS_REQUIRED_RECHECK_DAYS:
+                policy['js_required'] = None
+
+        page = entry.get('page')
+        if page:
+            attempts, p95 = len(page['outcomes']), page.get('p95')
+            if len(page['latencies']) >= 3:
+                policy['page_timeout'] = round(_clamp(p95 * 1.5 + 1, config.PAGE_WAIT_TIMEOUT_MIN, config.PAGE_WAIT_TIMEOUT), 1)
+            if attempts >= 3 and (page['failure_rate'] >= config.DOMAIN_FLAKY_FAILURE_RATE or (p95 or 0) > config.DOMAIN_SLOW_P95_SECONDS):
+                policy['max_concurrency'] = 1
+            if attempts >= config.DOMAIN_SKIP_MIN_ATTEMPTS and page['failure_rate'] >= config.DOMAIN_SKIP_FAILURE_RATE:
+                policy['skip'] = self._days_since(page['last_attempt']) < config.DOMAIN_SKIP_RETRY_DAYS
+
+        image = entry.get('image')
+        if image and len(image['latencies']) >= 3:
+            policy['image_timeout'] = round(_clamp(image['p95'] * 2 + 0.5, 1, config.IMAGE_PROBE_TIMEOUT), 1)
+            policy['download_timeout'] = round(_clamp(image['p95'] * 3 + 1, 2, config.IMAGE_DOWNLOAD_TIMEOUT), 1)
+        return policy
+
+    def policies(self):
+        """통계가 있는 모든 도메인의 정책 {host: policy} (워커 프로세스에 그대로 전달)"""
+        return {host: self.policy(host) for host in self.stats}
+
+
+def partition_by_host(articles, batch_count, host_policies, default_policy):
+    """같은 도메인의 기사가 최대 max_concurrency개의 배치에만 들어가도록 기사를 배치로 나눕니다.
+
+    배치 하나는 워커 하나가 순서대로 처리하므로, 도메인이 들어간 배치 수가 곧 그 도메인의 최대 동시 접속 수입니다.
+    """
+    by_host = {}
+    for article in articles:
+        by_host.setdefault(host_of(article['link']), []).append(article)
+
+    batches = [[] for _ in range(max(1, batch_count))]
+    for host, host_articles in sorted(by_host.items(), key=lambda item: len(item[1]), reverse=True):
+        cap = max(1, min(host_policies.get(host, default_policy)['max_concurrency'], len(batches)))
+        targets = sorted(range(len(batches)), key=lambda idx: len(batches[idx]))[:cap]
+        for i, article in enumerate(host_articles):
+            batches[targets[i % cap]].append(article)
+    return [batch for batch in batches if batch]
@@ -0,0 +1,132 @@
+# driver_locator.py
+
+import os
+import re
+import glob
+import json
+import shutil
+import platform
+import subprocess
+from config import Config
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+CHROME_BINARY_CANDIDATES = {
+    'Linux': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome'],
+    'Darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '/Applications/Chromium.app/Contents/MacOS/Chromium'],
+    'Windows': [r'C:\Program Files\Google\Chrome\Application\chrome.exe', r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'],
+}
+CHROMEDRIVER_DIR_CANDIDATES = [
+    os.getenv('CHROMEWEBDRIVER', ''), # GitHub Actions 러너에 미리 설치된 드라이버 폴더
+    '/usr/bin', '/usr/local/bin', '/usr/lib/chromium', '/usr/lib/chromium-browser', '/opt/homebrew/bin',
+]
+# webdriver_manager가 예전에 내려받아 둔 드라이버도 재사용합니다.
+WDM_DRIVER_GLOB = os.path.join(os.path.expanduser('~'), '.wdm', 'drivers', 'chromedriver', '**', 'chromedriver*')
+
+
+def _read_version(executable):
+    """'--version' 출력에서 버전 문자열(예: 126.0.6478.126)을 읽습니다. 실행할 수 없으면 None."""
+    try:
+        output = subprocess.run([executable, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+class ChromeDriverLocator:
+    """로컬에 설치된 Chrome 버전에 맞는 chromedriver를 찾아 경로와 버전을 캐시합니다.
+
+    캐시된 드라이버의 메이저 버전이 현재 Chrome과 같으면 네트워크 없이 바로 반환하고,
+    로컬에서 맞는 드라이버를 찾지 못했을 때만 webdriver_manager로 내려받습니다.
+    브라우저가 필요한 단계가 실제로 시작될 때 resolve()를 호출하세요.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.cache_file = config.CHROMEDRIVER_CACHE_FILE
+        self._driver_path = None
+
+    def resolve(self):
+        """chromedriver 경로를 반환합니다. 한 번 찾은 경로는 인스턴스와 캐시 파일에 보관합니다."""
+        if self._driver_path:
+            return self._driver_path
+
+        print("-> Chrome 드라이버를 준비합니다...")
+        chrome_version = self.detect_chrome_version()
+        cached = self._load_cache()
+        if cached and os.path.exists(cached['path']) and (not chrome_version or _major(cached.get('driver_version')) == _major(chrome_version)):
+            print(f"✅ 캐시된 드라이버 사용: {cached['path']} (v{cached.get('driver_version')})")
+            self._driver_path = cached['path']
+            return self._driver_path
+
+        driver_path, driver_version = self._find_local_driver(chrome_version)
+        if driver_path:
+            print(f"✅ 로컬 드라이버 발견: {driver_path} (v{driver_version}, Chrome v{chrome_version or '알 수 없음'})")
+        else:
+            print(f"ℹ️ Chrome v{chrome_version or '알 수 없음'}에 맞는 로컬 드라이버가 없어 내려받습니다...")
+            driver_path, driver_version = self._install_driver()
+
+        self._save_cache(driver_path, driver_version, chrome_version)
+        self._driver_path = driver_path
+        return self._driver_path
+
+    def detect_chrome_version(self):
+        """설치된 Chrome(또는 Chromium) 버전을 반환합니다. 찾지 못하면 None."""
+        for candidate in CHROME_BINARY_CANDIDATES.get(platform.system(), []):
+            executable = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+            if executable and os.path.exists(executable):
+                version = _read_version(executable)
+                if version:
+                    return version
+        return None
+
+    def _driver_candidates(self):
+        executable_name = 'chromedriver.exe' if platform.system() == 'Windows' else 'chromedriver'
+        candidates = [self.config.CHROMEDRIVER_PATH, shutil.which(executable_name)]
+        candidates += [os.path.join(directory, executable_name) for directory in CHROMEDRIVER_DIR_CANDIDATES if directory]
+        candidates += sorted(glob.glob(WDM_DRIVER_GLOB, recursive=True), reverse=True)
+
+        seen = set()
+        for path in candidates:
+            if path and path not in seen and os.path.isfile(path) and os.access(path, os.X_OK):
+                seen.add(path)
+                yield path
+
+    def _find_local_driver(self, chrome_version):
+        """Chrome과 메이저 버전이 같은 로컬 chromedriver를 찾습니다. (Chrome 버전을 모르면 처음 찾은 드라이버)"""
+        for path in self._driver_candidates():
+            driver_version = _read_version(path)
+            if driver_version and (not chrome_version or _major(driver_version) == _major(chrome_version)):
+                return path, driver_version
+        return None, None
+
+    def _install_driver(self):
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            raise RuntimeError(f"Chrome 드라이버를 준비할 수 없습니다: {e}") from e
+        print(f"✅ 드라이버 준비 완료: {driver_path}")
+        return driver_path, _read_version(driver_path)
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _save_cache(self, driver_path, driver_version, chrome_version):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or '.', exist_ok=True)
+            tmp_path = self.cache_file + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'path': driver_path, 'driver_version': driver_version, 'chrome_version': chrome_version}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            print(f"⚠️ 드라이버 경로 캐시 저장 실패: {e}")
@@ -0,0 +1,89 @@
+# holiday_calendar.py
+
+import os
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date
+from importlib.metadata import version, PackageNotFoundError
+from config import Config
+
+
+class HolidayCalendar:
+    """국가·연도별 공휴일 목록을 한 번만 계산해 파일에 저장하고, 기간 조회는 이분 탐색으로 처리합니다.
+
+    holidays 라이브러리는 연도마다 규칙(음력 명절, 대체공휴일 등)을 계산하므로 매 실행 계산하는 대신
+    {"KR-2025": [["2025-01-01", "신정"], ...]} 형태로 저장해 두고 재사용합니다.
+    공휴일 이름은 HOLIDAY_LANGUAGES 중 국가가 지원하는 첫 언어로 받습니다(한국은 한국어, 그 외는 영어).
+    라이브러리 버전이나 언어 설정이 바뀌면 저장된 목록을 버리고 다시 계산합니다.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.filepath = config.HOLIDAY_CALENDAR_FILE
+        self.languages = list(config.HOLIDAY_LANGUAGES)
+        self.calendars = self._load()
+        self.changed = False
+        self._index = {} # 국가 코드 -> (정렬된 날짜 목록, 이름 목록, 포함된 연도 집합)
+
+    def _library_version(self):
+        # 패키지를 임포트하면 모든 국가 모듈을 불러오므로, 설치 정보에서 버전만 읽습니다.
+        try:
+            return version('holidays')
+        except PackageNotFoundError:
+            return ''
+
+    def _load(self):
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if data.get('holidays_version') != self._library_version() or data.get('languages') != self.languages:
+            print("-> holidays 라이브러리 버전/언어가 바뀌어 공휴일 달력을 다시 계산합니다.")
+            return {}
+        return data.get('calendars', {})
+
+    def save(self):
+        """달력(국가-연도)당 한 줄로 저장합니다. 새로 계산한 연도가 없으면 쓰지 않습니다."""
+        if not self.changed:
+            return
+        lines = [f"    {json.dumps(key)}: {json.dumps(self.calendars[key], ensure_ascii=False)}" for key in sorted(self.calendars)]
+        header = f'  "holidays_version": {json.dumps(self._library_version())},\n  "languages": {json.dumps(self.languages)},\n'
+        tmp_path = f"{self.filepath}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("{\n" + header + '  "calendars": {\n' + ",\n".join(lines) + "\n  }\n}\n")
+            os.replace(tmp_path, self.filepath)
+            self.changed = False
+        except OSError as e:
+            print(f"❌ 공휴일 달력 저장 실패: {e}")
+
+    def _build_year(self, country_code, year):
+        import holidays
+        supported = holidays.country_holidays(country_code).supported_languages
+        language = next((lang for lang in self.languages if lang in supported), None) # 없으면 현지어
+        country_holidays = holidays.country_holidays(country_code, years=year, language=language)
+        return [[day.isoformat(), name] for day, name in sorted(country_holidays.items())]
+
+    def _ensure_years(self, country_code, years):
+        dates, names, loaded_years = self._index.get(country_code, ([], [], set()))
+        missing = [year for year in years if year not in loaded_years]
+        if not missing:
+            return
+        for year in missing:
+            key = f"{country_code}-{year}"
+            if key not in self.calendars:
+                self.calendars[key] = self._build_year(country_code, year)
+                self.changed = True
+                print(f"-> {country_code} {year}년 공휴일 달력을 계산했습니다. ({len(self.calendars[key])}일)")
+            loaded_years.add(year)
+
+        entries = sorted(entry for year in loaded_years for entry in self.calendars[f"{country_code}-{year}"])
+        self._index[country_code] = ([date.fromisoformat(day) for day, _ in entries], [name for _, name in entries], loaded_years)
+
+    def between(self, country_code, start_date, end_date):
+        """start_date ~ end_date(포함) 사이의 (날짜, 공휴일 이름) 목록을 날짜순으로 반환합니다."""
+        self._ensure_years(country_code, range(start_date.year, end_date.year + 1))
+        dates, names, _ = self._index[country_code]
+        lo, hi = bisect_left(dates, start_date), bisect_right(dates, end_date)
+        return list(zip(dates[lo:hi], names[lo:hi]))
@@ -0,0 +1,138 @@
+# image_budget.py
+
+import os
+import hashlib
+from io import BytesIO
+from config import Config
+
+STATIC_ASSET_DIR = 'assets'
+
+
+def _encode_png(image):
+    """팔레트(최대 256색)로 줄인 PNG 바이트를 반환합니다. 알파 채널이 있으면 투명도를 유지하는 방식으로 줄입니다."""
+    from PIL import Image
+    if image.mode in ('RGBA', 'LA', 'P'):
+        quantized = image.convert('RGBA').quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+    else:
+        quantized = image.convert('RGB').quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+    buffer = BytesIO()
+    quantized.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def _encode_jpeg(image, quality):
+    buffer = BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+class ImageBudget:
+    """이메일에 첨부할 인라인 이미지를 발송 전에 한 번 정리합니다.
+
+    1. 내용이 같은 이미지는 첨부를 하나만 남기고, 본문의 중복 cid를 남긴 cid로 바꿉니다.
+    2. PNG(차트, 대시보드, 배너 등)는 팔레트 PNG로 다시 압축해 더 작아질 때만 바꿉니다.
+       assets/ 의 고정 이미지는 원본 해시로 cache/ 에 저장해 두고 배포(원본 변경) 전까지 재사용합니다.
+    3. 전체 크기가 EMAIL_IMAGE_BUDGET_KB를 넘으면 기사 JPEG의 품질을 이진 탐색으로 낮춰 예산에 맞춥니다.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.cache_dir = config.EMAIL_ASSET_CACHE_DIR
+
+    @staticmethod
+    def _read(image_info):
+        if image_info.get('data'):
+            return image_info['data']
+        if image_info.get('path') and os.path.exists(image_info['path']):
+            with open(image_info['path'], 'rb') as f:
+                return f.read()
+        return None
+
+    def _compress_png(self, data, cacheable):
+        """PNG를 다시 압축합니다. cacheable이면 결과를 원본 해시 이름으로 캐시합니다."""
+        cache_path = None
+        if cacheable:
+            cache_path = os.path.join(self.cache_dir, f"{hashlib.sha256(data).hexdigest()[:20]}.png")
+            if os.path.exists(cache_path):
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+        from PIL import Image # 메일 발송 직전에만 필요하므로 news_collector 시작 시간에 포함하지 않습니다.
+        with Image.open(BytesIO(data)) as image:
+            encoded = _encode_png(image)
+        result = encoded if len(encoded) < len(data) else data
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(result)
+            os.replace(tmp_path, cache_path)
+        return result
+
+    def _fit_jpegs(self, jpegs, budget):
+        """jpegs({cid: 바이트})의 합계가 budget 이하가 되는 가장 높은 공통 품질로 다시 인코딩합니다."""
+        if sum(len(data) for data in jpegs.values()) <= budget:
+            return jpegs, None
+        from PIL import Image
+        decoded = {}
+        for cid, data in jpegs.items():
+            with Image.open(BytesIO(data)) as image:
+                decoded[cid] = image.convert('RGB')
+
+        low, high = self.config.EMAIL_JPEG_MIN_QUALITY, self.config.EMAIL_JPEG_MAX_QUALITY
+        best = None
+        while low <= high:
+            quality = (low + high) // 2
+            encoded = {cid: _encode_jpeg(image, quality) for cid, image in decoded.items()}
+            if sum(len(data) for data in encoded.values()) <= budget:
+                best, low = (encoded, quality), quality + 1
+            else:
+                high = quality - 1
+        if best is None: # 최저 품질로도 예산을 넘으면 최저 품질로 보냅니다.
+            quality = self.config.EMAIL_JPEG_MIN_QUALITY
+            best = ({cid: _encode_jpeg(image, quality) for cid, image in decoded.items()}, quality)
+        # 원본이 더 작은 이미지는 원본을 유지합니다.
+        return {cid: min(best[0][cid], jpegs[cid], key=len) for cid in jpegs}, best[1]
+
+    def apply(self, images_to_embed, body_html):
+        """(정리된 images_to_embed, cid를 바꾼 body_html)을 반환합니다. 반환되는 이미지는 모두 {'data', 'cid'} 형태입니다."""
+        before_bytes = 0
+        unique, cid_by_digest, body_replacements = [], {}, {}
+        for image_info in images_to_embed:
+            data = self._read(image_info)
+            if not data:
+                continue
+            before_bytes += len(data)
+            digest = hashlib.sha256(data).digest()
+            if digest in cid_by_digest:
+                body_replacements[image_info['cid']] = cid_by_digest[digest]
+                continue
+            cid_by_digest[digest] = image_info['cid']
+            is_static = bool(image_info.get('path')) and os.path.dirname(os.path.normpath(image_info['path'])) == STATIC_ASSET_DIR
+            unique.append({'cid': image_info['cid'], 'data': data, 'static': is_static})
+
+        for image in unique:
+            if image['data'][:8] == b'\x89PNG\r\n\x1a\n':
+                try:
+                    image['data'] = self._compress_png(image['data'], cacheable=image['static'])
+                except Exception as e:
+                    print(f"⚠️ PNG 재압축 실패({image['cid']}): {e}")
+
+        jpegs = {image['cid']: image['data'] for image in unique if image['data'][:3] == b'\xff\xd8\xff'}
+        other_bytes = sum(len(image['data']) for image in unique if image['cid'] not in jpegs)
+        budget = self.config.EMAIL_IMAGE_BUDGET_KB * 1024
+        quality = None
+        if jpegs:
+            try:
+                fitted, quality = self._fit_jpegs(jpegs, max(0, budget - other_bytes))
+                for image in unique:
+                    image['data'] = fitted.get(image['cid'], image['data'])
+            except Exception as e:
+                print(f"⚠️ JPEG 용량 조정 실패: {e}")
+
+        for duplicate_cid, kept_cid in body_replacements.items():
+            body_html = body_html.replace(f'cid:{duplicate_cid}"', f'cid:{kept_cid}"')
+
+        after_bytes = sum(len(image['data']) for image in unique)
+        print(f"-> 메일 이미지 정리: {len(images_to_embed)}개 {before_bytes / 1024:.0f}KB → {len(unique)}개 {after_bytes / 1024:.0f}KB"
+              + (f" (기사 이미지 JPEG 품질 {quality})" if quality else ""))
+        return [{'data': image['data'], 'cid': image['cid']} for image in unique], body_html
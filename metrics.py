@@ -0,0 +1,149 @@
+# metrics.py
+
+import os
+import json
+import time
+from contextlib import contextmanager
+from domain_stats import percentile
+
+# 기록하는 단계 이름
+#   driver_create, page_get, page_wait, page_load(Navigation Timing), static_fetch, extract, summarize,
+#   image_search, image_probe, image_download, url_resolve, render, send, aux_<보조 작업명>
+
+
+class Metrics:
+    """단계별 소요 시간(span)과 카운터를 모으는 계측 도구입니다.
+
+    워커 프로세스는 작업마다 Metrics를 새로 만들어 export() 결과를 반환하고,
+    부모 프로세스가 merge()로 합친 뒤 실행 단위 보고서(JSON, Prometheus textfile)를 씁니다.
+    """
+
+    def __init__(self):
+        self.spans = []     # [stage, domain, seconds, ok]
+        self.counters = {}  # {(name, domain): value}
+
+    @contextmanager
+    def span(self, stage, domain=None):
+        """with 블록의 소요 시간을 stage(와 domain)로 기록합니다. 예외가 나면 실패로 기록하고 다시 던집니다."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.spans.append([stage, domain, time.perf_counter() - start, ok])
+
+    def observe(self, stage, seconds, domain=None, ok=True):
+        """이미 측정된 시간을 기록합니다. (브라우저 Navigation Timing, 작업 그래프 소요 시간 등)"""
+        self.spans.append([stage, domain, seconds, ok])
+
+    def incr(self, name, value=1, domain=None):
+        key = (name, domain)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def export(self):
+        """프로세스 간에 전달할 수 있는 형태로 내보냅니다."""
+        return {'spans': self.spans, 'counters': [[name, domain, value] for (name, domain), value in self.counters.items()]}
+
+    def merge(self, exported):
+        if not exported:
+            return
+        self.spans.extend(exported['spans'])
+        for name, domain, value in exported['counters']:
+            self.incr(name, value, domain)
+
+    @staticmethod
+    def _summarize(durations, failures):
+        return {
+            'count': len(durations), 'errors': failures,
+            'p50': round(percentile(durations, 50), 3), 'p95': round(percentile(durations, 95), 3),
+            'max': round(max(durations), 3), 'total': round(sum(durations), 3),
+        }
+
+    def summary(self):
+        """{'stages': {stage: 요약}, 'domains': {domain: {stage: 요약}}, 'counters': {...}}"""
+        by_stage, by_domain = {}, {}
+        for stage, domain, seconds, ok in self.spans:
+            by_stage.setdefault(stage, []).append((seconds, ok))
+            if domain:
+                by_domain.setdefault(domain, {}).setdefault(stage, []).append((seconds, ok))
+
+        def summarize(samples):
+            return self._summarize([s for s, _ in samples], sum(1 for _, ok in samples if not ok))
+
+        counters = {}
+        for (name, domain), value in sorted(self.counters.items(), key=lambda item: (item[0][0], item[0][1] or '')):
+            counters.setdefault(name, {})[domain or 'all'] = value
+        return {
+            'stages': {stage: summarize(samples) for stage, samples in sorted(by_stage.items())},
+            'domains': {domain: {stage: summarize(samples) for stage, samples in sorted(stages.items())}
+                        for domain, stages in sorted(by_domain.items())},
+            'counters': counters,
+        }
+
+    def to_prometheus(self, summary, run_id):
+        """node_exporter textfile collector 형식의 문자열을 만듭니다."""
+        def labels(**kwargs):
+            return '{' + ','.join(f'{k}="{str(v).replace(chr(34), "")}"' for k, v in kwargs.items()) + '}'
+
+        lines = [
+            '# HELP newsletter_stage_seconds Per-stage duration quantiles of the last newsletter run.',
+            '# TYPE newsletter_stage_seconds summary',
+        ]
+        for stage, s in summary['stages'].items():
+            lines.append(f"newsletter_stage_seconds{labels(stage=stage, quantile='0.5')} {s['p50']}")
+            lines.append(f"newsletter_stage_seconds{labels(stage=stage, quantile='0.95')} {s['p95']}")
+            lines.append(f"newsletter_stage_seconds_sum{labels(stage=stage)} {s['total']}")
+            lines.append(f"newsletter_stage_seconds_count{labels(stage=stage)} {s['count']}")
+        lines += ['# HELP newsletter_stage_max_seconds Slowest sample per stage.', '# TYPE newsletter_stage_max_seconds gauge']
+        lines += [f"newsletter_stage_max_seconds{labels(stage=stage)} {s['max']}" for stage, s in summary['stages'].items()]
+        lines += ['# HELP newsletter_stage_errors Failed samples per stage.', '# TYPE newsletter_stage_errors gauge']
+        lines += [f"newsletter_stage_errors{labels(stage=stage)} {s['errors']}" for stage, s in summary['stages'].items()]
+        lines += ['# HELP newsletter_domain_stage_p95_seconds Per-domain p95 duration per stage.', '# TYPE newsletter_domain_stage_p95_seconds gauge']
+        lines += [f"newsletter_domain_stage_p95_seconds{labels(domain=domain, stage=stage)} {s['p95']}"
+                  for domain, stages in summary['domains'].items() for stage, s in stages.items()]
+        lines += ['# HELP newsletter_events Counters of the last newsletter run.', '# TYPE newsletter_events gauge']
+        lines += [f"newsletter_events{labels(name=name, domain=domain)} {value}"
+                  for name, values in summary['counters'].items() for domain, value in values.items()]
+        lines += ['# HELP newsletter_run_timestamp_seconds Finish time of the last newsletter run.', '# TYPE newsletter_run_timestamp_seconds gauge']
+        lines.append(f"newsletter_run_timestamp_seconds{labels(run_id=run_id)} {time.time():.0f}")
+        return '\n'.join(lines) + '\n'
+
+    def print_summary(self, summary, top=8):
+        print("\n--- ⏱️ 단계별 소요 시간 (p50 / p95 / max, 건수) ---")
+        for stage, s in sorted(summary['stages'].items(), key=lambda item: item[1]['total'], reverse=True):
+            error_text = f", 실패 {s['errors']}" if s['errors'] else ""
+            print(f"  - {stage}: {s['p50']:.2f}s / {s['p95']:.2f}s / {s['max']:.2f}s ({s['count']}건{error_text})")
+        slow_domains = sorted(
+            ((domain, sum(s['total'] for s in stages.values())) for domain, stages in summary['domains'].items()),
+            key=lambda item: item[1], reverse=True
+        )[:top]
+        if slow_domains:
+            print("  [도메인별 누적 소요 시간 상위]")
+            for domain, total in slow_domains:
+                print(f"  - {domain}: {total:.1f}s")
+
+    def write_report(self, run_id, directory):
+        """실행별 JSON(<run_id>.json)과 Prometheus textfile(newsletter.prom)을 씁니다."""
+        if not self.spans and not self.counters:
+            return None
+        summary = self.summary()
+        self.print_summary(summary)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            json_path = os.path.join(directory, f"{run_id}.json")
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump({'run_id': run_id, 'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'), **summary}, f, ensure_ascii=False, indent=2)
+            prom_path = os.path.join(directory, 'newsletter.prom')
+            with open(prom_path + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus(summary, run_id))
+            os.replace(prom_path + '.tmp', prom_path) # textfile collector가 쓰다 만 파일을 읽지 않도록
+            print(f"✅ 실행 지표를 '{json_path}', '{prom_path}'에 저장했습니다.")
+            return json_path
+        except OSError as e:
+            print(f"❌ 실행 지표 저장 실패: {e}")
+            return None
+
+
+# 부모(메인) 프로세스의 실행 단위 지표. 워커 프로세스에서는 작업마다 Metrics()를 새로 만들어 사용합니다.
+run_metrics = Metrics()
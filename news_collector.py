@@ -1,270 +1,49 @@
 # news_collector.py
 import os
-import smtplib
-import platform
+import email.policy
 import base64
-import markdown
 import json
 import time
-import random
 from weather_service import WeatherService 
 from risk_briefing_service import RiskBriefingService
 from ai_service import AIService
-from utils import get_kst_today_str,get_kst_week_str, markdown_to_html, image_to_base64_string
-import logging
+from checkpoint_service import CheckpointService
+from driver_locator import ChromeDriverLocator
+from domain_stats import DomainStatsStore, default_host_policy, host_of, partition_by_host
+from circuit_breaker import CircuitBreaker
+from metrics import run_metrics
+import template_engine
+from archive_assets import ArchiveAssetStore
+from archive_index import ArchiveIndex
+from search_index import SearchIndex
+from delivery_service import DeliveryService
+from image_budget import ImageBudget
+from artifacts import Artifact
+from task_graph import TaskGraph
+from opinet_service import OpinetService
+from price_history import PriceHistoryStore, NATIONAL_AREA_CODE
+from price_analytics import PriceAnalytics
+from price_chart import create_price_trend_chart, create_regional_price_chart
+from utils import get_kst_today_str,get_kst_week_str, markdown_to_html
 from datetime import datetime, timezone, timedelta, date
 from email.mime.text import MIMEText
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.utils import formataddr
-from urllib.parse import urljoin, urlparse
-from io import BytesIO
 from concurrent.futures import ProcessPoolExecutor, as_completed
-import re
-from newspaper import Article
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from matplotlib.ticker import FuncFormatter
+from multiprocessing import Manager
 # 서드파티 라이브러리
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-from jinja2 import Environment, FileSystemLoader
-from PIL import Image
-from pygooglenews import GoogleNews
 from zoneinfo import ZoneInfo
 
-# ⬇️⬇️⬇️ Selenium의 '지능적 기다림' 기능을 위한 임포트 추가 ⬇️⬇️⬇️
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-from selenium_stealth import stealth
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-# 구글 인증 관련
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import openai
+# 셀레니움(scraper_workers), 맷플롯립, 구글 뉴스/인증 라이브러리는 임포트 비용이 커서
+# 실제로 사용하는 함수 안에서 불러옵니다. 기사 처리용 자식 프로세스는 최소 모듈인 scraper_workers만 불러옵니다.
 
 from config import Config
 
-def _create_driver_for_process(driver_path: str): # ✨ 드라이버 경로를 인자로 받음
-    """각 프로세스를 위한 독립적인 Selenium 드라이버를 생성하는 함수"""
-    config = Config()
-    chrome_options = Options()
-    chrome_options.page_load_strategy = 'eager'
-    chrome_options.add_argument("--headless=new") 
-    chrome_options.add_argument(f'--user-agent={random.choice(config.USER_AGENTS)}')
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--log-level=3") 
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false") 
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    try:
-        # ✨ 더 이상 드라이버를 매번 설치하지 않고, 전달받은 경로를 사용
-        service = ChromeService(executable_path=driver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        stealth(driver, languages=["ko-KR", "ko"], vendor="Google Inc.", platform="Win32",
-                webgl_vendor="Intel Inc.", renderer="Intel Iris OpenGL Engine", fix_hairline=True)
-        #driver.set_page_load_timeout(20)
-        return driver
-    except Exception as e:
-        print(f"🚨 드라이버 생성 실패: {e}")
-        return None
-
-
-def _clean_and_validate_url_worker(url):
-    """(독립 함수) URL의 유효성을 검사하고 정제합니다."""
-    config = Config()
-    try:
-        parsed = urlparse(url)
-        if any(ad_domain in parsed.netloc for ad_domain in config.AD_DOMAINS_BLACKLIST):
-            return None
-        if any(pattern in parsed.path.lower() for pattern in config.UNWANTED_URL_PATTERNS):
-            return None
-            
-        path = parsed.path.lower()
-        is_likely_article = (
-            any(char.isdigit() for char in path) or
-            any(keyword in path for keyword in ['/news/', '/article/', '/view/']) or
-            path.endswith('.html') or path.endswith('.php') or path.endswith('.do')
-        )
-        if 'hyundai.co.kr' in parsed.netloc:
-            pass
-        elif not is_likely_article:
-            return None
-        return parsed._replace(fragment="").geturl()
-    except Exception:
-        return None
-
-def resolve_google_news_url_worker(entry, driver_path: str):
-    start_time = time.time()
-    title = entry['title']
-    gnews_link = entry['link']
-    print(f"[DEBUG] '{title}' URL 추출 시작...")
-    
-    driver = None
-    try:
-        driver_start = time.time()
-        driver = _create_driver_for_process(driver_path)
-        if not driver: return None
-        print(f"[DEBUG] '{title}' | 드라이버 생성 | {time.time() - driver_start:.2f}s")
-
-        get_start = time.time()
-        driver.get(gnews_link)
-        print(f"[DEBUG] '{title}' | driver.get() | {time.time() - get_start:.2f}s")
-        
-        wait_start = time.time()
-        wait = WebDriverWait(driver, 30)
-        link_element = wait.until(EC.presence_of_element_located((By.TAG_NAME, 'a')))
-        print(f"[DEBUG] '{title}' | WebDriverWait | {time.time() - wait_start:.2f}s")
-
-        original_url = link_element.get_attribute('href')
-        validated_url = _clean_and_validate_url_worker(original_url)
-        
-        if validated_url:
-            print(f"  -> ✅ URL 추출 성공: {title} | 총 소요시간: {time.time() - start_time:.2f}s")
-            return {'title': title, 'link': validated_url}
-        else:
-            print(f"   ㄴ> 🗑️ 기사 URL 패턴이 아니라서 제외: {original_url}")
-            return None
-    except Exception as e:
-        if 'TimeoutException' in e.__class__.__name__:
-             print(f"  ㄴ> ❌ URL 추출 타임아웃: '{title}' (현재 URL: {driver.current_url if driver else 'N/A'})")
-        else:
-             print(f"  ㄴ> ❌ URL 추출 실패: '{title}'에서 오류 발생: {e.__class__.__name__}")
-        return None
-    finally:
-        if driver:
-            driver.quit()
-
-
-def process_article_content_worker(articles_batch, driver_path: str):
-    processed_in_batch = []
-    driver = None
-    config = Config()
-    scraper = NewsScraper(config)
-    ai_service = AIService(config)
-
-    for i, article_info in enumerate(articles_batch):
-        batch_start_time = time.time()
-        title = article_info['title']
-        url = article_info['link']
-        print(f"[DEBUG] '{title}' 콘텐츠 처리 시작...")
-
-        if i % 7 == 0:
-            if driver: driver.quit()
-            driver_start = time.time()
-            driver = _create_driver_for_process(driver_path)
-            print(f"[DEBUG] '{title}' | 새 드라이버 생성 | {time.time() - driver_start:.2f}s")
-        if not driver:
-            print("   ㄴ> 🚨 드라이버가 없어 현재 배치를 중단합니다.")
-            break
-
-        try:
-            get_start = time.time()
-            driver.get(url)
-            print(f"[DEBUG] '{title}' | 1. driver.get() | {time.time() - get_start:.2f}s")
-            
-            wait_start = time.time()
-            content_selectors = '#article-view-content, .article_body, .entry-content, #article-view, #articleBody, .post-content, #articles_detail'
-            WebDriverWait(driver, 20).until(EC.presence_of_element_located((By.CSS_SELECTOR, content_selectors)))
-            print(f"[DEBUG] '{title}' | 2. WebDriverWait | {time.time() - wait_start:.2f}s")
-            
-            html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'lxml')
-            content_area = soup.select_one(content_selectors)
-            if not content_area: continue
-            
-            text_processing_start = time.time()
-            article_text = content_area.get_text(strip=True)
-            if len(article_text) < 300: continue
-            print(f"[DEBUG] '{title}' | 3. 본문 텍스트 처리 | {time.time() - text_processing_start:.2f}s")
-
-            summary_start = time.time()
-            ai_summary = ai_service.generate_single_summary(title, url, article_text_from_selenium=article_text)
-            if not ai_summary or "요약 정보를 생성할 수 없습니다" in ai_summary: continue
-            print(f"[DEBUG] '{title}' | 4. AI 요약 | {time.time() - summary_start:.2f}s")
-
-            image_start = time.time()
-            image_url = scraper.get_image_url(soup, url)
-            print(f"[DEBUG] '{title}' | 5. 이미지 URL 검색 | {time.time() - image_start:.2f}s")
-            
-            # ... (이하 이미지 처리 및 저장 로직은 동일)
-            image_data, final_width, final_height = None, 0, 0
-            if image_url and image_url != config.DEFAULT_IMAGE_URL:
-                try:
-                    img_dl_start = time.time()
-                    img_response = scraper.session.get(image_url, timeout=10)
-                    img_response.raise_for_status()
-                    img = Image.open(BytesIO(img_response.content))
-                    print(f"[DEBUG] '{title}' | 6. 이미지 다운로드 | {time.time() - img_dl_start:.2f}s")
-                    # 리사이징 로직 ...
-                    original_width, original_height = img.size
-                   
-                    aspect_ratio = original_height / original_width
-                    if aspect_ratio > 1.5:
-                        target_height = min(original_height, 800)
-                        target_width = int(target_height / aspect_ratio)
-                        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                    else:
-                        target_width = 640
-                        target_height = int(target_width * aspect_ratio)
-                        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                    final_width, final_height = img.size
-                    buffer = BytesIO()
-                    if img.mode in ("RGBA", "P"): img = img.convert("RGB")
-                    img.save(buffer, format='JPEG', quality=85)
-                    image_data = buffer.getvalue()
-                except Exception: image_data = None
-            if not image_data: continue
-            
-            processed_in_batch.append({'title': title, 'link': url, 'ai_summary': ai_summary, 'image_data': image_data, 'image_final_width': final_width, 'image_final_height': final_height})
-            print(f"  -> ✅ 콘텐츠 처리 성공: '{title}' | 총 소요시간: {time.time() - batch_start_time:.2f}s")
-
-        except Exception as e:
-            if 'TimeoutException' in e.__class__.__name__:
-                print(f"  > ❌ 콘텐츠 처리 타임아웃: '{title}' (현재 URL: {driver.current_url if driver else 'N/A'}) | 총 소요시간: {time.time() - batch_start_time:.2f}s")
-            else:
-                print(f"  ㄴ> ❌ 콘텐츠 처리 중 오류: '{title}' ({e.__class__.__name__}) | 총 소요시간: {time.time() - batch_start_time:.2f}s")
-            continue
-    if driver:
-        driver.quit()
-    return processed_in_batch
-
 def render_html_template(context, target='email'):
-    """Jinja2 템플릿을 렌더링합니다. target에 따라 이미지 경로를 다르게 설정합니다."""
-    env = Environment(loader=FileSystemLoader('.'))
-    template = env.get_template('email_template.html')
-    
-    # context에서 Base64 데이터 추출
-    price_chart_b64 = context.get("price_indicators", {}).get("price_chart_b64")
-    weather_dashboard_b64 = context.get("weather_dashboard_b64")
-
-    context['target'] = target
-
-    if target == 'web':
-        # 웹페이지에서는 Base64 데이터 URI를 사용
-        if price_chart_b64:
-            context['price_chart_src'] = f"data:image/png;base64,{price_chart_b64}"
-        if weather_dashboard_b64:
-            context['weather_dashboard_src'] = f"data:image/png;base64,{weather_dashboard_b64}"
-    else: # 'email'
-        context['price_chart_src'] = 'cid:price_chart'
-        context['weather_dashboard_src'] = 'cid:weather_dashboard'
-    
-    return template.render(context)
+    """Jinja2 템플릿을 렌더링합니다. 이미지 경로는 템플릿이 target에 따라 고릅니다. (웹: data URI, 이메일: cid)"""
+    return template_engine.render(context, target)
+
 def format_change(change):
             if change > 0:
                 return f"주간 +{change:,.0f}원 ▲"
@@ -273,73 +52,6 @@ def format_change(change):
             else:
                 return "주간 변동 없음"
             
-def create_price_trend_chart(seven_day_data, today_str):
-    """(개선) 최근 7일 유가 데이터로 각 날짜별 가격이 표시된 차트 이미지를 생성합니다."""
-    filename = f"images/price_chart_{today_str}.png"
-    try:
-        # --- 폰트 설정 (기존과 동일) ---
-        system_name = platform.system()
-        if system_name == 'Windows':
-            plt.rc('font', family='Malgun Gothic')
-        elif system_name == 'Darwin':
-            plt.rc('font', family='AppleGothic')
-        else:
-            font_path = '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf'
-            if os.path.exists(font_path):
-                # Matplotlib의 폰트 목록에 나눔고딕이 없으면, 캐시를 재생성
-                if 'NanumGothic' not in [f.name for f in fm.fontManager.ttflist]:
-                    print("-> 나눔고딕 폰트를 찾을 수 없어 Matplotlib 폰트 캐시를 재생성합니다.")
-                    fm._rebuild()
-                plt.rc('font', family='NanumGothic') # 'NanumGothicBold' 대신 'NanumGothic' 사용이 더 안정적
-            else:
-                print("⚠️ 나눔고딕 폰트 파일이 없어 기본 폰트로 출력됩니다.")
-        plt.rcParams['axes.unicode_minus'] = False
-
-        # --- 데이터 준비 (기존과 동일) ---
-        dates = [d['DATE'][-4:-2] + "/" + d['DATE'][-2:] for d in seven_day_data['gasoline']]
-        gasoline_prices = [float(p['PRICE']) for p in seven_day_data['gasoline']]
-        diesel_prices = [float(p['PRICE']) for p in seven_day_data['diesel']]
-        
-        # --- 그래프 생성 ---
-        fig, ax = plt.subplots(figsize=(8, 5)) # 그래프 크기를 약간 조정
-        ax.plot(dates, gasoline_prices, 'o-', label='휘발유', color='#3498db', linewidth=2)
-        ax.plot(dates, diesel_prices, 'o-', label='경유', color='#e74c3c', linewidth=2)
-        
-        ax.set_title("최근 7일 유가 추이", fontsize=16, pad=20, fontweight='bold')
-        ax.legend()
-        ax.grid(True, which='both', linestyle=':', linewidth=0.7)
-        
-        formatter = FuncFormatter(lambda y, _: f'{int(y):,}원')
-        ax.yaxis.set_major_formatter(formatter)
-        ax.tick_params(axis='x', rotation=0)
-        
-        # ✨ [신규] 각 데이터 포인트에 가격 텍스트를 추가하는 로직
-        # va='bottom'은 포인트 바로 위에, va='top'은 바로 아래에 텍스트를 위치시킵니다.
-        for i, price in enumerate(gasoline_prices):
-            ax.text(i, price + 5, f'{int(price):,}', ha='center', va='bottom', fontsize=9, color='#005a9c')
-            
-        for i, price in enumerate(diesel_prices):
-            ax.text(i, price + 5, f'{int(price):,}', ha='center', va='bottom', fontsize=9, color='#a8382c')
-        
-        # Y축 범위를 살짝 늘려서 위쪽 텍스트가 잘리지 않도록 함
-        ymin, ymax = ax.get_ylim()
-        ax.set_ylim(ymin, ymax * 1.05)
-        
-        fig.tight_layout()
-        
-        # --- 파일 저장 및 반환 (기존과 동일) ---
-        plt.savefig(filename, dpi=150)
-        plt.close(fig)
-        print(f"✅ 유가 추이 차트 이미지 '{filename}'를 생성했습니다.")
-        
-        base64_image = image_to_base64_string(filename)
-        return {"filepath": filename, "base64": base64_image}
-
-    except Exception as e:
-        print(f"❌ 차트 이미지 생성 실패: {e}")
-        return None
-    
-    
 def get_price_indicators(config):
     """오피넷 API를 사용하여 주요 도시별 유가, 요소수 가격, 추세, 최저가 주유소 정보를 가져와 하나의 객체로 반환합니다."""
     if not config.OPINET_API_KEY:
@@ -355,57 +67,37 @@ def get_price_indicators(config):
         "cheapest_stations": []
     }
     
-    # --- 1. 주요 도시별 휘발유/경유 가격 가져오기 (API 호출 1회) ---
+    # --- 1~3. 시도별 유가, 지역별 요소수, 최근 7일 추세를 한 번에 동시 조회 ---
+    print("-> 오피넷에서 유가/요소수 정보를 동시에 조회합니다...")
+    price_data = OpinetService(config).fetch_price_data(config.TARGET_AREA_CODES)
+
+    # --- 1. 주요 도시별 휘발유/경유 가격 ---
     city_data_map = {code: {"name": name} for code, name in config.AREA_CODE_MAP.items() if code in config.TARGET_AREA_CODES}
     try:
-        sido_price_url = f"http://www.opinet.co.kr/api/avgSidoPrice.do?out=json&code={config.OPINET_API_KEY}"
-        response = requests.get(sido_price_url, timeout=30)
-        response.raise_for_status()
-        sido_data = response.json()['RESULT']['OIL']
-        for oil in sido_data:
-            area_code = oil.get('SIDOCD')
-            if area_code in config.TARGET_AREA_CODES:
-                prod_code = oil.get('PRODCD')
-                price = f"{float(oil['PRICE']):,.0f}원"
-                if prod_code == 'B027': # 보통휘발유
-                    city_data_map[area_code]['gasoline'] = price
-                elif prod_code == 'D047': # 자동차용경유
-                    city_data_map[area_code]['diesel'] = price
-        print("✅ 주요 도시별 유가 정보를 가져왔습니다.")
+        if price_data['sido'] is not None:
+            for oil in price_data['sido']:
+                area_code = oil.get('SIDOCD')
+                if area_code in config.TARGET_AREA_CODES:
+                    prod_code = oil.get('PRODCD')
+                    price = f"{float(oil['PRICE']):,.0f}원"
+                    if prod_code == 'B027': # 보통휘발유
+                        city_data_map[area_code]['gasoline'] = price
+                    elif prod_code == 'D047': # 자동차용경유
+                        city_data_map[area_code]['diesel'] = price
+            print("✅ 주요 도시별 유가 정보를 가져왔습니다.")
     except Exception as e:
-        print(f"❌ 시도별 유가 정보 조회 실패: {e}")
+        print(f"❌ 시도별 유가 정보 처리 실패: {e}")
 
-    # --- 2. 주요 도시별 요소수 평균 가격 가져오기 (도시별 API 호출) ---
-    print("-> 주요 도시별 요소수 가격 정보를 조회합니다...")
-    for area_code in config.TARGET_AREA_CODES:
-        urea_url = f"http://www.opinet.co.kr/api/ureaPrice.do?out=json&code={config.OPINET_API_KEY}&area={area_code}"
-        try:
-            response = requests.get(urea_url, timeout=30)
-            response.raise_for_status()
-            urea_data = json.loads(response.text, strict=False)['RESULT']['OIL']
-            total_price, stock_count = 0, 0
-            for station in urea_data:
-                stock_yn = station.get('STOCK_YN', '').strip()
-                price_str = station.get('PRICE', '').strip()
-                if stock_yn == 'Y' and price_str:
-                    total_price += int(price_str)
-                    stock_count += 1
-            if stock_count > 0:
-                avg_price = total_price / stock_count
-                city_data_map[area_code]['urea'] = f"{avg_price:,.0f}원/L"
-            time.sleep(5)
-        except Exception as e:
-            area_name = config.AREA_CODE_MAP.get(area_code, "알 수 없는 지역")
-            print(f"❌ {area_name} 요소수 가격 조회 실패: {e}")
-            continue
+    # --- 2. 주요 도시별 요소수 평균 가격 ---
+    for area_code, urea_summary in price_data['urea'].items():
+        if urea_summary and urea_summary['stock_count'] > 0:
+            avg_price = urea_summary['total_price'] / urea_summary['stock_count']
+            city_data_map[area_code]['urea'] = f"{avg_price:,.0f}원/L"
     print("✅ 주요 도시별 요소수 가격 정보를 가져왔습니다.")
 
-    # --- 3. 전국 가격 추세 및 차트용 데이터 가져오기 (API 호출 1회) ---
+    # --- 3. 전국 가격 추세 및 차트용 데이터 ---
     try:
-        trend_url = f"http://www.opinet.co.kr/api/avgRecentPrice.do?out=json&code={config.OPINET_API_KEY}"
-        response = requests.get(trend_url, timeout=30)
-        response.raise_for_status()
-        trend_data = response.json()['RESULT']['OIL']
+        trend_data = price_data['recent'] or []
         
         # 차트용 7일 데이터 준비
         gasoline_7day = sorted([p for p in trend_data if p['PRODCD'] == 'B027'], key=lambda x: x['DATE'])
@@ -414,8 +106,32 @@ def get_price_indicators(config):
             indicator_data["seven_day_data"] = {"gasoline": gasoline_7day, "diesel": diesel_7day}
             print("✅ 차트용 7일 유가 데이터를 준비했습니다.")
 
-        # 경유 가격 추세 분석
-        if len(diesel_7day) >= 2:
+        # 받은 7일치 전국 데이터와 오늘의 시도별 평균가를 누적 이력에 반영해 두고, 7일보다 긴 차트용 이력을 함께 준비
+        price_history = PriceHistoryStore(config)
+        price_history.append_recent_prices(trend_data)
+        if price_data['sido']:
+            today_ymd = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y%m%d')
+            price_history.append_sido_prices(price_data['sido'], today_ymd, config.TARGET_AREA_CODES)
+        history_data = price_history.get_chart_data(days=config.PRICE_CHART_DAYS_WEEKLY)
+        if history_data and len(history_data['diesel']) > len(diesel_7day):
+            indicator_data["history_data"] = history_data
+
+        # 누적 이력 전체로 이동평균/주간·월간 변화/변동성/지역별 차이를 계산해 추세 문장과 지역별 차트에 사용
+        analytics = None
+        try:
+            analytics = PriceAnalytics.from_records(price_history.load(), config.TARGET_AREA_CODES)
+        except Exception as e:
+            print(f"⚠️ 유가 이력 분석 실패, 최근 7일 데이터로만 추세를 계산합니다: {e}")
+        area_names = {NATIONAL_AREA_CODE: '전국', **config.AREA_CODE_MAP}
+        if analytics:
+            indicator_data["trend_comment"] = analytics.trend_comment('diesel', area_names)
+            print(f"✅ 유가 이력 {len(analytics.dates)}일치로 추세 지표를 계산했습니다.")
+            regional_data = analytics.regional_series('diesel', config.PRICE_CHART_DAYS_WEEKLY, area_names)
+            if regional_data:
+                indicator_data["regional_history_data"] = regional_data
+
+        # 경유 가격 추세 분석 (이력 분석을 할 수 없을 때)
+        if not indicator_data["trend_comment"] and len(diesel_7day) >= 2:
             today_price = float(diesel_7day[-1]['PRICE'])
             yesterday_price = float(diesel_7day[-2]['PRICE'])
             trend_comment = ""
@@ -431,7 +147,7 @@ def get_price_indicators(config):
             indicator_data["trend_comment"] = f"전국 경유 가격은 {trend_comment}"
             print("✅ 전국 유가 추세 정보를 가져왔습니다.")
     except Exception as e:
-        print(f"❌ 유가 추세 정보 조회 실패: {e}")
+        print(f"❌ 유가 추세 정보 처리 실패: {e}")
 
     # --- 4. 전국 최저가 주유소 정보 가져오기 ---
     #indicator_data["cheapest_stations"] = get_cheapest_stations(config, count=20)
@@ -441,100 +157,6 @@ def get_price_indicators(config):
     return indicator_data
     
 
-class NewsScraper:
-    def __init__(self, config):
-        self.config = config
-        self.session = self._create_session()
-
-    def _create_session(self):
-        session = requests.Session()
-        retry = Retry(total=5, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
-    
-    def _transform_thumbnail_url(self, url: str) -> str:
-        """썸네일 URL을 원본 URL로 변형 시도 (예: _v150.jpg 제거)"""
-        # 정규표현식을 사용하여 URL 끝에 있는 '_v숫자', '_w숫자', '_s숫자' 등의 썸네일 패턴을 제거
-        transformed_url = re.sub(r'(_[vws]\d+)\.(jpg|jpeg|png|gif)$', r'.\2', url, flags=re.IGNORECASE)
-        return transformed_url
-
-    def get_image_url(self, soup: BeautifulSoup, base_url: str) -> str:
-        try:
-            # 1순위: 메타 태그 (이제 soup 객체에서 바로 찾음)
-            meta_image = soup.find("meta", property="og:image") or soup.find("meta", name="twitter:image")
-            if meta_image and meta_image.get("content"):
-                thumbnail_url = meta_image["content"]
-                original_url_candidate = self._transform_thumbnail_url(thumbnail_url)
-                
-                full_url = self._resolve_url(base_url, original_url_candidate)
-                if self._is_valid_candidate(full_url) and self._validate_image(full_url):
-                    return full_url
-                
-                full_thumbnail_url = self._resolve_url(base_url, thumbnail_url)
-                if full_thumbnail_url != full_url:
-                    if self._is_valid_candidate(full_thumbnail_url) and self._validate_image(full_thumbnail_url):
-                        return full_thumbnail_url
-
-            # 2순위: 특정 기사 본문 영역 안에서 이미지 검색
-            content_area = soup.select_one('#article-view-content-div, .entry-content, .article-body, #article-view-content, #article-view, #articleBody, .post-content')
-            if content_area:
-                for img in content_area.find_all("img", limit=5):
-                    img_url = img.get("src") or img.get("data-src")
-                    if img_url and self._is_valid_candidate(img_url):
-                        full_url = self._resolve_url(base_url, img_url)
-                        if self._validate_image(full_url):
-                            return full_url
-            
-            # 3순위: 본문 <figure> 또는 <picture> 태그
-            for tag in soup.select('figure > img, picture > img', limit=5):
-                img_url = tag.get('src') or tag.get('data-src') or (tag.get('srcset').split(',')[0].strip().split(' ')[0] if tag.get('srcset') else None)
-                if img_url and self._is_valid_candidate(img_url):
-                    full_url = self._resolve_url(base_url, img_url)
-                    if self._validate_image(full_url):
-                        return full_url
-            
-            # 4순위: 일반 <img> 태그
-            for img in soup.find_all("img", limit=10):
-                img_url = img.get("src") or img.get("data-src")
-                if img_url and self._is_valid_candidate(img_url):
-                    full_url = self._resolve_url(base_url, img_url)
-                    if self._validate_image(full_url):
-                        return full_url
-
-            return self.config.DEFAULT_IMAGE_URL
-        except Exception:
-            return self.config.DEFAULT_IMAGE_URL
-
-    def _resolve_url(self, base_url, image_url):
-        if image_url.startswith('//'): return 'https:' + image_url
-        return urljoin(base_url, image_url)
-
-    def _is_valid_candidate(self, image_url):
-        if 'news.google.com' in image_url or 'lh3.googleusercontent.com' in image_url: return False
-        return not any(pattern in image_url.lower() for pattern in self.config.UNWANTED_IMAGE_PATTERNS)
-
-    def _validate_image(self, image_url):
-        try:
-            response = self.session.get(image_url, stream=True, timeout=5)
-            response.raise_for_status()
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'image' not in content_type: return False
-            img_data = BytesIO(response.content)
-            with Image.open(img_data) as img:
-                width, height = img.size
-                if width < self.config.MIN_IMAGE_WIDTH or height < self.config.MIN_IMAGE_HEIGHT: return False
-                aspect_ratio = width / height
-                if aspect_ratio > 4.0 or aspect_ratio < 0.25: return False
-                
-
-                return True
-        except Exception:
-            return False
-
-
-
 class NewsService:
     def __init__(self, config):
         self.config = config
@@ -549,6 +171,9 @@ class NewsService:
             return set()
 
     def fetch_candidate_articles(self, keywords, hours):
+        from pygooglenews import GoogleNews
+        from scraper_workers import _clean_and_validate_url_worker
+
         print("최신 뉴스 수집을 시작합니다...")
         client = GoogleNews(lang='ko', country='KR')
         all_entries, unique_links = [], set()
@@ -586,36 +211,69 @@ class NewsService:
         return new_articles
     
     def process_articles(self, articles, driver_path):
+        if not articles: 
+            return []
+        resolved_articles = self.resolve_articles(articles, driver_path)
+        return self.process_article_contents(resolved_articles, driver_path)
+
+    def resolve_articles(self, articles, driver_path):
         if not articles: 
             return []
         
+        from scraper_workers import resolve_google_news_url_worker
+
         print("\n--- 1단계: 실제 기사 URL 추출 시작 (병렬 처리) ---")
         resolved_articles = []
         with ProcessPoolExecutor(max_workers=5) as executor:
             future_to_entry = {executor.submit(resolve_google_news_url_worker, entry, driver_path): entry for entry in articles[:self.config.MAX_ARTICLES_TO_PROCESS]}
             for future in as_completed(future_to_entry):
-                resolved_info = future.result()
-                if resolved_info: resolved_articles.append(resolved_info)
+                result = future.result()
+                run_metrics.merge(result['metrics'])
+                if result['article']: resolved_articles.append(result['article'])
         print(f"--- 1단계 완료: {len(resolved_articles)}개의 유효한 실제 URL 확보 ---\n")
-        
+        return resolved_articles
+
+    def process_article_contents(self, resolved_articles, driver_path):
         if not resolved_articles: 
             return []
 
+        from scraper_workers import process_article_content_worker
+
         print(f"--- 2단계: 기사 콘텐츠 병렬 처리 시작 (대상: {len(resolved_articles)}개) ---")
         processed_news = []
         max_workers = 2
-        chunk_size = len(resolved_articles) // max_workers + (1 if len(resolved_articles) % max_workers > 0 else 0)
-        article_batches = [resolved_articles[i:i + chunk_size] for i in range(0, len(resolved_articles), chunk_size)]
-        
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            future_to_batch = {executor.submit(process_article_content_worker, batch, driver_path): batch for batch in article_batches}
+
+        # 도메인별 통계로 타임아웃/건너뛰기/동시 접속 수를 정하고, 같은 도메인이 몰리지 않도록 배치를 나눕니다.
+        domain_stats = DomainStatsStore(self.config)
+        host_policies = domain_stats.policies()
+        default_policy = default_host_policy(self.config)
+        target_articles = []
+        for article in resolved_articles:
+            if host_policies.get(host_of(article['link']), default_policy)['skip']:
+                print(f"   ㄴ> ⏩ 최근 실패가 계속된 도메인이라 건너뜁니다: '{article['title']}' ({host_of(article['link'])})")
+            else:
+                target_articles.append(article)
+        article_batches = partition_by_host(target_articles, max_workers, host_policies, default_policy)
+        
+        samples = []
+        # 서킷 브레이커 상태는 Manager 프로세스에 두어 두 워커가 같은 도메인 실패 기록을 공유합니다.
+        with Manager() as manager, ProcessPoolExecutor(max_workers=max_workers) as executor:
+            breaker = CircuitBreaker(self.config.CIRCUIT_BREAKER_FAILURE_THRESHOLD, self.config.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+                                     state=manager.dict(), lock=manager.Lock())
+            future_to_batch = {executor.submit(process_article_content_worker, batch, driver_path, host_policies, breaker): batch for batch in article_batches}
             for future in as_completed(future_to_batch):
                 try:
                     results_from_batch = future.result()
-                    processed_news.extend(results_from_batch)
+                    processed_news.extend(results_from_batch['articles'])
+                    samples.extend(results_from_batch['samples'])
+                    run_metrics.merge(results_from_batch['metrics'])
                 except Exception as exc:
-                    print(f"  ㄴ> ❌ 배치 처리 중 심각한 오류 발생: {exc.__class__.__name__} - {exc}")
+                    print(f"  ㄴ> ❌ 배치 처리 중 심각한 오류 발생: {exc.__class__.__name__} - {exc}")
+            if breaker.open_hosts():
+                print(f"   ㄴ 회로가 열린 채 끝난 도메인: {', '.join(breaker.open_hosts())}")
 
+        domain_stats.record(samples)
+        domain_stats.save()
         print(f"--- 2단계 완료: 총 {len(processed_news)}개 기사 처리 성공 ---\n")
         return processed_news
 
@@ -629,24 +287,29 @@ class NewsService:
         except Exception as e:
             print(f"❌ 발송 기록 파일 업데이트 실패: {e}")
 
+
+# MIMEMultipart 기본 정책(compat32)에 SMTP 줄바꿈(CRLF)만 적용합니다. smtplib.send_message가 쓰는 설정과 같습니다.
+SMTP_POLICY = email.policy.compat32.clone(linesep='\r\n')
+
+
 class EmailService:
     def __init__(self, config):
         self.config = config
         # 인증 객체 생성 로직이 더 이상 필요 없으므로 __init__이 매우 간단해집니다.
 
     def create_email_body(self, news_list, ai_briefing_html, today_date_str, price_indicators, has_weather_dashboard=False):
-        env = Environment(loader=FileSystemLoader('.'))
-        template = env.get_template('email_template.html')
-        return template.render(
-            news_list=news_list,
-            today_date=today_date_str,
-            ai_briefing=ai_briefing_html,
-            price_indicators=price_indicators,
-            has_weather_dashboard=has_weather_dashboard 
-        )
+        return template_engine.render({
+            'news_list': news_list,
+            'today_date': today_date_str,
+            'ai_briefing': ai_briefing_html,
+            'price_indicators': price_indicators,
+            'has_weather_dashboard': has_weather_dashboard,
+        }, target='email')
 
     def _get_credentials(self):
         """서비스 계정으로만 인증을 시도합니다 (GitHub Actions 또는 로컬 파일)."""
+        from google.oauth2 import service_account
+
         gcp_json_credentials_str = os.getenv('GCP_SA_KEY_JSON')
         
         # 1. GitHub Actions 환경일 경우
@@ -686,7 +349,9 @@ class EmailService:
             return None
 
 
-    def send_email(self, subject, body_html, images_to_embed=None):
+    def send_email(self, subject, body_html, images_to_embed=None, delivery_key=None):
+        """모든 수신자에게 메일을 보냅니다. delivery_key(예: 'daily-2025-01-01')가 있으면 발송 기록을 남겨
+        같은 키로 다시 실행할 때 이미 받은 수신자는 건너뜁니다."""
         # ✨ [수정] 실행 모드에 따라 데일리/위클리 수신자를 선택합니다.
         if self.config.EXECUTION_MODE == 'weekly':
             recipients = self.config.WEEKLY_RECIPIENT_LIST
@@ -706,46 +371,49 @@ class EmailService:
             print("🚨 GMAIL_APP_PASSWORD Secret이 설정되지 않았습니다.")
             return
 
-        try:
-            # SMTP 서버에 먼저 연결하고 로그인
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls()
-            server.login(sender_email, app_password)
-
-            # ✨ [수정] 선택된 수신자 목록(recipients)을 사용합니다.
-            for recipient in recipients:
-                msg = MIMEMultipart('related')
-                msg['From'] = formataddr((self.config.SENDER_NAME, sender_email))
-                msg['Subject'] = subject
-                msg['To'] = recipient
-
-                msg_alternative = MIMEMultipart('alternative')
-                msg_alternative.attach(MIMEText(body_html, 'html', 'utf-8'))
-                msg.attach(msg_alternative)
-
-                if images_to_embed:
-                    for image_info in images_to_embed:
-                        image_cid = image_info['cid']
-                        msg_image = None
-                        if 'path' in image_info and os.path.exists(image_info['path']):
-                            with open(image_info['path'], 'rb') as f:
-                                msg_image = MIMEImage(f.read())
-                        elif 'data' in image_info and image_info['data']:
-                            msg_image = MIMEImage(image_info['data'])
-
-                        if msg_image:
-                            msg_image.add_header('Content-ID', f'<{image_cid}>')
-                            msg.attach(msg_image)
-
-                server.send_message(msg)
-                print(f" -> ✅ 이메일 발송 성공: {recipient}")
-
-            server.quit()
-            print(f"✅ 총 {len(recipients)}명에게 이메일 발송을 완료했습니다.")
+        # 본문과 이미지 파트는 수신자와 상관없이 같으므로 한 번만 만들어 바이트로 직렬화해 둡니다.
+        message_bytes = self.build_message_bytes(subject, body_html, images_to_embed)
+        print(f"-> 메일 메시지 생성 완료 ({len(message_bytes) / 1024:.0f}KB)")
 
+        try:
+            delivery_service = DeliveryService(self.config, sender_email, app_password)
+            result = delivery_service.deliver(
+                sender_email, recipients, lambda recipient: self.stamp_recipient(message_bytes, recipient), ledger_key=delivery_key
+            )
+            print(f"✅ 이메일 발송 완료: 성공 {result['sent']}명, 실패 {len(result['failed'])}명, 이전 발송분 건너뜀 {result['skipped']}명")
+            for recipient, error in result['failed']:
+                print(f"   ㄴ ❌ {recipient}: {error}")
         except Exception as e:
             print(f"❌ SMTP 이메일 발송 중 오류 발생: {e}")
 
+    def build_message_bytes(self, subject, body_html, images_to_embed=None):
+        """To 헤더를 제외한 메일 전체(본문 + 인라인 이미지)를 SMTP 형식(CRLF) 바이트로 만듭니다."""
+        msg = MIMEMultipart('related')
+        msg['From'] = formataddr((self.config.SENDER_NAME, self.config.SENDER_EMAIL))
+        msg['Subject'] = subject
+
+        msg_alternative = MIMEMultipart('alternative')
+        msg_alternative.attach(MIMEText(body_html, 'html', 'utf-8'))
+        msg.attach(msg_alternative)
+
+        for image_info in images_to_embed or []:
+            msg_image = None
+            if 'path' in image_info and os.path.exists(image_info['path']):
+                with open(image_info['path'], 'rb') as f:
+                    msg_image = MIMEImage(f.read())
+            elif 'data' in image_info and image_info['data']:
+                msg_image = MIMEImage(image_info['data'])
+
+            if msg_image:
+                msg_image.add_header('Content-ID', f'<{image_info["cid"]}>')
+                msg.attach(msg_image)
+        return msg.as_bytes(policy=SMTP_POLICY)
+
+    @staticmethod
+    def stamp_recipient(message_bytes, recipient):
+        """미리 직렬화한 메시지 앞에 수신자별 To 헤더만 붙입니다. (헤더 순서는 의미가 없습니다)"""
+        return SMTP_POLICY.fold_binary('To', recipient) + message_bytes
+
 
 def load_newsletter_history(filepath='previous_newsletter.json'):
     """이전에 발송된 뉴스레터 내용을 JSON 파일에서 불러옵니다."""
@@ -780,84 +448,90 @@ def save_newsletter_history(news_list, filepath='previous_newsletter.json'):
     except Exception as e:
         print(f"❌ 뉴스레터 내용 저장 실패: {e}")
 
-def update_archive_index():
-    """archive 폴더의 html 파일 목록을 생성 시간순으로 정렬하여 index.html을 생성/업데이트합니다."""
+def update_archive_index(config, filename, mode, title, item_count, issue_date):
+    """manifest에 이번 호를 추가하고 해당 월 목록 페이지와 index.html만 갱신합니다."""
     print("-> 아카이브 인덱스 페이지를 업데이트합니다...")
     try:
-        archive_dir = 'archive'
-        
-        # ✨ [핵심 수정] 파일 이름이 아닌, 파일의 최종 수정 시간을 기준으로 정렬합니다.
-        
-        # 1. 'index.html'을 제외한 모든 html 파일의 전체 경로를 가져옵니다.
-        file_paths = [
-            os.path.join(archive_dir, f) 
-            for f in os.listdir(archive_dir) 
-            if f.endswith('.html') and f != 'index.html'
-        ]
-        
-        # 2. 파일의 최종 수정 시간을 기준으로 내림차순(최신순) 정렬합니다.
-        sorted_paths = sorted(file_paths, key=os.path.getmtime, reverse=True)
-        
-        # 3. 전체 경로에서 파일 이름만 다시 추출합니다.
-        html_files = [os.path.basename(p) for p in sorted_paths]
-
-        # HTML 페이지 기본 구조 (기존과 동일)
-        html_content = """
-        <!DOCTYPE html>
-        <html lang="ko">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>지난 뉴스레터 목록</title>
-            <style>
-                body { font-family: sans-serif; margin: 40px; background-color: #f6f8fa; }
-                .container { max-width: 600px; margin: 0 auto; background-color: #fff; border: 1px solid #e1e4e8; border-radius: 6px; padding: 20px 40px; }
-                h1 { text-align: center; }
-                ul { list-style: none; padding: 0; }
-                li { margin: 15px 0; }
-                a { text-decoration: none; font-size: 1.1em; color: #0366d6; }
-                a:hover { text-decoration: underline; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>지난 뉴스레터 목록</h1>
-                <ul>
-        """
-
-        # 파일 목록으로 링크 생성 (기존과 동일)
-        for filename in html_files:
-            date_str = filename.replace('.html', '')
-            html_content += f'            <li><a href="{filename}">{date_str} 뉴스레터</a></li>\n'
-
-        html_content += """
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
-
-        with open(os.path.join(archive_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
+        ArchiveIndex(config).record_issue(filename, mode, title, item_count, issue_date)
         print("✅ 아카이브 인덱스 페이지 업데이트 완료.")
-
     except Exception as e:
         print(f"❌ 아카이브 인덱스 페이지 업데이트 실패: {e}")
 
-def image_to_base64_string(filepath):
-    """이미지 파일 경로를 받아 Base64 텍스트 문자열로 변환합니다."""
+def update_search_index(config, filename, issue_date, news_list):
+    """이번 호의 기사 제목, 링크, 요약을 검색 색인에 추가합니다."""
     try:
-        with open(filepath, 'rb') as image_file:
-            encoded_bytes = base64.b64encode(image_file.read())
-            return encoded_bytes.decode('utf-8')
+        count = SearchIndex(config).add_issue(filename, issue_date, news_list)
+        print(f"✅ 검색 색인에 기사 {count}건을 추가했습니다.")
     except Exception as e:
-        print(f"❌ 이미지를 Base64로 변환하는 중 오류 발생: {e}")
+        print(f"❌ 검색 색인 업데이트 실패: {e}")
+
+def build_zodiac_horoscopes(ai_service):
+    """띠별 운세를 생성하고 템플릿에서 사용할 이모지를 붙여 반환합니다."""
+    zodiac_horoscopes = ai_service.generate_zodiac_horoscopes()
+    if zodiac_horoscopes:
+        zodiac_emojis = {'쥐': '🐭', '소': '🐮', '호랑이': '🐯', '토끼': '🐰', '용': '🐲', '뱀': '🐍', '말': '🐴', '양': '🐑', '원숭이': '🐵', '닭': '🐔', '개': '🐶', '돼지': '🐷'}
+        for item in zodiac_horoscopes:
+            item['emoji'] = zodiac_emojis.get(item['name'], '❓')
+    return zodiac_horoscopes
+
+def build_price_chart(price_indicators, mode='daily'):
+    """유가 지표로 추이 차트를 그립니다. 주간 뉴스레터는 누적 이력이 있으면 7일보다 긴 기간의 추이를 보여줍니다."""
+    if mode == 'weekly' and price_indicators.get("history_data"):
+        history_days = len(price_indicators["history_data"]["diesel"])
+        return create_price_trend_chart(price_indicators["history_data"], title=f"최근 {history_days}일 유가 추이")
+    return create_price_trend_chart(price_indicators.get("seven_day_data"))
+
+def build_regional_price_chart(price_indicators):
+    """누적된 지역별 이력이 있으면 전국 평균과 주요 도시의 경유 가격을 한 차트에 그립니다."""
+    regional_data = price_indicators.get("regional_history_data")
+    if not regional_data:
         return None
-
-def run_daily_newsletter(config, driver_path):
-    """일간 뉴스레터 생성의 모든 과정을 처리하는 함수"""
+    history_days = len(next(iter(regional_data.values())))
+    return create_regional_price_chart(regional_data, title=f"최근 {history_days}일 지역별 경유 가격 추이")
+
+def start_auxiliary_tasks(config, weather_service, risk_briefing_service, ai_service, date_str, mode='daily'):
+    """유가, 날씨 대시보드, 리스크, 운세 데이터 수집을 동시에 시작하고 작업 그래프를 반환합니다."""
+    aux_tasks = TaskGraph(name="보조 데이터 수집")
+    aux_tasks.submit('price_indicators', get_price_indicators, config)
+    # 차트는 pyplot 없이 Figure/Agg로 그리므로 유가 지표가 준비되는 대로 작업 스레드에서 바로 그립니다.
+    aux_tasks.submit('price_chart', lambda indicators: build_price_chart(indicators or {}, mode), depends_on=('price_indicators',))
+    if mode == 'weekly':
+        aux_tasks.submit('regional_price_chart', lambda indicators: build_regional_price_chart(indicators or {}), depends_on=('price_indicators',))
+    aux_tasks.submit('weather_dashboard', weather_service.create_dashboard_image, date_str)
+    aux_tasks.submit('risk_events', risk_briefing_service.generate_risk_events)
+    aux_tasks.submit('zodiac_horoscopes', build_zodiac_horoscopes, ai_service)
+    return aux_tasks
+
+def join_auxiliary_tasks(aux_tasks):
+    """보조 작업이 끝나기를 기다려 (유가 지표, 날씨 대시보드, 리스크, 운세, 유가 차트) 순서로 반환합니다."""
+    price_indicators = aux_tasks.result('price_indicators', default={}) or {}
+    weather_result = aux_tasks.result('weather_dashboard')
+    risk_events = aux_tasks.result('risk_events', default=[])
+    zodiac_horoscopes = aux_tasks.result('zodiac_horoscopes', default=[])
+    price_chart_result = aux_tasks.result('price_chart')
+    # 지역별 유가 차트(주간 전용)는 유가 지표에 함께 담아 템플릿과 메일 첨부에서 사용합니다.
+    if 'regional_price_chart' in aux_tasks.futures:
+        regional_chart = aux_tasks.result('regional_price_chart')
+        if regional_chart: price_indicators['regional_chart'] = regional_chart
+    for task_name, duration in aux_tasks.report().items():
+        run_metrics.observe(f"aux_{task_name}", duration)
+    aux_tasks.shutdown()
+    return price_indicators, weather_result, risk_events, zodiac_horoscopes, price_chart_result
+
+def run_daily_newsletter(config, run_id=None, resume=False):
+    """일간 뉴스레터 생성의 모든 과정을 처리하는 함수
+
+    단계별 결과(후보 기사, 실제 URL, 처리된 기사, 최종 선별, 브리핑)는 run_id 아래 체크포인트로 저장되며,
+    resume=True로 실행하면 이미 완료된 단계는 건너뜁니다.
+    """
     print("🚀 일간 뉴스레터 생성을 시작합니다.")
+    if not run_id:
+        run_id = (CheckpointService.latest_run_id(config, 'daily-') if resume else None) or f"daily-{get_kst_today_str()}"
+    checkpoints = CheckpointService(config, run_id)
+    if resume:
+        print(f"⏩ 체크포인트 '{run_id}'에서 이어서 실행합니다.")
+    else:
+        checkpoints.reset()
     try:
         # --- 1. 서비스 객체 초기화 ---
         news_service = NewsService(config)
@@ -865,59 +539,48 @@ def run_daily_newsletter(config, driver_path):
         weather_service = WeatherService(config)
         ai_service = AIService(config) 
         risk_briefing_service = RiskBriefingService(ai_service)
+        driver_locator = ChromeDriverLocator(config) # 브라우저 단계가 실제로 실행될 때만 드라이버를 찾습니다.
         
         today_str = get_kst_today_str()
         os.makedirs('archive', exist_ok=True)
-        os.makedirs('images', exist_ok=True)
-
-        # --- 2. 보조 데이터 생성 (유가, 날씨, 리스크) ---
-        price_indicators = get_price_indicators(config)
-        weather_result = weather_service.create_dashboard_image(today_str)
-        price_chart_result = create_price_trend_chart(price_indicators.get("seven_day_data"), today_str) if price_indicators.get("seven_day_data") else None
-        
-        risk_events = risk_briefing_service.generate_risk_events()
-
 
-        # 띠별 운세 데이터 생성 및 가공 ---
-        zodiac_horoscopes = ai_service.generate_zodiac_horoscopes()
-        if zodiac_horoscopes:
-            zodiac_emojis = {'쥐': '🐭', '소': '🐮', '호랑이': '🐯', '토끼': '🐰', '용': '🐲', '뱀': '🐍', '말': '🐴', '양': '🐑', '원숭이': '🐵', '닭': '🐔', '개': '🐶', '돼지': '🐷'}
-            for item in zodiac_horoscopes:
-                item['emoji'] = zodiac_emojis.get(item['name'], '❓')
-        # ---
+        # --- 2. 보조 데이터 생성 (유가, 날씨, 리스크, 운세) ---
+        # 네트워크 대기가 대부분인 작업들이므로 뉴스 수집과 동시에 백그라운드에서 실행하고, 템플릿 렌더링 직전에 합류합니다.
+        aux_tasks = start_auxiliary_tasks(config, weather_service, risk_briefing_service, ai_service, today_str)
 
         # --- 3. 뉴스 데이터 수집 및 처리 ---
         previous_top_news = load_newsletter_history()
         
-        # ✨ [수정] 분리된 함수를 일간용 설정으로 순서대로 호출
-        candidate_articles = news_service.fetch_candidate_articles(
-            keywords=config.KEYWORD_GROUPS_DAILY, 
-            hours=config.NEWS_FETCH_HOURS_DAILY
-        )
-        all_news = news_service.process_articles(candidate_articles, driver_path)
+        # ✨ [수정] 분리된 함수를 일간용 설정으로 순서대로 호출 (각 단계 결과는 체크포인트로 저장)
+        candidate_articles = checkpoints.stage('candidates', lambda: [
+            {'title': entry['title'], 'link': entry['link']}
+            for entry in news_service.fetch_candidate_articles(
+                keywords=config.KEYWORD_GROUPS_DAILY, 
+                hours=config.NEWS_FETCH_HOURS_DAILY
+            )
+        ])
+        resolved_articles = checkpoints.stage('resolved', lambda: news_service.resolve_articles(candidate_articles, driver_locator.resolve()))
+        all_news = checkpoints.stage('processed', lambda: news_service.process_article_contents(resolved_articles, driver_locator.resolve()))
         
         if not all_news:
             print("ℹ️ 발송할 새로운 뉴스가 없습니다.")
         
-        top_news = ai_service.select_top_news(all_news, previous_top_news, count=config.SELECT_NEWS_COUNT_DAILY)
+        top_news = checkpoints.stage('selection', lambda: ai_service.select_top_news(all_news, previous_top_news, count=config.SELECT_NEWS_COUNT_DAILY))
         
         if not top_news:
             print("ℹ️ AI가 뉴스를 선별하지 못했습니다.")
 
-        ai_briefing_md = ai_service.generate_briefing(top_news, mode='daily')
+        ai_briefing_md = checkpoints.stage('briefing', lambda: ai_service.generate_briefing(top_news, mode='daily'))
         ai_briefing_html = markdown_to_html(ai_briefing_md)
         
         # --- 4. 템플릿에 전달할 최종 데이터 준비 ---
         title_text = "로디와 함께하는 오늘의 물류 산책"
-        if price_chart_result: price_indicators['price_chart_b64'] = price_chart_result['base64']
-        weather_dashboard_b64 = weather_result['base64'] if weather_result else None
+        price_indicators, weather_result, risk_events, zodiac_horoscopes, price_chart_result = join_auxiliary_tasks(aux_tasks)
+        if price_chart_result: price_indicators['price_chart'] = price_chart_result
+        weather_dashboard_tiles = weather_result.get('tiles', []) if weather_result else []
         
-        web_news_list = []
-        for news in top_news:
-            news_copy = news.copy()
-            if news_copy.get('image_data'):
-                news_copy['image_src'] = f"data:image/jpeg;base64,{base64.b64encode(news_copy['image_data']).decode('utf-8')}"
-            web_news_list.append(news_copy)
+        for i, news_item in enumerate(top_news):
+            if news_item.get('image_data'): news_item['image_cid'] = f'news_image_{i}'
 
         context = {
             "title": title_text,
@@ -926,30 +589,29 @@ def run_daily_newsletter(config, driver_path):
             "ai_briefing": ai_briefing_html,
             "risk_events": risk_events,               # 상세 리스크 목록
             "price_indicators": price_indicators,
-            "news_list": web_news_list,
-            "weather_dashboard_b64": weather_dashboard_b64,
-            "has_weather_dashboard": True if weather_dashboard_b64 else False,
+            "news_list": top_news,
+            "weather_dashboard_tiles": weather_dashboard_tiles,
+            "has_weather_dashboard": bool(weather_dashboard_tiles),
             "zodiac_horoscopes": zodiac_horoscopes
         }
         
         # --- 5. HTML 생성 및 이메일 발송 ---
-        web_html = render_html_template(context, target='web')
-        archive_filepath = f"archive/{today_str}.html"
-        with open(archive_filepath, 'w', encoding='utf-8') as f: f.write(web_html)
-        print(f"✅ 웹페이지 버전을 '{archive_filepath}'에 저장했습니다.")
+        # 웹/이메일 두 버전을 같은 컨텍스트로 한 번에 렌더링합니다.
+        # 웹 버전 이미지는 archive/assets/에 한 번만 저장하고 상대 경로로 참조합니다.
+        asset_store = ArchiveAssetStore(config)
+        with run_metrics.span('render'):
+            pages = template_engine.render_targets(context, asset_store=asset_store)
+        web_html, email_body = pages['web'], pages['email']
+        archive_filepath = Artifact(web_html.encode('utf-8'), f"{today_str}.html", 'text/html').write(config.ARCHIVE_DIR)
+        print(f"✅ 웹페이지 버전을 '{archive_filepath}'에 저장했습니다. (이미지 새로 저장 {asset_store.written}개 / 재사용 {asset_store.reused}개)")
 
-        for i, news_item in enumerate(top_news):
-            if news_item.get('image_data'): news_item['image_cid'] = f'news_image_{i}'
-        
-        context['news_list'] = top_news
-        email_body = render_html_template(context, target='email')
         email_subject = f"[{today_str}] {title_text}"
         
         images_to_embed = []
-        if price_chart_result and price_chart_result.get('filepath'):
-            images_to_embed.append({'path': price_chart_result['filepath'], 'cid': 'price_chart'})
-        if weather_result and weather_result.get('filepath'):
-            images_to_embed.append({'path': weather_result['filepath'], 'cid': 'weather_dashboard'})
+        if price_chart_result:
+            images_to_embed.append({'data': price_chart_result.data, 'cid': 'price_chart'})
+        for tile in weather_dashboard_tiles:
+            images_to_embed.append({'data': tile['artifact'].data, 'cid': tile['cid']})
         for news_item in top_news:
             if news_item.get('image_data') and news_item.get('image_cid'):
                 images_to_embed.append({'data': news_item['image_data'], 'cid': news_item['image_cid']})
@@ -963,14 +625,25 @@ def run_daily_newsletter(config, driver_path):
         fortune_char_path = "assets/fortunechar.png"
         if os.path.exists(fortune_char_path):
             images_to_embed.append({'path': fortune_char_path, 'cid': 'fortunechar.png'})    
+
+        # 같은 이미지는 하나로 합치고, PNG 재압축과 JPEG 품질 조정으로 메일 크기를 예산 안으로 줄입니다.
+        with run_metrics.span('image_budget'):
+            images_to_embed, email_body = ImageBudget(config).apply(images_to_embed, email_body)
         
-        email_service.send_email(email_subject, email_body, images_to_embed)
+        # 발송 후 단계에서 실패해 재개하더라도 같은 메일이 두 번 나가지 않도록 발송 완료를 기록합니다.
+        if checkpoints.has('sent'):
+            print(f"⏩ [{run_id}] 이메일은 이미 발송되어 건너뜁니다.")
+        else:
+            with run_metrics.span('send'):
+                email_service.send_email(email_subject, email_body, images_to_embed, delivery_key=f"daily-{today_str}")
+            checkpoints.save('sent', True)
         
         # --- 6. 상태 저장 및 마무리 ---
         if top_news:
             news_service.update_sent_links_log(top_news)
             save_newsletter_history(top_news)
-        update_archive_index()
+        update_archive_index(config, os.path.basename(archive_filepath), 'daily', title_text, len(top_news), today_str)
+        update_search_index(config, os.path.basename(archive_filepath), today_str, top_news)
 
         #주간 뉴스레터 후보군으로 오늘의 기사를 저장
         try:
@@ -997,14 +670,18 @@ def run_daily_newsletter(config, driver_path):
         except Exception as e:
             print(f"❌ 주간 후보 뉴스 저장 실패: {e}")
 
+        checkpoints.clear()
         print("\n🎉 일간 뉴스레터 프로세스가 성공적으로 완료되었습니다.")
     except Exception as e:
         import traceback
         traceback.print_exc()
         print(f"🔥 일간 뉴스레터 생성 중 치명적인 오류 발생: {e.__class__.__name__}: {e}")
+        print(f"ℹ️ 'python news_collector.py --resume {run_id}' 로 완료된 단계를 건너뛰고 이어서 실행할 수 있습니다.")
+    finally:
+        run_metrics.write_report(run_id, config.METRICS_DIR)
 
 
-def run_weekly_newsletter(config, driver_path):
+def run_weekly_newsletter(config):
     """주간 뉴스레터 생성의 모든 과정을 처리하는 함수"""
     print("🚀 주간 뉴스레터 생성을 시작합니다.")
     try:
@@ -1017,23 +694,10 @@ def run_weekly_newsletter(config, driver_path):
         
         week_str = get_kst_week_str()
         os.makedirs('archive', exist_ok=True)
-        os.makedirs('images', exist_ok=True)
-
-        # --- 2. 보조 데이터 생성 (유가, 날씨, 리스크) ---
-        price_indicators = get_price_indicators(config)
-        weather_result = weather_service.create_dashboard_image(week_str)
-        price_chart_result = create_price_trend_chart(price_indicators.get("seven_day_data"), week_str) if price_indicators.get("seven_day_data") else None
-        
-        risk_events = risk_briefing_service.generate_risk_events()
-
 
-        # ✨ [신규] 띠별 운세 데이터 생성 및 가공 ---
-        zodiac_horoscopes = ai_service.generate_zodiac_horoscopes()
-        if zodiac_horoscopes:
-            zodiac_emojis = {'쥐': '🐭', '소': '🐮', '호랑이': '🐯', '토끼': '🐰', '용': '🐲', '뱀': '🐍', '말': '🐴', '양': '🐑', '원숭이': '🐵', '닭': '🐔', '개': '🐶', '돼지': '🐷'}
-            for item in zodiac_horoscopes:
-                item['emoji'] = zodiac_emojis.get(item['name'], '❓')
-        # ---
+        # --- 2. 보조 데이터 생성 (유가, 날씨, 리스크, 운세) ---
+        # 네트워크 대기가 대부분인 작업들이므로 뉴스 수집과 동시에 백그라운드에서 실행하고, 템플릿 렌더링 직전에 합류합니다.
+        aux_tasks = start_auxiliary_tasks(config, weather_service, risk_briefing_service, ai_service, week_str, mode='weekly')
 
         all_news = []
         try:
@@ -1049,7 +713,7 @@ def run_weekly_newsletter(config, driver_path):
                 keywords=config.KEYWORD_GROUPS_WEEKLY, 
                 hours=config.NEWS_FETCH_HOURS_WEEKLY
             )
-            all_news = news_service.process_articles(candidate_articles, driver_path)
+            all_news = news_service.process_articles(candidate_articles, ChromeDriverLocator(config).resolve())
 
         # ✨ [신규] 파일에서 불러온 Base64 이미지 데이터를 원래의 bytes 형태로 복원합니다.
         for news in all_news:
@@ -1069,15 +733,12 @@ def run_weekly_newsletter(config, driver_path):
         
         # --- 4. 템플릿에 전달할 최종 데이터 준비 ---
         title_text = "로디와 함께하는 주간 물류 산책"
-        if price_chart_result: price_indicators['price_chart_b64'] = price_chart_result['base64']
-        weather_dashboard_b64 = weather_result['base64'] if weather_result else None
+        price_indicators, weather_result, risk_events, zodiac_horoscopes, price_chart_result = join_auxiliary_tasks(aux_tasks)
+        if price_chart_result: price_indicators['price_chart'] = price_chart_result
+        weather_dashboard_tiles = weather_result.get('tiles', []) if weather_result else []
         
-        web_news_list = []
-        for news in top_news:
-            news_copy = news.copy()
-            if news_copy.get('image_data'):
-                news_copy['image_src'] = f"data:image/jpeg;base64,{base64.b64encode(news_copy['image_data']).decode('utf-8')}"
-            web_news_list.append(news_copy)
+        for i, news_item in enumerate(top_news):
+            if news_item.get('image_data'): news_item['image_cid'] = f'news_image_{i}'
 
         context = {
             "title": title_text,
@@ -1086,30 +747,31 @@ def run_weekly_newsletter(config, driver_path):
             "ai_briefing": ai_briefing_html,
             "risk_events": risk_events,              
             "price_indicators": price_indicators,
-            "news_list": web_news_list,
-            "weather_dashboard_b64": weather_dashboard_b64,
-            "has_weather_dashboard": True if weather_dashboard_b64 else False,
+            "news_list": top_news,
+            "weather_dashboard_tiles": weather_dashboard_tiles,
+            "has_weather_dashboard": bool(weather_dashboard_tiles),
             "zodiac_horoscopes": zodiac_horoscopes
         }
         
         # --- 5. HTML 생성 및 이메일 발송 ---
-        web_html = render_html_template(context, target='web')
-        archive_filepath = f"archive/{week_str}.html"
-        with open(archive_filepath, 'w', encoding='utf-8') as f: f.write(web_html)
-        print(f"✅ 웹페이지 버전을 '{archive_filepath}'에 저장했습니다.")
+        # 웹/이메일 두 버전을 같은 컨텍스트로 한 번에 렌더링합니다.
+        # 웹 버전 이미지는 archive/assets/에 한 번만 저장하고 상대 경로로 참조합니다.
+        asset_store = ArchiveAssetStore(config)
+        with run_metrics.span('render'):
+            pages = template_engine.render_targets(context, asset_store=asset_store)
+        web_html, email_body = pages['web'], pages['email']
+        archive_filepath = Artifact(web_html.encode('utf-8'), f"{week_str}.html", 'text/html').write(config.ARCHIVE_DIR)
+        print(f"✅ 웹페이지 버전을 '{archive_filepath}'에 저장했습니다. (이미지 새로 저장 {asset_store.written}개 / 재사용 {asset_store.reused}개)")
 
-        for i, news_item in enumerate(top_news):
-            if news_item.get('image_data'): news_item['image_cid'] = f'news_image_{i}'
-        
-        context['news_list'] = top_news
-        email_body = render_html_template(context, target='email')
         email_subject = f"[{week_str}] {title_text} 요약"
         
         images_to_embed = []
-        if price_chart_result and price_chart_result.get('filepath'):
-            images_to_embed.append({'path': price_chart_result['filepath'], 'cid': 'price_chart'})
-        if weather_result and weather_result.get('filepath'):
-            images_to_embed.append({'path': weather_result['filepath'], 'cid': 'weather_dashboard'})
+        if price_chart_result:
+            images_to_embed.append({'data': price_chart_result.data, 'cid': 'price_chart'})
+        if price_indicators.get('regional_chart'):
+            images_to_embed.append({'data': price_indicators['regional_chart'].data, 'cid': 'regional_price_chart'})
+        for tile in weather_dashboard_tiles:
+            images_to_embed.append({'data': tile['artifact'].data, 'cid': tile['cid']})
         for news_item in top_news:
             if news_item.get('image_data') and news_item.get('image_cid'):
                 images_to_embed.append({'data': news_item['image_data'], 'cid': news_item['image_cid']})
@@ -1125,14 +787,20 @@ def run_weekly_newsletter(config, driver_path):
         fortune_char_path = "assets/fortunechar.png"
         if os.path.exists(fortune_char_path):
             images_to_embed.append({'path': fortune_char_path, 'cid': 'fortunechar.png'})        
+
+        # 같은 이미지는 하나로 합치고, PNG 재압축과 JPEG 품질 조정으로 메일 크기를 예산 안으로 줄입니다.
+        with run_metrics.span('image_budget'):
+            images_to_embed, email_body = ImageBudget(config).apply(images_to_embed, email_body)
         
-        email_service.send_email(email_subject, email_body, images_to_embed)
+        with run_metrics.span('send'):
+            email_service.send_email(email_subject, email_body, images_to_embed, delivery_key=f"weekly-{get_kst_today_str()}")
         
         # --- 6. 상태 저장 및 마무리 ---
         if top_news:
             news_service.update_sent_links_log(top_news)
             save_newsletter_history(top_news, filepath='previous_weekly_newsletter.json')
-        update_archive_index()
+        update_archive_index(config, os.path.basename(archive_filepath), 'weekly', title_text, len(top_news), get_kst_today_str())
+        update_search_index(config, os.path.basename(archive_filepath), get_kst_today_str(), top_news)
 
         try:
             with open(config.WEEKLY_CANDIDATES_FILE, 'w', encoding='utf-8') as f:
@@ -1146,24 +814,22 @@ def run_weekly_newsletter(config, driver_path):
         import traceback
         traceback.print_exc()
         print(f"🔥 주간 뉴스레터 생성 중 치명적인 오류 발생: {e.__class__.__name__}: {e}")
+    finally:
+        run_metrics.write_report(f"weekly-{get_kst_today_str()}", config.METRICS_DIR)
 
 
-def main():
-    """실행 모드에 따라 적절한 뉴스레터 생성 함수를 호출하는 컨트롤러"""
-    print("-> Chrome 드라이버를 준비합니다...")
-    try:
-        driver_path = ChromeDriverManager().install()
-        print(f"✅ 드라이버 준비 완료: {driver_path}")
-    except Exception as e:
-        print(f"🔥 치명적인 오류 발생: Chrome 드라이버를 준비할 수 없습니다. {e}")
-        return
+def main(resume=False, run_id=None):
+    """실행 모드에 따라 적절한 뉴스레터 생성 함수를 호출하는 컨트롤러
 
+    Chrome 드라이버는 기사 처리 단계가 시작될 때 ChromeDriverLocator로 찾으므로,
+    여기서는 준비하지 않습니다. (체크포인트 재개나 주간 후보 파일 사용 시 브라우저 불필요)
+    """
     config = Config()
     
     if config.EXECUTION_MODE == 'weekly':
-        run_weekly_newsletter(config, driver_path)
+        run_weekly_newsletter(config)
     elif config.EXECUTION_MODE == 'daily':
-        run_daily_newsletter(config, driver_path)
+        run_daily_newsletter(config, run_id=run_id, resume=resume)
     else:
         print(f"❌ 알 수 없는 실행 모드입니다: '{config.EXECUTION_MODE}'. 'daily' 또는 'weekly'로 설정해주세요.")
 
@@ -1174,14 +840,16 @@ def main_for_chart_test():
         # --- 1. 필요한 객체 및 폴더 준비 ---
         config = Config()
         today_str = get_kst_today_str()
-        os.makedirs('images', exist_ok=True)
 
         # --- 2. 유가 데이터 수집 ---
         price_indicators = get_price_indicators(config)
         
         # --- 3. 차트 생성 (테스트 핵심) ---
-        if price_indicators.get("seven_day_data"):
-            create_price_trend_chart(price_indicators["seven_day_data"], today_str)
+        chart_result = create_price_trend_chart(price_indicators.get("seven_day_data"))
+        if chart_result:
+            # 실제 실행에서는 메모리에서 바로 첨부하지만, 테스트에서는 눈으로 확인할 수 있도록 파일로 남깁니다.
+            chart_result.name = f"price_chart_{today_str}.png"
+            print(f"-> '{chart_result.write('images')}'에 저장했습니다.")
         else:
             print("❌ 차트를 생성하는 데 필요한 7일간의 유가 데이터를 가져오지 못했습니다.")
 
@@ -1234,26 +902,28 @@ def test_image_rendering():
         # --- 1. 테스트에 필요한 기본 객체 및 폴더 준비 ---
         config = Config()
         today_str = get_kst_today_str()
-        os.makedirs('images', exist_ok=True)
         email_service = EmailService(config)
 
         # --- 2. 동적 이미지 생성 (날씨 대시보드, 유가 차트) ---
         weather_service = WeatherService(config)
         weather_result = weather_service.create_dashboard_image(today_str)
-        price_chart_result = create_price_trend_chart({
+        # 누적 유가 이력이 있으면 API 호출 없이 그 데이터를, 없으면 샘플 데이터를 사용합니다.
+        chart_data = PriceHistoryStore(config).get_chart_data(days=7) or {
             "gasoline": [{"DATE": f"202509{d:02d}", "PRICE": str(1750+d)} for d in range(10, 17)],
             "diesel": [{"DATE": f"202509{d:02d}", "PRICE": str(1650+d)} for d in range(10, 17)]
-        }, today_str)
+        }
+        price_chart_result = create_price_trend_chart(chart_data)
         print("✅ (테스트) 동적 이미지 생성 완료")
         
         # --- 3. 웹페이지용 HTML 렌더링 및 저장 ---
-        sample_news_image_b64 = image_to_base64_string('assets/fortunechar.png')
+        sample_news_image = Artifact.from_file('assets/fortunechar.png')
+        weather_dashboard_tiles = weather_result.get('tiles', []) if weather_result else []
         web_context = {
             "title": "이미지 렌더링 테스트 (웹)", "today_date": today_str, "target": "web",
             "has_weather_dashboard": True,
-            "weather_dashboard_b64": weather_result['base64'] if weather_result else None,
-            "price_indicators": {'price_chart_b64': price_chart_result['base64']} if price_chart_result else {},
-            "news_list": [{'title': '[샘플 뉴스]','link': '#','ai_summary': '웹용 이미지 테스트','image_src': f"data:image/png;base64,{sample_news_image_b64}"}],
+            "weather_dashboard_tiles": weather_dashboard_tiles,
+            "price_indicators": {'price_chart': price_chart_result} if price_chart_result else {},
+            "news_list": [{'title': '[샘플 뉴스]','link': '#','ai_summary': '웹용 이미지 테스트','image_src': sample_news_image.data_uri}],
             "zodiac_horoscopes": []
         }
         web_html = render_html_template(web_context, target='web')
@@ -1268,8 +938,9 @@ def test_image_rendering():
         email_context = {
             "title": "이미지 렌더링 테스트 (이메일)", "today_date": today_str, "target": "email",
             "has_weather_dashboard": True,
-            "weather_dashboard_b64": None, "price_indicators": {}, # cid를 사용하므로 b64 데이터는 불필요
-            "news_list": [{'title': '[샘플 뉴스]','link': '#','ai_summary': '이메일용 이미지 테스트','image_data': base64.b64decode(sample_news_image_b64), 'image_cid': 'sample_news_image_0'}],
+            "price_indicators": {}, # cid를 사용하므로 이미지 데이터는 불필요
+            "weather_dashboard_tiles": weather_dashboard_tiles,
+            "news_list": [{'title': '[샘플 뉴스]','link': '#','ai_summary': '이메일용 이미지 테스트','image_data': sample_news_image.data, 'image_cid': 'sample_news_image_0'}],
             "zodiac_horoscopes": []
         }
         email_body = render_html_template(email_context, target='email')
@@ -1278,9 +949,10 @@ def test_image_rendering():
         images_to_embed = []
         if os.path.exists('assets/logicharacter.png'): images_to_embed.append({'path': 'assets/logicharacter.png', 'cid': 'newsletter_banner'})
         if os.path.exists('assets/fortunechar.png'): images_to_embed.append({'path': 'assets/fortunechar.png', 'cid': 'fortunechar.png'})
-        if weather_result: images_to_embed.append({'path': weather_result['filepath'], 'cid': 'weather_dashboard'})
-        if price_chart_result: images_to_embed.append({'path': price_chart_result['filepath'], 'cid': 'price_chart'})
-        images_to_embed.append({'data': base64.b64decode(sample_news_image_b64), 'cid': 'sample_news_image_0'})
+        for tile in weather_dashboard_tiles: images_to_embed.append({'data': tile['artifact'].data, 'cid': tile['cid']})
+        if price_chart_result: images_to_embed.append({'data': price_chart_result.data, 'cid': 'price_chart'})
+        images_to_embed.append({'data': sample_news_image.data, 'cid': 'sample_news_image_0'})
+        images_to_embed, email_body = ImageBudget(config).apply(images_to_embed, email_body)
 
         # (C) 이메일 발송 (데일리 수신자에게)
         email_subject = "[이미지 테스트] 뉴스레터"
@@ -1304,6 +976,9 @@ if __name__ == "__main__":
             test_image_rendering()
         elif mode == 'test_horoscope':
             main_for_horoscope_test()
+        elif mode == '--resume':
+            # 예: python news_collector.py --resume [daily-2025-10-19]
+            main(resume=True, run_id=sys.argv[2] if len(sys.argv) > 2 else None)
         else:
             # 기본 main() 실행 또는 다른 인자 처리
             main()
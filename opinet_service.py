@@ -0,0 +1,182 @@
+# opinet_service.py
+
+import os
+import json
+import time
+import codecs
+import threading
+import requests
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import Config
+
+
+def iter_json_array_items(chunks, key='OIL'):
+    """JSON 응답 청크를 순서대로 읽으면서 key 배열의 원소를 하나씩 파싱해 반환합니다.
+
+    전체 응답 텍스트를 한 번에 json.loads 하지 않으므로, 주유소 목록처럼 큰 배열도
+    원소 하나 분량의 메모리만 사용해 집계할 수 있습니다.
+    key가 없는 응답(오류/쿼터 메시지)이나 배열이 닫히기 전에 끊긴 응답은 ValueError를 발생시킵니다.
+    """
+    decoder = json.JSONDecoder(strict=False) # 오피넷 응답에는 제어 문자가 섞여 있는 경우가 있음
+    text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    marker = f'"{key}"'
+    buffer, in_array, head = '', False, ''
+
+    for chunk in chunks:
+        text = text_decoder.decode(chunk)
+        buffer += text
+        if not in_array:
+            head = (head + text)[:200] # 배열을 찾지 못했을 때 오류 메시지에 보여줄 응답 앞부분
+            marker_idx = buffer.find(marker)
+            if marker_idx == -1:
+                buffer = buffer[-len(marker):]
+                continue
+            bracket_idx = buffer.find('[', marker_idx + len(marker))
+            if bracket_idx == -1:
+                buffer = buffer[marker_idx:]
+                continue
+            buffer, in_array = buffer[bracket_idx + 1:], True
+
+        while True:
+            buffer = buffer.lstrip(' \t\r\n,')
+            if not buffer:
+                break
+            if buffer[0] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break # 원소가 아직 다 도착하지 않았으므로 다음 청크를 기다립니다.
+            yield item
+            buffer = buffer[end:]
+
+    if not in_array:
+        raise ValueError(f"응답에서 {key} 배열을 찾지 못했습니다: {head!r}")
+    raise ValueError(f"{key} 배열이 닫히기 전에 응답이 끝났습니다.")
+
+
+class OpinetService:
+    """커넥션 풀을 재사용하고 요청 간격을 제한하면서 오피넷 API를 호출하는 클라이언트입니다."""
+
+    BASE_URL = "http://www.opinet.co.kr/api"
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.max_workers = max(1, config.OPINET_MAX_CONCURRENCY)
+        self.session = self._create_session()
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def _create_session(self):
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _wait_for_rate_limit(self):
+        """요청 시작 간격이 OPINET_MIN_REQUEST_INTERVAL 초 이상 벌어지도록 대기합니다."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.config.OPINET_MIN_REQUEST_INTERVAL
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def iter_oil_items(self, endpoint, **params):
+        """엔드포인트를 호출하여 RESULT.OIL 배열의 원소를 스트리밍으로 반환합니다."""
+        self._wait_for_rate_limit()
+        query = {'out': 'json', 'code': self.config.OPINET_API_KEY, **params}
+        with self.session.get(f"{self.BASE_URL}/{endpoint}", params=query, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            yield from iter_json_array_items(response.iter_content(chunk_size=16 * 1024), key='OIL')
+
+    def _cache_path(self, endpoint, area):
+        name = endpoint.replace('.do', '')
+        return os.path.join(self.config.OPINET_CACHE_DIR, f"{name}_{area or 'all'}.json")
+
+    @staticmethod
+    def _is_cacheable(data):
+        """빈 OIL 목록이나 재고 주유소가 0곳인 요소수 집계는 일시적인 오류일 수 있으므로 캐시하지 않습니다."""
+        if isinstance(data, dict):
+            return data.get('stock_count', 0) > 0
+        return bool(data)
+
+    def _cached(self, endpoint, area, fetch):
+        """(엔드포인트, 지역) 단위로 응답을 로컬 캐시에 저장하고, TTL 이내의 같은 날(KST) 캐시가 있으면 재사용합니다."""
+        path = self._cache_path(endpoint, area)
+        today_str = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            age = time.time() - cached['fetched_at']
+            if cached.get('kst_date') == today_str and age < self.config.OPINET_CACHE_TTL_SECONDS:
+                print(f"   ㄴ 오피넷 캐시 사용: {endpoint} ({area or '전국'}, {age / 60:.0f}분 전 조회)")
+                return cached['data']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            pass
+
+        data = fetch() # 응답이 불완전하면 예외가 발생하므로 캐시에 기록되지 않습니다.
+        if not self._is_cacheable(data):
+            print(f"   ㄴ 오피넷 응답이 비어 있어 캐시하지 않습니다: {endpoint} ({area or '전국'})")
+            return data
+        try:
+            os.makedirs(self.config.OPINET_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'kst_date': today_str, 'data': data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ 오피넷 응답 캐시 저장 실패: {e}")
+        return data
+
+    def fetch_oil_items(self, endpoint, **params):
+        return self._cached(endpoint, params.get('area'), lambda: list(self.iter_oil_items(endpoint, **params)))
+
+    def fetch_urea_summary(self, area_code):
+        """지역의 요소수 재고 보유 주유소 가격 합계와 개수를 조회합니다. (캐시 우선)"""
+        return self._cached('ureaPrice.do', area_code, lambda: self._aggregate_urea(area_code))
+
+    def _aggregate_urea(self, area_code):
+        """지역의 요소수 재고 보유 주유소 가격 합계와 개수를 스트리밍으로 집계합니다."""
+        total_price, stock_count = 0, 0
+        for station in self.iter_oil_items('ureaPrice.do', area=area_code):
+            stock_yn = (station.get('STOCK_YN') or '').strip()
+            price_str = (station.get('PRICE') or '').strip()
+            if stock_yn == 'Y' and price_str:
+                total_price += int(price_str)
+                stock_count += 1
+        return {'total_price': total_price, 'stock_count': stock_count}
+
+    def fetch_price_data(self, area_codes):
+        """시도별 유가, 최근 7일 전국 유가, 지역별 요소수 집계를 동시에 조회합니다.
+
+        반환값: {'sido': [...] 또는 None, 'recent': [...] 또는 None, 'urea': {지역코드: 집계 또는 None}}
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='opinet') as executor:
+            sido_future = executor.submit(self.fetch_oil_items, 'avgSidoPrice.do')
+            recent_future = executor.submit(self.fetch_oil_items, 'avgRecentPrice.do')
+            urea_futures = {code: executor.submit(self.fetch_urea_summary, code) for code in area_codes}
+
+            result = {'sido': None, 'recent': None, 'urea': {}}
+            try:
+                result['sido'] = sido_future.result()
+            except Exception as e:
+                print(f"❌ 시도별 유가 정보 조회 실패: {e}")
+            try:
+                result['recent'] = recent_future.result()
+            except Exception as e:
+                print(f"❌ 유가 추세 정보 조회 실패: {e}")
+            for area_code, future in urea_futures.items():
+                try:
+                    result['urea'][area_code] = future.result()
+                except Exception as e:
+                    area_name = self.config.AREA_CODE_MAP.get(area_code, "알 수 없는 지역")
+                    print(f"❌ {area_name} 요소수 가격 조회 실패: {e}")
+                    result['urea'][area_code] = None
+        return result
@@ -0,0 +1,163 @@
+# price_analytics.py
+
+import warnings
+from price_history import NATIONAL_AREA_CODE
+
+PRODUCT_CODES = {'gasoline': 'B027', 'diesel': 'D047'}
+PRODUCT_NAMES = {'gasoline': '휘발유', 'diesel': '경유'}
+SHORT_WINDOW = 7   # 단기 이동평균 / 주간 변화 기준 일수
+LONG_WINDOW = 28   # 장기 이동평균 / 변동성 계산 기간
+MONTH_DAYS = 30    # 월간 변화 기준 일수
+
+
+def _parse_dates(date_strs):
+    import numpy as np
+    return np.array([f"{d[:4]}-{d[4:6]}-{d[6:8]}" for d in date_strs], dtype='datetime64[D]')
+
+
+def _forward_fill(prices):
+    """마지막 축(날짜) 방향으로 빈 날(NaN)을 직전 값으로 채웁니다. 첫 관측 이전은 NaN으로 둡니다."""
+    import numpy as np
+    day_index = np.where(np.isnan(prices), 0, np.arange(prices.shape[-1]))
+    np.maximum.accumulate(day_index, axis=-1, out=day_index)
+    return np.take_along_axis(prices, day_index, axis=-1)
+
+
+def _moving_average(prices, window):
+    """누적합으로 구한 후행 이동평균. 창 안에 빈 값이 있으면 NaN입니다."""
+    import numpy as np
+    valid = ~np.isnan(prices)
+    pad = np.zeros(prices.shape[:-1] + (1,))
+    sums = np.concatenate([pad, np.cumsum(np.where(valid, prices, 0.0), axis=-1)], axis=-1)
+    counts = np.concatenate([pad, np.cumsum(valid, axis=-1)], axis=-1)
+    result = np.full(prices.shape, np.nan)
+    if prices.shape[-1] >= window:
+        window_sums = sums[..., window:] - sums[..., :-window]
+        window_counts = counts[..., window:] - counts[..., :-window]
+        result[..., window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+    return result
+
+
+class PriceAnalytics:
+    """누적 유가 이력 전체를 (유종, 지역, 날짜) 3차원 배열로 만들어 추세 지표를 한 번에 계산합니다.
+
+    이동평균(7일/28일), 주간·월간 변화, 일간 변동성(28일 표준편차), 전국 대비 지역별 가격 차이를
+    모든 유종과 지역에 대해 NumPy 연산 한 번으로 구하므로 이력이 몇 년 치로 늘어나도
+    지역 수만큼 반복해 계산하지 않습니다. 값을 받지 못한 날은 직전 값으로 채웁니다.
+    """
+
+    def __init__(self, dates, areas, prices):
+        import numpy as np
+        self.dates = dates   # ['YYYYMMDD', ...] (빈 날 없이 연속)
+        self.areas = areas   # [지역코드, ...] (첫 번째가 전국)
+        self.prices = prices # shape (유종, 지역, 날짜)
+
+        latest = prices[..., -1]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning) # 이력이 없는 지역의 전부 NaN 구간
+            self.metrics = {
+                'latest': latest,
+                'ma_short': _moving_average(prices, SHORT_WINDOW)[..., -1],
+                'ma_long': _moving_average(prices, LONG_WINDOW)[..., -1],
+                'day_delta': self._delta(prices, 1),
+                'week_delta': self._delta(prices, SHORT_WINDOW),
+                'month_delta': self._delta(prices, MONTH_DAYS),
+                'volatility': np.nanstd(np.diff(prices[..., -(LONG_WINDOW + 1):], axis=-1), axis=-1),
+                'spread': latest - latest[:, :1], # 전국 평균 대비 차이
+            }
+
+    @staticmethod
+    def _delta(prices, days):
+        import numpy as np
+        if prices.shape[-1] <= days:
+            return np.full(prices.shape[:-1], np.nan)
+        return prices[..., -1] - prices[..., -1 - days]
+
+    @classmethod
+    def from_records(cls, records, areas):
+        """PriceHistoryStore.load() 결과({(date, area, product): price})로 분석합니다. 이력이 없으면 None."""
+        import numpy as np
+        areas = [NATIONAL_AREA_CODE] + [area for area in areas if area != NATIONAL_AREA_CODE]
+        area_index = {area: i for i, area in enumerate(areas)}
+        product_index = {code: i for i, code in enumerate(PRODUCT_CODES.values())}
+
+        rows = [(date_str, area_index[area], product_index[product], price)
+                for (date_str, area, product), price in records.items()
+                if area in area_index and product in product_index]
+        if not rows:
+            return None
+        date_strs, area_ids, product_ids, values = zip(*rows)
+        days = _parse_dates(date_strs)
+        start = days.min()
+        day_ids = (days - start).astype(int)
+
+        prices = np.full((len(product_index), len(areas), day_ids.max() + 1), np.nan)
+        prices[np.array(product_ids), np.array(area_ids), day_ids] = values
+        all_days = np.arange(start, start + prices.shape[-1])
+        dates = [str(day).replace('-', '') for day in all_days]
+        return cls(dates, areas, _forward_fill(prices))
+
+    def metric(self, name, product, area=NATIONAL_AREA_CODE):
+        """지표 값을 float로 반환합니다. 계산할 수 없으면 None."""
+        value = self.metrics[name][list(PRODUCT_CODES).index(product), self.areas.index(area)]
+        return None if value != value else float(value) # NaN 확인
+
+    def series(self, product, area=NATIONAL_AREA_CODE, days=None):
+        """기존 차트 데이터와 같은 [{'DATE', 'PRICE'}] 형태로 날짜순 시계열을 반환합니다. 빈 날은 제외합니다."""
+        values = self.prices[list(PRODUCT_CODES).index(product), self.areas.index(area)]
+        dates = self.dates
+        if days:
+            values, dates = values[-days:], dates[-days:]
+        return [{'DATE': date_str, 'PRICE': f"{price:.2f}"} for date_str, price in zip(dates, values.tolist()) if price == price]
+
+    def regional_series(self, product, days, area_names):
+        """다중 시계열 차트용 {지역명: 시계열}을 반환합니다. 전국 외에 두 지역 이상의 이력이 days 기간에 모두 있어야 합니다."""
+        import numpy as np
+        window = self.prices[list(PRODUCT_CODES).index(product), :, -days:]
+        complete = ~np.isnan(window).any(axis=-1)
+        if window.shape[-1] < 2 or not complete[0] or complete[1:].sum() < 2:
+            return None
+        return {area_names.get(area, area): self.series(product, area, days)
+                for area, ok in zip(self.areas, complete.tolist()) if ok}
+
+    def trend_comment(self, product, area_names):
+        """전국 가격의 일간/주간/월간 변화, 장기 이동평균, 지역별 가격 차이를 한국어 문장으로 요약합니다."""
+        latest = self.metric('latest', product)
+        if latest is None:
+            return ""
+        sentences = []
+
+        day_delta = self.metric('day_delta', product)
+        opening = f"전국 {PRODUCT_NAMES[product]} 가격은 {latest:,.0f}원으로"
+        if day_delta is None: sentences.append(f"{opening} 집계되었습니다.")
+        elif day_delta > 0: sentences.append(f"{opening} 어제보다 {day_delta:,.0f}원 올랐습니다.")
+        elif day_delta < 0: sentences.append(f"{opening} 어제보다 {-day_delta:,.0f}원 내렸습니다.")
+        else: sentences.append(f"{opening} 어제와 같습니다.")
+
+        changes = []
+        for name, label in (('week_delta', '1주 전'), ('month_delta', '한 달 전')):
+            delta = self.metric(name, product)
+            if delta is None:
+                continue
+            if round(delta) == 0: changes.append(f"{label}과 같고")
+            else: changes.append(f"{label}보다 {abs(delta):,.0f}원 {'높' if delta > 0 else '낮'}고")
+        ma_long = self.metric('ma_long', product)
+        if ma_long is not None:
+            position = '웃돌고' if latest > ma_long else '밑돌고' if latest < ma_long else '같은 수준에'
+            changes.append(f"{LONG_WINDOW}일 평균({ma_long:,.0f}원)을 {position} 있습니다")
+        if changes:
+            if not changes[-1].endswith('있습니다'):
+                changes[-1] = changes[-1][:-1] + '습니다'
+            sentences.append(", ".join(changes) + ".")
+        volatility = self.metric('volatility', product)
+        if ma_long is not None and volatility is not None:
+            sentences.append(f"최근 {LONG_WINDOW}일 하루 변동폭은 ±{volatility:,.1f}원 수준입니다.")
+
+        regional = [(self.metric('latest', product, area), area) for area in self.areas[1:]]
+        regional = [(price, area) for price, area in regional if price is not None]
+        if len(regional) >= 2:
+            (low, low_area), (high, high_area) = min(regional), max(regional)
+            if high > low:
+                sentences.append(f"지역별 최고가는 {area_names.get(high_area, high_area)} {high:,.0f}원, "
+                                 f"최저가는 {area_names.get(low_area, low_area)} {low:,.0f}원으로 {high - low:,.0f}원 차이입니다.")
+        return " ".join(sentences)
@@ -0,0 +1,149 @@
+# price_chart.py
+
+import os
+import platform
+from io import BytesIO
+from functools import lru_cache
+from artifacts import Artifact
+
+CHART_SIZE_INCHES = (8, 5)
+CHART_DPI = 150
+SERIES_STYLES = (
+    ('gasoline', '휘발유', '#3498db', '#005a9c'),
+    ('diesel', '경유', '#e74c3c', '#a8382c'),
+)
+REGION_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#17becf')
+FONT_CANDIDATES = {
+    'Windows': ['C:/Windows/Fonts/malgun.ttf'],
+    'Darwin': ['/System/Library/Fonts/Supplemental/AppleGothic.ttf', '/Library/Fonts/AppleGothic.ttf'],
+}
+DEFAULT_FONT_CANDIDATES = [
+    'assets/NanumGothic.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    'assets/NanumGothicBold.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+]
+
+
+@lru_cache(maxsize=1)
+def load_font_properties():
+    """한글 폰트 파일을 FontProperties로 한 번만 불러옵니다. 폰트가 없으면 None(기본 폰트)을 반환합니다.
+
+    폰트 파일 경로를 직접 지정하므로 Matplotlib 폰트 목록(fontManager.ttflist)을 뒤지거나
+    폰트 캐시를 재생성할 필요가 없습니다.
+    """
+    from matplotlib.font_manager import FontProperties
+    for path in FONT_CANDIDATES.get(platform.system(), []) + DEFAULT_FONT_CANDIDATES:
+        if os.path.exists(path):
+            return FontProperties(fname=path)
+    print("⚠️ 한글 폰트 파일이 없어 기본 폰트로 출력됩니다.")
+    return None
+
+
+def _font(size, weight='normal'):
+    from matplotlib.font_manager import FontProperties
+    base_font = load_font_properties()
+    font = base_font.copy() if base_font else FontProperties()
+    font.set_size(size)
+    font.set_weight(weight)
+    return font
+
+
+def render_price_chart(series_data, title="최근 7일 유가 추이"):
+    """유가 시계열({'gasoline': [{'DATE', 'PRICE'}], 'diesel': [...]})을 PNG 바이트로 그립니다.
+
+    pyplot 상태 머신 대신 Figure와 Agg 캔버스를 직접 사용하고, 전역 rcParams를 바꾸지 않으므로
+    다른 스레드(보조 작업 그래프)에서 그려도 안전합니다.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    dates = [d['DATE'][-4:-2] + "/" + d['DATE'][-2:] for d in series_data['gasoline']]
+    fig = Figure(figsize=CHART_SIZE_INCHES)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    label_step = max(1, len(dates) // 7) # 날짜가 많으면 x축 라벨과 가격 텍스트를 일정 간격으로만 표시합니다.
+    for key, label, line_color, text_color in SERIES_STYLES:
+        prices = [float(p['PRICE']) for p in series_data.get(key, [])]
+        if not prices:
+            continue
+        ax.plot(range(len(prices)), prices, 'o-', label=label, color=line_color, linewidth=2)
+        for i, price in enumerate(prices):
+            if i % label_step == 0 or i == len(prices) - 1:
+                ax.text(i, price + 5, f'{int(price):,}', ha='center', va='bottom', fontproperties=_font(9), color=text_color)
+
+    return _finish_chart(fig, ax, dates, label_step, title)
+
+
+def _finish_chart(fig, ax, dates, label_step, title):
+    """제목, 범례, 축 라벨을 한글 폰트로 정리하고 PNG 바이트로 저장합니다."""
+    ax.set_title(title, fontproperties=_font(16, 'bold'), pad=20)
+    ax.legend(prop=_font(10))
+    ax.grid(True, which='both', linestyle=':', linewidth=0.7)
+
+    ax.set_xticks(range(0, len(dates), label_step))
+    ax.set_xticklabels(dates[::label_step], fontproperties=_font(10))
+    # Y축 범위를 살짝 늘려서 위쪽 텍스트가 잘리지 않도록 하고, 눈금 라벨('1,700원')에도 한글 폰트를 지정합니다.
+    ymin, ymax = ax.get_ylim()
+    ax.set_ylim(ymin, ymax * 1.05)
+    yticks = [tick for tick in ax.get_yticks() if ymin <= tick <= ymax * 1.05]
+    ax.set_yticks(yticks)
+    ax.set_yticklabels([f'{int(tick):,}원' for tick in yticks], fontproperties=_font(10))
+
+    fig.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=CHART_DPI)
+    return buffer.getvalue()
+
+
+def render_regional_price_chart(series_by_label, title="지역별 경유 가격 추이"):
+    """여러 지역의 시계열({'전국': [{'DATE', 'PRICE'}], '서울': [...], ...})을 한 차트에 그립니다.
+
+    첫 번째 시계열(전국 평균)은 굵은 점선으로 그리고, 선이 많으므로 가격 텍스트는 각 선의 마지막 값만 표시합니다.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    labels = list(series_by_label)
+    dates = [d['DATE'][-4:-2] + "/" + d['DATE'][-2:] for d in series_by_label[labels[0]]]
+    fig = Figure(figsize=CHART_SIZE_INCHES)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    for i, label in enumerate(labels):
+        prices = [float(p['PRICE']) for p in series_by_label[label]]
+        if i == 0:
+            ax.plot(range(len(prices)), prices, '--', label=label, color='#333333', linewidth=2.5)
+        else:
+            color = REGION_COLORS[(i - 1) % len(REGION_COLORS)]
+            ax.plot(range(len(prices)), prices, '-', label=label, color=color, linewidth=1.5)
+            ax.text(len(prices) - 1, prices[-1], f' {int(prices[-1]):,}', va='center', fontproperties=_font(8), color=color)
+
+    return _finish_chart(fig, ax, dates, max(1, len(dates) // 7), title)
+
+
+def create_price_trend_chart(series_data, title="최근 7일 유가 추이"):
+    """차트를 그려 PNG Artifact로 반환합니다. 실패하면 None."""
+    if not series_data:
+        return None
+    try:
+        chart = Artifact(render_price_chart(series_data, title), 'price_chart.png', 'image/png')
+        print(f"✅ 유가 추이 차트를 생성했습니다. ({chart.size / 1024:.0f}KB)")
+        return chart
+    except Exception as e:
+        print(f"❌ 차트 이미지 생성 실패: {e}")
+        return None
+
+
+def create_regional_price_chart(series_by_label, title="지역별 경유 가격 추이"):
+    """지역별 다중 시계열 차트를 PNG Artifact로 반환합니다. 데이터가 없거나 실패하면 None."""
+    if not series_by_label:
+        return None
+    try:
+        chart = Artifact(render_regional_price_chart(series_by_label, title), 'regional_price_chart.png', 'image/png')
+        print(f"✅ 지역별 유가 차트를 생성했습니다. ({chart.size / 1024:.0f}KB)")
+        return chart
+    except Exception as e:
+        print(f"❌ 지역별 유가 차트 생성 실패: {e}")
+        return None
@@ -0,0 +1,106 @@
+# price_history.py
+
+import os
+import csv
+from config import Config
+
+NATIONAL_AREA_CODE = '00' # 전국 평균 (avgRecentPrice.do)
+
+
+class PriceHistoryStore:
+    """일별 유가를 CSV 파일(date, area, product, price)에 누적 저장하고 기간별 시계열을 조회합니다.
+
+    오피넷 API는 최근 7일치만 제공하므로, 매 실행마다 받은 데이터를 누적해 두면
+    주간 뉴스레터와 차트가 그보다 긴 기간을 로컬에서 바로 읽을 수 있습니다.
+    """
+
+    FIELDNAMES = ['date', 'area', 'product', 'price']
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.filepath = config.PRICE_HISTORY_FILE
+        self._records = None
+
+    def load(self):
+        """{(date, area, product): price} 딕셔너리로 전체 이력을 불러옵니다. 파일은 인스턴스당 한 번만 읽습니다."""
+        if self._records is not None:
+            return self._records
+        records = {}
+        try:
+            with open(self.filepath, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    records[(row['date'], row['area'], row['product'])] = float(row['price'])
+        except FileNotFoundError:
+            pass
+        self._records = records
+        return records
+
+    def upsert(self, rows):
+        """(date, area, product, price) 튜플 목록을 반영합니다. 같은 날짜/지역/유종은 최신 값으로 덮어씁니다."""
+        records = self.load()
+        changed = 0
+        for date_str, area, product, price in rows:
+            key = (date_str, area, product)
+            if records.get(key) != float(price):
+                records[key] = float(price)
+                changed += 1
+        if not changed:
+            return 0
+
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.FIELDNAMES)
+            for (date_str, area, product), price in sorted(records.items()):
+                writer.writerow([date_str, area, product, f"{price:.2f}"])
+        os.replace(tmp_path, self.filepath)
+        return changed
+
+    def append_recent_prices(self, recent_items):
+        """avgRecentPrice.do 응답(DATE, PRODCD, PRICE)을 전국 평균 이력으로 누적합니다."""
+        rows = [(item['DATE'], NATIONAL_AREA_CODE, item['PRODCD'], item['PRICE'])
+                for item in recent_items if item.get('DATE') and item.get('PRODCD') and item.get('PRICE')]
+        try:
+            changed = self.upsert(rows)
+            if changed:
+                print(f"✅ 유가 이력 파일 '{self.filepath}'에 {changed}건을 반영했습니다.")
+        except Exception as e:
+            print(f"❌ 유가 이력 저장 실패: {e}")
+
+    def append_sido_prices(self, sido_items, date_str, area_codes):
+        """avgSidoPrice.do 응답(SIDOCD, PRODCD, PRICE)을 date_str('YYYYMMDD') 날짜의 지역별 이력으로 누적합니다.
+
+        시도별 평균가 API는 당일 값만 주므로, 매 실행마다 쌓아 두어야 지역별 추세와 가격 차이를 계산할 수 있습니다.
+        """
+        rows = [(date_str, item['SIDOCD'], item['PRODCD'], item['PRICE'])
+                for item in sido_items if item.get('SIDOCD') in area_codes and item.get('PRODCD') and item.get('PRICE')]
+        try:
+            changed = self.upsert(rows)
+            if changed:
+                print(f"✅ 유가 이력 파일 '{self.filepath}'에 지역별 {changed}건을 반영했습니다.")
+        except Exception as e:
+            print(f"❌ 지역별 유가 이력 저장 실패: {e}")
+
+    def get_series(self, product, area=NATIONAL_AREA_CODE, days=None):
+        """유종/지역의 일별 가격을 API 응답과 같은 [{'DATE', 'PRICE'}] 형태로 날짜순 반환합니다."""
+        series = sorted(
+            (date_str, price) for (date_str, rec_area, rec_product), price in self.load().items()
+            if rec_area == area and rec_product == product
+        )
+        if days:
+            series = series[-days:]
+        return [{'DATE': date_str, 'PRICE': f"{price:.2f}"} for date_str, price in series]
+
+    def get_chart_data(self, days):
+        """차트용 {'gasoline': [...], 'diesel': [...]} 데이터를 반환합니다. 이력이 없으면 None."""
+        gasoline = self.get_series('B027')
+        diesel = self.get_series('D047')
+        # 두 유종의 날짜가 어긋나면 차트 x축이 틀어지므로 공통 날짜만 사용합니다.
+        common_dates = sorted({p['DATE'] for p in gasoline} & {p['DATE'] for p in diesel})[-days:]
+        if not common_dates:
+            return None
+        date_set = set(common_dates)
+        return {
+            'gasoline': [p for p in gasoline if p['DATE'] in date_set],
+            'diesel': [p for p in diesel if p['DATE'] in date_set],
+        }
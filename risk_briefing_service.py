@@ -1,54 +1,113 @@
 # risk_briefing_service.py
 
+import os
 from datetime import date, timedelta
-import holidays
 import json
 from dateutil.relativedelta import relativedelta, TH, MO 
 from config import Config
+from holiday_calendar import HolidayCalendar
+
+RISK_SUMMARY_FALLBACK = '리스크 정보를 생성하지 못했습니다.'
+# 앞 휴일과 이어지면 하나의 연휴로 묶는 이름 키워드 (한국은 한국어, 그 외 국가는 영어 이름 기준)
+HOLIDAY_GROUP_KEYWORDS = ['추석', '설날', '대체', '전날', '다음날', 'Day off', 'Substitute', 'substituted', 'Spring Festival', 'Lunar New Year']
+# 연휴 이름 결정 (앞의 항목 우선)
+HOLIDAY_GROUP_NAMES = [('추석', '추석 연휴'), ('설날', '설날 연휴'), ('Spring Festival', '춘절 연휴'), ('Lunar New Year', '설(뗏) 연휴'), ('National Day', '국경절 연휴'), ('Mid-Autumn', '중추절 연휴'), ("New Year's Day", '신정 연휴')]
+
+
+class RiskSummaryCache:
+    """(국가, 이벤트 이름, 기간)별 AI 리스크 요약을 실행 간에 보관합니다.
+
+    같은 연휴는 분석 기간(3주)에 들어와 있는 동안 매일 같은 요약을 받게 되므로,
+    처음 한 번만 AI를 호출하고 이후 실행에서는 저장된 요약을 그대로 씁니다.
+    """
+
+    def __init__(self, config: Config):
+        self.filepath = config.RISK_SUMMARY_CACHE_FILE
+        self.entries = self._load()
+        self.changed = False
+
+    def _load(self):
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def key(event):
+        start_date, end_date = event['date_range']
+        return f"{event['country_code']}|{event['name']}|{start_date.isoformat()}|{end_date.isoformat()}"
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, risk_summary):
+        self.entries[key] = risk_summary
+        self.changed = True
+
+    def save(self, today):
+        """기간이 끝난 이벤트를 정리하고 항목당 한 줄로 저장합니다."""
+        expired = [key for key in self.entries if key.rsplit('|', 1)[-1] < today.isoformat()]
+        for key in expired:
+            del self.entries[key]
+        if not (self.changed or expired):
+            return
+        lines = [f"  {json.dumps(key, ensure_ascii=False)}: {json.dumps(self.entries[key], ensure_ascii=False)}" for key in sorted(self.entries)]
+        tmp_path = f"{self.filepath}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("{\n" + ",\n".join(lines) + "\n}\n")
+            os.replace(tmp_path, self.filepath)
+            self.changed = False
+        except OSError as e:
+            print(f"❌ 리스크 요약 캐시 저장 실패: {e}")
+
 
 class RiskBriefingService:
     def __init__(self, ai_service_instance): 
         self.config = Config()
         self.countries = self.config.RISK_BRIEFING_TARGET_COUNTRIES
-        self.country_names = {"KR": "한국"}
+        self.country_names = self.config.RISK_BRIEFING_COUNTRY_NAMES
         self.ai_service = ai_service_instance 
+        self.summary_cache = RiskSummaryCache(self.config)
 
     def _get_base_holidays(self, start_date, end_date):
-        """라이브러리를 통해 기본적인 공휴일 정보만 수집합니다."""
+        """저장된 국가별 공휴일 달력에서 기간 내 공휴일을 조회합니다. (처음 보는 연도만 계산해 저장)"""
         holiday_events = []
-        date_range = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        calendar = HolidayCalendar(self.config)
 
         for country_code in self.countries:
             try:
-                country_holidays = holidays.country_holidays(country_code, language='ko')
-                for single_date in date_range:
-                    if single_date in country_holidays:
-                        holiday_name = country_holidays.get(single_date)
-                        holiday_events.append({
-                            "date": single_date,
-                            "country": self.country_names.get(country_code, country_code),
-                            "name": holiday_name,
-                        })
+                for single_date, holiday_name in calendar.between(country_code, start_date, end_date):
+                    holiday_events.append({
+                        "date": single_date,
+                        "country_code": country_code,
+                        "country": self.country_names.get(country_code, country_code),
+                        "name": holiday_name,
+                    })
             except Exception as e:
                 print(f"WARN: {country_code} 공휴일 정보를 가져오는 중 오류 발생: {e}")
+        calendar.save()
         
-        # 날짜와 이름이 같은 중복 이벤트 제거
-        unique_events = list({(e['date'], e['name']): e for e in holiday_events}.values())
+        # 국가, 날짜, 이름이 같은 중복 이벤트 제거
+        unique_events = list({(e['country_code'], e['date'], e['name']): e for e in holiday_events}.values())
         return unique_events
 
     def _group_consecutive_holidays(self, holidays):
-        """연속된 공휴일을 단일 '연휴' 이벤트로 그룹화합니다."""
+        """같은 국가의 연속된 공휴일을 단일 '연휴' 이벤트로 그룹화합니다."""
         if not holidays:
             return []
         
-        holidays.sort(key=lambda x: x['date'])
+        holidays.sort(key=lambda x: (x['country_code'], x['date']))
         grouped = []
         
         current_group = [holidays[0]]
         for i in range(1, len(holidays)):
-            # 이전 휴일과 하루 차이이고, 이름에 '대체' 또는 '전날/다음날'이 포함된 경우 그룹화
-            if (holidays[i]['date'] - holidays[i-1]['date']).days == 1 and \
-               any(keyword in holidays[i]['name'] for keyword in ['추석', '설날', '대체', '전날', '다음날']):
+            # 같은 국가에서 이전 휴일과 하루 차이이고, 이름이 같거나 '대체' 또는 '전날/다음날'이 포함된 경우 그룹화
+            if holidays[i]['country_code'] == holidays[i-1]['country_code'] and \
+               (holidays[i]['date'] - holidays[i-1]['date']).days == 1 and \
+               (holidays[i]['name'] == holidays[i-1]['name'] or
+                any(keyword in holidays[i]['name'] for keyword in HOLIDAY_GROUP_KEYWORDS)):
                 current_group.append(holidays[i])
             else:
                 grouped.append(current_group)
@@ -59,21 +118,26 @@ class RiskBriefingService:
         for group in grouped:
             if len(group) > 1:
                 # 그룹 이름 결정 (예: '추석'이 포함된 이름 우선)
-                group_name = "연휴"
-                for name_part in ['추석', '설날']:
+                group_name = group[0]['name'] if all(item['name'] == group[0]['name'] for item in group) else "연휴"
+                for name_part, holiday_name in HOLIDAY_GROUP_NAMES:
                     if any(name_part in item['name'] for item in group):
-                        group_name = f"{name_part} 연휴"
+                        group_name = holiday_name
                         break
 
                 final_events.append({
                     "date_range": (group[0]['date'], group[-1]['date']),
+                    "country_code": group[0]['country_code'],
+                    "country": group[0]['country'],
                     "name": group_name
                 })
             else:
                 final_events.append({
                     "date_range": (group[0]['date'], group[0]['date']),
+                    "country_code": group[0]['country_code'],
+                    "country": group[0]['country'],
                     "name": group[0]['name']
                 })
+        final_events.sort(key=lambda x: x['date_range'][0])
         return final_events
     
     def _get_ai_risk_summary(self, event):
@@ -83,11 +147,11 @@ class RiskBriefingService:
         end_date = event['date_range'][1].strftime('%m/%d')
         date_str = start_date if start_date == end_date else f"{start_date}~{end_date}"
         
-        print(f"-> AI에게 '{event_name}' 리스크 요약 요청 중...")
+        print(f"-> AI에게 '{event['country']} {event_name}' 리스크 요약 요청 중...")
 
         system_prompt = "너는 '로디'라는 이름의 물류 리스크 전문 분석가야. 특정 공휴일이 한국 물류 시장에 미치는 영향을 '물류 리스크'라는 제목으로 한 문장으로 요약해야 해. 답변은 반드시 JSON 형식으로만 해야 해."
         user_prompt = f"""
-        '{event_name}'({date_str}) 기간의 핵심적인 물류 리스크를 한 문장으로 요약해줘.
+        {event['country']}의 '{event_name}'({date_str}) 기간의 핵심적인 물류 리스크를 한 문장으로 요약해줘.
 
         [출력 형식]
         - 반드시 "risk_summary" 라는 키를 가진 JSON 객체로만 응답해야 해.
@@ -99,7 +163,7 @@ class RiskBriefingService:
         if response_text:
             try:
                 data = json.loads(response_text)
-                event['risk_summary'] = data.get('risk_summary', '리스크 정보를 생성하지 못했습니다.')
+                event['risk_summary'] = data.get('risk_summary', RISK_SUMMARY_FALLBACK)
                 return event
             except (json.JSONDecodeError, KeyError):
                 return None
@@ -140,7 +204,7 @@ class RiskBriefingService:
         """모든 리스크 정보를 종합하여 AI 요약이 추가된 리스트를 반환합니다."""
         today = date.today()
         start_date = today
-        end_date = today + timedelta(days=21)
+        end_date = today + timedelta(days=self.config.RISK_BRIEFING_DAYS)
         
         print("-> 물류 리스크 이벤트 수집 및 분석 시작...")
         
@@ -151,13 +215,24 @@ class RiskBriefingService:
 
         grouped_events = self._group_consecutive_holidays(base_holidays)
         
-        final_risk_events = []
+        final_risk_events, cache_hits = [], 0
         for event in grouped_events:
+            # 같은 국가/이름/기간의 요약이 이미 있으면 AI를 호출하지 않습니다.
+            cache_key = RiskSummaryCache.key(event)
+            cached_summary = self.summary_cache.get(cache_key)
+            if cached_summary:
+                event['risk_summary'] = cached_summary
+                final_risk_events.append(event)
+                cache_hits += 1
+                continue
             enriched_event = self._get_ai_risk_summary(event)
             if enriched_event:
                 final_risk_events.append(enriched_event)
+                if enriched_event['risk_summary'] != RISK_SUMMARY_FALLBACK:
+                    self.summary_cache.put(cache_key, enriched_event['risk_summary'])
+        self.summary_cache.save(today)
         
-        print(f"✅ 총 {len(final_risk_events)}개의 물류 리스크 이벤트를 분석했습니다.")
+        print(f"✅ 총 {len(final_risk_events)}개의 물류 리스크 이벤트를 분석했습니다. (저장된 요약 재사용 {cache_hits}개)")
         return final_risk_events
 
 
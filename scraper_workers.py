@@ -0,0 +1,384 @@
+# scraper_workers.py
+# ProcessPoolExecutor 자식 프로세스가 불러오는 최소 모듈입니다.
+# 차트, 구글 인증, 뉴스 검색 같은 무거운 라이브러리를 끌어오지 않도록
+# 브라우저 스크래핑에 필요한 것만 임포트합니다.
+
+import time
+import random
+import re
+from io import BytesIO
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+from PIL import Image
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium_stealth import stealth
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from ai_service import AIService
+from browser_profile import build_chrome_options, apply_request_blocking, drain_performance_log, collect_page_stats
+from domain_stats import host_of, default_host_policy
+from circuit_breaker import CircuitBreaker
+from metrics import Metrics
+from config import Config
+
+CONTENT_SELECTORS = '#article-view-content, .article_body, .entry-content, #article-view, #articleBody, .post-content, #articles_detail'
+
+
+def _create_driver_for_process(driver_path: str): # ✨ 드라이버 경로를 인자로 받음
+    """각 프로세스를 위한 독립적인 Selenium 드라이버를 생성하는 함수"""
+    config = Config()
+    chrome_options = build_chrome_options(config)
+    try:
+        # ✨ 더 이상 드라이버를 매번 설치하지 않고, 전달받은 경로를 사용
+        service = ChromeService(executable_path=driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        stealth(driver, languages=["ko-KR", "ko"], vendor="Google Inc.", platform="Win32",
+                webgl_vendor="Intel Inc.", renderer="Intel Iris OpenGL Engine", fix_hairline=True)
+        apply_request_blocking(driver, config) # 폰트/스타일시트/미디어, 광고·추적 도메인 요청 차단
+        #driver.set_page_load_timeout(20)
+        return driver
+    except Exception as e:
+        print(f"🚨 드라이버 생성 실패: {e}")
+        return None
+
+
+def _clean_and_validate_url_worker(url):
+    """(독립 함수) URL의 유효성을 검사하고 정제합니다."""
+    config = Config()
+    try:
+        parsed = urlparse(url)
+        if any(ad_domain in parsed.netloc for ad_domain in config.AD_DOMAINS_BLACKLIST):
+            return None
+        if any(pattern in parsed.path.lower() for pattern in config.UNWANTED_URL_PATTERNS):
+            return None
+            
+        path = parsed.path.lower()
+        is_likely_article = (
+            any(char.isdigit() for char in path) or
+            any(keyword in path for keyword in ['/news/', '/article/', '/view/']) or
+            path.endswith('.html') or path.endswith('.php') or path.endswith('.do')
+        )
+        if 'hyundai.co.kr' in parsed.netloc:
+            pass
+        elif not is_likely_article:
+            return None
+        return parsed._replace(fragment="").geturl()
+    except Exception:
+        return None
+
+def resolve_google_news_url_worker(entry, driver_path: str):
+    """구글 뉴스 링크에서 실제 기사 URL을 추출합니다.
+
+    반환값: {'article': {'title', 'link'} 또는 None, 'metrics': 단계별 소요 시간 (Metrics.export())}
+    """
+    metrics = Metrics()
+    start_time = time.time()
+    title = entry['title']
+    gnews_link = entry['link']
+    
+    driver, article = None, None
+    try:
+        with metrics.span('url_resolve'):
+            with metrics.span('driver_create'):
+                driver = _create_driver_for_process(driver_path)
+            if not driver:
+                return {'article': None, 'metrics': metrics.export()}
+
+            with metrics.span('page_get', 'news.google.com'):
+                driver.get(gnews_link)
+            with metrics.span('page_wait', 'news.google.com'):
+                wait = WebDriverWait(driver, 30)
+                link_element = wait.until(EC.presence_of_element_located((By.TAG_NAME, 'a')))
+            record_page_stats(metrics, collect_page_stats(driver), 'news.google.com')
+
+        original_url = link_element.get_attribute('href')
+        validated_url = _clean_and_validate_url_worker(original_url)
+        
+        if validated_url:
+            print(f"  -> ✅ URL 추출 성공: {title} | 총 소요시간: {time.time() - start_time:.2f}s")
+            article = {'title': title, 'link': validated_url}
+        else:
+            print(f"   ㄴ> 🗑️ 기사 URL 패턴이 아니라서 제외: {original_url}")
+    except Exception as e:
+        if 'TimeoutException' in e.__class__.__name__:
+             print(f"  ㄴ> ❌ URL 추출 타임아웃: '{title}' (현재 URL: {driver.current_url if driver else 'N/A'})")
+        else:
+             print(f"  ㄴ> ❌ URL 추출 실패: '{title}'에서 오류 발생: {e.__class__.__name__}")
+    finally:
+        if driver:
+            driver.quit()
+    return {'article': article, 'metrics': metrics.export()}
+
+
+def record_page_stats(metrics, page_stats, domain):
+    """브라우저 페이지 통계(browser_profile.collect_page_stats)를 지표로 기록합니다."""
+    if page_stats['load_ms'] is not None:
+        metrics.observe('page_load', page_stats['load_ms'] / 1000, domain)
+    metrics.incr('pages_loaded', 1, domain)
+    metrics.incr('page_bytes', page_stats['bytes'], domain)
+    metrics.incr('page_requests', page_stats['requests'], domain)
+    metrics.incr('blocked_requests', page_stats['blocked'], domain)
+
+
+def _fetch_static_content(url, timeout, config):
+    """브라우저 없이 HTML만 받아 본문 영역을 찾습니다.
+
+    반환값: 본문을 찾으면 (soup, content_area), HTML은 받았지만 본문이 없으면 (soup, None),
+    타임아웃/HTTP 오류 등으로 HTML을 받지 못하면 (None, None)
+    """
+    try:
+        response = requests.get(url, headers={'User-Agent': random.choice(config.USER_AGENTS)}, timeout=timeout)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, 'lxml')
+    except Exception:
+        return None, None
+    content_area = soup.select_one(CONTENT_SELECTORS)
+    if content_area and len(content_area.get_text(strip=True)) >= 300:
+        return soup, content_area
+    return soup, None
+
+
+def process_article_content_worker(articles_batch, driver_path: str, host_policies=None, breaker=None):
+    """기사 배치를 순서대로 처리합니다.
+
+    host_policies: DomainStatsStore.policies()로 계산한 도메인별 타임아웃/JS 필요 여부
+    breaker: 워커 간에 공유하는 CircuitBreaker (회로가 열린 도메인의 기사는 바로 건너뜀)
+    반환값: {'articles': 처리된 기사 목록, 'samples': 도메인별 시도 기록 (부모 프로세스가 통계 파일에 반영),
+            'metrics': 단계별 소요 시간과 카운터 (Metrics.export())}
+    """
+    host_policies = host_policies or {}
+    processed_in_batch, samples = [], []
+    metrics = Metrics()
+    driver, driver_uses = None, 0
+    config = Config()
+    breaker = breaker or CircuitBreaker(config.CIRCUIT_BREAKER_FAILURE_THRESHOLD, config.CIRCUIT_BREAKER_COOLDOWN_SECONDS)
+    scraper = NewsScraper(config, host_policies, metrics)
+    ai_service = AIService(config)
+    default_policy = default_host_policy(config)
+
+    for article_info in articles_batch:
+        batch_start_time = time.time()
+        title = article_info['title']
+        url = article_info['link']
+        host = host_of(url)
+        policy = host_policies.get(host, default_policy)
+        if not breaker.allow(host):
+            print(f"   ㄴ> ⏩ 회로가 열린 도메인이라 건너뜁니다: '{title}' ({host})")
+            metrics.incr('articles_short_circuited', 1, host)
+            continue
+
+        page_start = time.time()
+        try:
+            # JS 없이도 본문이 나오는 도메인(또는 아직 모르는 도메인)은 정적 HTML을 먼저 시도
+            soup, content_area, js_required = None, None, None
+            if policy['js_required'] is not True:
+                with metrics.span('static_fetch', host):
+                    soup, content_area = _fetch_static_content(url, min(policy['page_timeout'], config.STATIC_FETCH_TIMEOUT), config)
+                # HTML을 받았을 때만 JS 필요 여부를 판단합니다. 받지 못한 경우(일시적인 네트워크 오류 등)는 None으로 두어 기록을 바꾸지 않습니다.
+                if soup is not None:
+                    js_required = content_area is None
+            use_browser = content_area is None
+
+            if use_browser:
+                # 드라이버는 브라우저가 실제로 필요할 때 만들고, 7페이지마다 새로 만듭니다.
+                if driver is None or driver_uses >= 7:
+                    if driver: driver.quit()
+                    with metrics.span('driver_create'):
+                        driver, driver_uses = _create_driver_for_process(driver_path), 0
+                if not driver:
+                    print("   ㄴ> 🚨 드라이버가 없어 현재 배치를 중단합니다.")
+                    break
+                driver_uses += 1
+                drain_performance_log(driver)
+                driver.set_page_load_timeout(policy['page_timeout'])
+                with metrics.span('page_get', host):
+                    driver.get(url)
+                with metrics.span('page_wait', host):
+                    WebDriverWait(driver, policy['page_timeout']).until(EC.presence_of_element_located((By.CSS_SELECTOR, CONTENT_SELECTORS)))
+                record_page_stats(metrics, collect_page_stats(driver), host)
+                
+                html_content = driver.page_source
+                soup = BeautifulSoup(html_content, 'lxml')
+                content_area = soup.select_one(CONTENT_SELECTORS)
+            samples.append({'host': host, 'kind': 'page', 'ok': True, 'latency': time.time() - page_start, 'js_required': js_required})
+            metrics.incr('pages_browser' if use_browser else 'pages_static', 1, host)
+            breaker.record_success(host)
+            page_start = None
+            if not content_area: continue
+            
+            with metrics.span('extract', host):
+                article_text = content_area.get_text(strip=True)
+            if len(article_text) < 300: continue
+
+            with metrics.span('summarize', host):
+                ai_summary = ai_service.generate_single_summary(title, url, article_text_from_selenium=article_text)
+            if not ai_summary or "요약 정보를 생성할 수 없습니다" in ai_summary: continue
+
+            with metrics.span('image_search', host):
+                image_url = scraper.get_image_url(soup, url)
+            
+            # ... (이하 이미지 처리 및 저장 로직은 동일)
+            image_data, final_width, final_height = None, 0, 0
+            if image_url and image_url != config.DEFAULT_IMAGE_URL:
+                try:
+                    img_dl_start = time.time()
+                    with metrics.span('image_download', host_of(image_url)):
+                        img_response = scraper.session.get(image_url, timeout=scraper.policy_for(image_url)['download_timeout'])
+                        img_response.raise_for_status()
+                    img = Image.open(BytesIO(img_response.content))
+                    samples.append({'host': host_of(image_url), 'kind': 'image', 'ok': True, 'latency': time.time() - img_dl_start})
+                    # 리사이징 로직 ...
+                    original_width, original_height = img.size
+                   
+                    aspect_ratio = original_height / original_width
+                    if aspect_ratio > 1.5:
+                        target_height = min(original_height, 800)
+                        target_width = int(target_height / aspect_ratio)
+                        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+                    else:
+                        target_width = 640
+                        target_height = int(target_width * aspect_ratio)
+                        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+                    final_width, final_height = img.size
+                    buffer = BytesIO()
+                    if img.mode in ("RGBA", "P"): img = img.convert("RGB")
+                    img.save(buffer, format='JPEG', quality=85)
+                    image_data = buffer.getvalue()
+                except Exception as e:
+                    if isinstance(e, requests.RequestException):
+                        samples.append({'host': host_of(image_url), 'kind': 'image', 'ok': False})
+                    image_data = None
+            if not image_data: continue
+            
+            processed_in_batch.append({'title': title, 'link': url, 'ai_summary': ai_summary, 'image_data': image_data, 'image_final_width': final_width, 'image_final_height': final_height})
+            metrics.observe('article_total', time.time() - batch_start_time, host)
+            print(f"  -> ✅ 콘텐츠 처리 성공: '{title}' | 총 소요시간: {time.time() - batch_start_time:.2f}s")
+
+        except Exception as e:
+            if page_start is not None: # 본문을 확보하기 전에 실패한 경우만 도메인 실패로 기록
+                samples.append({'host': host, 'kind': 'page', 'ok': False})
+                breaker.record_failure(host)
+            metrics.observe('article_total', time.time() - batch_start_time, host, ok=False)
+            if 'TimeoutException' in e.__class__.__name__:
+                print(f"  > ❌ 콘텐츠 처리 타임아웃: '{title}' (현재 URL: {driver.current_url if driver else 'N/A'}) | 총 소요시간: {time.time() - batch_start_time:.2f}s")
+            else:
+                print(f"  ㄴ> ❌ 콘텐츠 처리 중 오류: '{title}' ({e.__class__.__name__}) | 총 소요시간: {time.time() - batch_start_time:.2f}s")
+            continue
+    if driver:
+        driver.quit()
+    samples.extend(scraper.samples)
+    return {'articles': processed_in_batch, 'samples': samples, 'metrics': metrics.export()}
+
+
+class NewsScraper:
+    def __init__(self, config, host_policies=None, metrics=None):
+        self.config = config
+        self.session = self._create_session()
+        self.metrics = metrics or Metrics()
+        self.host_policies = host_policies or {}
+        self.default_policy = default_host_policy(config)
+        self.samples = [] # 이미지 검증 요청의 도메인별 시도 기록
+
+    def policy_for(self, url):
+        return self.host_policies.get(host_of(url), self.default_policy)
+
+    def _create_session(self):
+        session = requests.Session()
+        retry = Retry(total=5, backoff_factor=1.0, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _transform_thumbnail_url(self, url: str) -> str:
+        """썸네일 URL을 원본 URL로 변형 시도 (예: _v150.jpg 제거)"""
+        # 정규표현식을 사용하여 URL 끝에 있는 '_v숫자', '_w숫자', '_s숫자' 등의 썸네일 패턴을 제거
+        transformed_url = re.sub(r'(_[vws]\d+)\.(jpg|jpeg|png|gif)$', r'.\2', url, flags=re.IGNORECASE)
+        return transformed_url
+
+    def get_image_url(self, soup: BeautifulSoup, base_url: str) -> str:
+        try:
+            # 1순위: 메타 태그 (이제 soup 객체에서 바로 찾음)
+            meta_image = soup.find("meta", property="og:image") or soup.find("meta", name="twitter:image")
+            if meta_image and meta_image.get("content"):
+                thumbnail_url = meta_image["content"]
+                original_url_candidate = self._transform_thumbnail_url(thumbnail_url)
+                
+                full_url = self._resolve_url(base_url, original_url_candidate)
+                if self._is_valid_candidate(full_url) and self._validate_image(full_url):
+                    return full_url
+                
+                full_thumbnail_url = self._resolve_url(base_url, thumbnail_url)
+                if full_thumbnail_url != full_url:
+                    if self._is_valid_candidate(full_thumbnail_url) and self._validate_image(full_thumbnail_url):
+                        return full_thumbnail_url
+
+            # 2순위: 특정 기사 본문 영역 안에서 이미지 검색
+            content_area = soup.select_one('#article-view-content-div, .entry-content, .article-body, #article-view-content, #article-view, #articleBody, .post-content')
+            if content_area:
+                for img in content_area.find_all("img", limit=5):
+                    img_url = img.get("src") or img.get("data-src")
+                    if img_url and self._is_valid_candidate(img_url):
+                        full_url = self._resolve_url(base_url, img_url)
+                        if self._validate_image(full_url):
+                            return full_url
+            
+            # 3순위: 본문 <figure> 또는 <picture> 태그
+            for tag in soup.select('figure > img, picture > img', limit=5):
+                img_url = tag.get('src') or tag.get('data-src') or (tag.get('srcset').split(',')[0].strip().split(' ')[0] if tag.get('srcset') else None)
+                if img_url and self._is_valid_candidate(img_url):
+                    full_url = self._resolve_url(base_url, img_url)
+                    if self._validate_image(full_url):
+                        return full_url
+            
+            # 4순위: 일반 <img> 태그
+            for img in soup.find_all("img", limit=10):
+                img_url = img.get("src") or img.get("data-src")
+                if img_url and self._is_valid_candidate(img_url):
+                    full_url = self._resolve_url(base_url, img_url)
+                    if self._validate_image(full_url):
+                        return full_url
+
+            return self.config.DEFAULT_IMAGE_URL
+        except Exception:
+            return self.config.DEFAULT_IMAGE_URL
+
+    def _resolve_url(self, base_url, image_url):
+        if image_url.startswith('//'): return 'https:' + image_url
+        return urljoin(base_url, image_url)
+
+    def _is_valid_candidate(self, image_url):
+        if 'news.google.com' in image_url or 'lh3.googleusercontent.com' in image_url: return False
+        return not any(pattern in image_url.lower() for pattern in self.config.UNWANTED_IMAGE_PATTERNS)
+
+    def _validate_image(self, image_url):
+        probe_start = time.time()
+        try:
+            response = self.session.get(image_url, stream=True, timeout=self.policy_for(image_url)['image_timeout'])
+            response.raise_for_status()
+            self.samples.append({'host': host_of(image_url), 'kind': 'image', 'ok': True, 'latency': time.time() - probe_start})
+            self.metrics.observe('image_probe', time.time() - probe_start, host_of(image_url))
+            content_type = response.headers.get('Content-Type', '').lower()
+            if 'image' not in content_type: return False
+            img_data = BytesIO(response.content)
+            with Image.open(img_data) as img:
+                width, height = img.size
+                if width < self.config.MIN_IMAGE_WIDTH or height < self.config.MIN_IMAGE_HEIGHT: return False
+                aspect_ratio = width / height
+                if aspect_ratio > 4.0 or aspect_ratio < 0.25: return False
+                
+
+                return True
+        except Exception:
+            self.metrics.observe('image_probe', time.time() - probe_start, host_of(image_url), ok=False)
+            if time.time() - probe_start >= self.policy_for(image_url)['image_timeout']: # 응답 지연으로 실패한 경우만 기록
+                self.samples.append({'host': host_of(image_url), 'kind': 'image', 'ok': False})
+            return False
@@ -0,0 +1,209 @@
+# search_index.py
+
+import os
+import re
+import sys
+import json
+import time
+import unicodedata
+from config import Config
+
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+TITLE_WEIGHT, SUMMARY_WEIGHT = 3, 1
+SNIPPET_LENGTH = 120
+INDEX_VERSION = 1
+
+
+def tokenize(text):
+    """검색용 토큰 목록을 반환합니다. archive/search.html의 tokenize()와 반드시 같은 규칙이어야 합니다.
+
+    한글은 띄어쓰기와 조사가 제각각이라 단어 대신 글자 2-gram(바이그램)으로 쪼개고,
+    영문/숫자는 단어 단위로 사용합니다. 한 글자짜리 한글 단어만 그대로 토큰이 됩니다.
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣':
+            tokens.extend([word] if len(word) == 1 else [word[i:i + 2] for i in range(len(word) - 1)])
+        elif len(word) > 1:
+            tokens.append(word)
+    return tokens
+
+
+def shard_of(token, shard_count):
+    """토큰이 저장될 샤드 번호 (32-bit FNV-1a). 검색 페이지의 자바스크립트와 같은 값을 내야 합니다."""
+    h = 2166136261
+    for ch in token:
+        h = ((h ^ ord(ch)) * 16777619) & 0xFFFFFFFF
+    return h % shard_count
+
+
+class SearchIndex:
+    """아카이브 기사(제목, 링크, AI 요약)의 역색인을 archive/search/ 아래 JSON 샤드로 관리합니다.
+
+    - meta.json: 샤드 수, 다음 문서 번호, 호(파일)별 문서 번호 목록
+    - docs-N.json: 문서 번호 N*DOCS_PER_CHUNK 부터의 문서 정보 (호, 날짜, 제목, 링크, 요약 앞부분)
+    - shard-NN.json: {토큰: [[문서 번호, 가중치], ...]}
+
+    호를 추가할 때는 새 토큰이 속한 샤드와 마지막 문서 청크만 읽고 다시 쓰며,
+    검색할 때도 질의 토큰이 속한 샤드와 결과 문서가 든 청크만 읽습니다.
+    """
+
+    DOCS_PER_CHUNK = 500
+
+    def __init__(self, config: Config):
+        self.index_dir = config.SEARCH_INDEX_DIR
+        self.meta = self._read_json('meta.json') or {
+            'version': INDEX_VERSION, 'shard_count': config.SEARCH_INDEX_SHARDS, 'next_doc_id': 0, 'issues': {},
+        }
+        self.shard_count = self.meta['shard_count']
+
+    def _path(self, name):
+        return os.path.join(self.index_dir, name)
+
+    def _read_json(self, name, default=None):
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def _write_json(self, name, data):
+        os.makedirs(self.index_dir, exist_ok=True)
+        path = self._path(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def _chunk_name(self, doc_id):
+        return f"docs-{doc_id // self.DOCS_PER_CHUNK}.json"
+
+    def add_issue(self, issue_file, issue_date, news_list):
+        """한 호의 기사를 색인에 추가합니다. 같은 호를 다시 색인하면 이전 문서는 삭제 처리됩니다."""
+        old_doc_ids = set(self.meta['issues'].get(issue_file, []))
+        chunks, postings = {}, {}
+
+        def chunk(name):
+            if name not in chunks:
+                chunks[name] = self._read_json(name, [])
+            return chunks[name]
+
+        for doc_id in old_doc_ids:
+            docs = chunk(self._chunk_name(doc_id))
+            docs[doc_id % self.DOCS_PER_CHUNK] = None
+
+        doc_ids = []
+        for news in news_list:
+            title, summary = news.get('title') or '', news.get('ai_summary') or news.get('summary') or ''
+            if not title and not summary:
+                continue
+            doc_id = self.meta['next_doc_id']
+            self.meta['next_doc_id'] += 1
+            snippet = ' '.join(summary.split())
+            chunk(self._chunk_name(doc_id)).append({
+                'issue': issue_file, 'date': issue_date, 'title': title, 'link': news.get('link', ''),
+                'snippet': snippet[:SNIPPET_LENGTH] + ('…' if len(snippet) > SNIPPET_LENGTH else ''),
+            })
+            weights = {}
+            for token in tokenize(title):
+                weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+            for token in tokenize(summary):
+                weights[token] = weights.get(token, 0) + SUMMARY_WEIGHT
+            for token, weight in weights.items():
+                postings.setdefault(token, []).append([doc_id, weight])
+            doc_ids.append(doc_id)
+
+        touched_shards = {}
+        for token, entries in postings.items():
+            shard_id = shard_of(token, self.shard_count)
+            if shard_id not in touched_shards:
+                touched_shards[shard_id] = self._read_json(f"shard-{shard_id:02d}.json", {})
+            touched_shards[shard_id].setdefault(token, []).extend(entries)
+
+        for shard_id, shard in touched_shards.items():
+            if old_doc_ids: # 다시 쓰는 샤드에서는 삭제된 문서를 함께 정리합니다.
+                shard = {t: [e for e in entries if e[0] not in old_doc_ids] for t, entries in shard.items()}
+            self._write_json(f"shard-{shard_id:02d}.json", shard)
+        for name, docs in chunks.items():
+            self._write_json(name, docs)
+        self.meta['issues'][issue_file] = doc_ids
+        self._write_json('meta.json', self.meta)
+        return len(doc_ids)
+
+    def search(self, query, limit=20):
+        """모든 질의 토큰을 포함하는 문서를 가중치 합이 큰 순(같으면 최신순)으로 반환합니다."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        shards, scores = {}, None
+        for token in tokens:
+            shard_id = shard_of(token, self.shard_count)
+            if shard_id not in shards:
+                shards[shard_id] = self._read_json(f"shard-{shard_id:02d}.json", {})
+            token_scores = {doc_id: weight for doc_id, weight in shards[shard_id].get(token, [])}
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: score + token_scores[doc_id] for doc_id, score in scores.items() if doc_id in token_scores}
+            if not scores:
+                return []
+
+        chunks, results = {}, []
+        for doc_id, score in sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True):
+            name = self._chunk_name(doc_id)
+            if name not in chunks:
+                chunks[name] = self._read_json(name, [])
+            offset = doc_id % self.DOCS_PER_CHUNK
+            doc = chunks[name][offset] if offset < len(chunks[name]) else None
+            if doc:
+                results.append(dict(doc, score=score))
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def extract_archived_news(filepath):
+    """아카이브 HTML에서 기사 제목, 링크, 요약을 추출합니다. (색인 재구축용)"""
+    from bs4 import BeautifulSoup # 재구축할 때만 필요합니다.
+    with open(filepath, 'r', encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+    news_list = []
+    for anchor in soup.select('h3 > a[target="_blank"]'):
+        summary_tag = anchor.parent.find_next_sibling('p')
+        news_list.append({
+            'title': anchor.get_text(strip=True),
+            'link': anchor.get('href', ''),
+            'ai_summary': summary_tag.get_text('\n', strip=True) if summary_tag else '',
+        })
+    return news_list
+
+
+def rebuild(config: Config):
+    """archive/manifest.jsonl 의 날짜 순서대로 모든 호를 다시 색인합니다."""
+    import shutil
+    from archive_index import ArchiveIndex
+    archive_index = ArchiveIndex(config)
+    if archive_index.entries is None:
+        archive_index.rebuild()
+    shutil.rmtree(config.SEARCH_INDEX_DIR, ignore_errors=True)
+    search_index = SearchIndex(config)
+    total = 0
+    for entry in sorted(archive_index.entries.values(), key=lambda e: (e['date'], e['file'])):
+        total += search_index.add_issue(entry['file'], entry['date'], extract_archived_news(os.path.join(config.ARCHIVE_DIR, entry['file'])))
+    print(f"✅ 검색 색인 재구축 완료: {len(archive_index.entries)}개 호, 기사 {total}건")
+
+
+if __name__ == "__main__":
+    # 예: python search_index.py query 화물연대 파업
+    #     python search_index.py rebuild
+    if len(sys.argv) > 2 and sys.argv[1] == 'query':
+        started = time.perf_counter()
+        results = SearchIndex(Config()).search(' '.join(sys.argv[2:]))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for doc in results:
+            print(f"[{doc['date']}] {doc['title']}\n    {doc['link']}\n    {doc['snippet']}")
+        print(f"🔎 {len(results)}건 ({elapsed_ms:.1f}ms)")
+    elif len(sys.argv) > 1 and sys.argv[1] == 'rebuild':
+        rebuild(Config())
+    else:
+        print("사용법: python search_index.py query <검색어> | rebuild")
@@ -0,0 +1,77 @@
+# task_graph.py
+
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class TaskGraph:
+    """서로 독립적인(또는 의존 관계가 있는) 작업을 스레드 풀에서 동시에 실행하고,
+    결과가 실제로 필요한 시점에만 기다리도록 해주는 간단한 작업 그래프입니다."""
+
+    def __init__(self, name="보조 작업", max_workers=8):
+        self.name = name
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='task')
+        self.futures = {}
+        self.durations = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def submit(self, task_name, fn, *args, depends_on=(), **kwargs):
+        """작업을 등록합니다. depends_on에 지정한 작업들의 결과가 fn의 앞쪽 인자로 전달됩니다."""
+        future = Future()
+        self.futures[task_name] = future
+        dependencies = [self.futures[dep] for dep in depends_on]
+
+        if not dependencies:
+            self.executor.submit(self._run, task_name, future, fn, [], args, kwargs)
+            return future
+
+        remaining = {'count': len(dependencies)}
+
+        def on_dependency_done(_):
+            with self._lock:
+                remaining['count'] -= 1
+                if remaining['count'] > 0:
+                    return
+            try:
+                dep_results = [dep.result() for dep in dependencies]
+            except Exception as e:
+                future.set_exception(e)
+                return
+            self.executor.submit(self._run, task_name, future, fn, dep_results, args, kwargs)
+
+        for dep in dependencies:
+            dep.add_done_callback(on_dependency_done)
+        return future
+
+    def _run(self, task_name, future, fn, dep_results, args, kwargs):
+        # 결과를 기다리던 쪽이 곧바로 report()를 호출하므로, 소요 시간을 먼저 기록한 뒤 결과를 전달합니다.
+        start = time.time()
+        try:
+            result = fn(*dep_results, *args, **kwargs)
+        except Exception as e:
+            self.durations[task_name] = time.time() - start
+            future.set_exception(e)
+        else:
+            self.durations[task_name] = time.time() - start
+            future.set_result(result)
+
+    def result(self, task_name, default=None):
+        """작업이 끝날 때까지 기다렸다가 결과를 반환합니다. 실패한 작업은 default를 반환합니다."""
+        try:
+            return self.futures[task_name].result()
+        except Exception as e:
+            print(f"❌ [{self.name}] '{task_name}' 작업 실패: {e.__class__.__name__}: {e}")
+            return default
+
+    def report(self):
+        """작업별 소요 시간을 출력하고 {작업명: 초} 딕셔너리로 반환합니다."""
+        wall_time = time.time() - self.started_at
+        print(f"\n--- ⏱️ {self.name} 소요 시간 (전체 경과 {wall_time:.2f}s) ---")
+        for task_name, duration in sorted(self.durations.items(), key=lambda x: x[1], reverse=True):
+            print(f"  - {task_name}: {duration:.2f}s")
+        return dict(self.durations)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
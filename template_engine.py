@@ -0,0 +1,95 @@
+# template_engine.py
+
+import os
+from artifacts import Artifact
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_NAME = 'email_template.html'
+BYTECODE_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'jinja')
+TARGETS = ('web', 'email')
+
+_environment = None
+_templates = {}
+
+
+def get_environment():
+    """프로세스 전체에서 하나만 사용하는 Jinja 환경을 처음 렌더링할 때 만듭니다.
+
+    컴파일된 템플릿은 디스크(bytecode cache)에 남아 다음 실행에서도 다시 파싱하지 않으며,
+    실행 중에는 템플릿 파일이 바뀌지 않으므로 auto_reload로 매번 수정 시각을 확인하지 않습니다.
+    임포트만으로는 Jinja를 불러오거나 캐시 디렉터리를 만들지 않습니다.
+    """
+    global _environment
+    if _environment is None:
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+        _environment = Environment(
+            loader=FileSystemLoader(BASE_DIR),
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR),
+            auto_reload=False,
+        )
+    return _environment
+
+
+def get_template(name=TEMPLATE_NAME):
+    if name not in _templates:
+        _templates[name] = get_environment().get_template(name)
+    return _templates[name]
+
+
+def _web_image_src(artifact, asset_store=None):
+    """웹 대상 이미지 주소를 만듭니다. asset_store가 있으면 에셋 파일의 상대 URL, 없으면 data URI입니다."""
+    if asset_store is not None:
+        return asset_store.store(artifact.data, artifact.mime, digest=artifact.sha256)
+    return artifact.data_uri
+
+
+def build_render_context(context, asset_store=None, targets=TARGETS):
+    """targets(웹/이메일)가 함께 쓰는 렌더링 컨텍스트를 한 번에 만듭니다.
+
+    이미지 주소는 {'web': 웹 주소, 'email': cid} 형태로 두고, 템플릿이 target에 따라 골라 씁니다.
+    웹 주소는 asset_store(archive_assets.ArchiveAssetStore)가 주어지면 archive/assets/ 파일의 상대 URL,
+    없으면(테스트 미리보기 등) data URI입니다. 차트와 대시보드는 Artifact(메모리 바이트)로 받으므로
+    Base64 인코딩은 data URI가 필요할 때만 일어납니다. 웹 대상을 렌더링하지 않으면(이메일만) 웹 주소는
+    만들지 않습니다. 원본 context와 뉴스 항목은 수정하지 않습니다.
+    """
+    render_context = dict(context)
+    with_web = 'web' in targets
+
+    price_chart = (context.get("price_indicators") or {}).get("price_chart")
+    render_context['price_chart_src'] = {
+        'web': _web_image_src(price_chart, asset_store) if with_web and price_chart else None,
+        'email': 'cid:price_chart',
+    }
+    regional_chart = (context.get("price_indicators") or {}).get("regional_chart")
+    render_context['regional_chart_src'] = {
+        'web': _web_image_src(regional_chart, asset_store) if with_web and regional_chart else None,
+        'email': 'cid:regional_price_chart',
+    }
+
+    # 날씨 대시보드는 권역 수에 따라 여러 장일 수 있습니다.
+    weather_dashboard_tiles = context.get("weather_dashboard_tiles") or []
+    render_context['weather_dashboard_srcs'] = {
+        'web': [_web_image_src(tile['artifact'], asset_store) for tile in weather_dashboard_tiles] if with_web else [],
+        'email': [f"cid:{tile['cid']}" for tile in weather_dashboard_tiles],
+    }
+
+    news_list = []
+    for news in context.get("news_list") or []:
+        if with_web and news.get('image_data') and not news.get('image_src'):
+            news = dict(news, image_src=_web_image_src(Artifact(news['image_data'], 'news_image.jpg', 'image/jpeg'), asset_store))
+        news_list.append(news)
+    render_context['news_list'] = news_list
+    return render_context
+
+
+def render(context, target='email', asset_store=None):
+    """하나의 대상(web 또는 email)으로 렌더링합니다."""
+    return get_template().render(build_render_context(context, asset_store, targets=(target,)), target=target)
+
+
+def render_targets(context, targets=TARGETS, asset_store=None):
+    """공통 컨텍스트를 한 번만 만들고 여러 대상으로 렌더링해 {target: html}을 반환합니다."""
+    template = get_template()
+    render_context = build_render_context(context, asset_store, targets=targets)
+    return {target: template.render(render_context, target=target) for target in targets}
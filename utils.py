@@ -1,5 +1,4 @@
 import base64
-import markdown
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -17,6 +16,7 @@ def get_kst_week_str():
 
 def markdown_to_html(text):
     """Markdown 텍스트를 HTML로 변환합니다."""
+    import markdown # 변환이 필요할 때만 불러옵니다.
     return markdown.markdown(text) if text else ""
 
 def image_to_base64_string(filepath):
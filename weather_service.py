@@ -1,20 +1,29 @@
 # weather_service.py (재시도 로직 추가된 최종 완성본)
 
 import os
+import json
 import requests
-import platform
+import threading
 import time # ⬅️ time 라이브러리 추가
-from utils import image_to_base64_string
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from collections import defaultdict
 from config import Config
-from PIL import Image, ImageDraw, ImageFont
+from artifacts import Artifact
 
 class WeatherService:
     def __init__(self, config: Config):
         self.config = config
-        self.session = requests.Session()
+        self.session = self._create_session()
+        # 한 번의 실행에서 리스크 분석과 대시보드가 같은 예보 데이터를 공유하도록 결과를 보관합니다.
+        self._forecast_lock = threading.Lock()
+        self._forecast_result = None
+        # 동시 요청들이 함께 쓰는 재시도 예산과 백오프 시각
+        self._retry_lock = threading.Lock()
+        self._retries_left = config.WEATHER_RETRY_BUDGET
+        self._backoff_until = 0.0
         self.short_term_url = "http://apis.data.go.kr/1360000/VilageFcstInfoService_2.0/getVilageFcst"
         self.mid_term_temp_url = "http://apis.data.go.kr/1360000/MidFcstInfoService/getMidTa"
         self.mid_term_land_url = "http://apis.data.go.kr/1360000/MidFcstInfoService/getMidLandFcst"
@@ -24,8 +33,8 @@ class WeatherService:
         """
         7일간의 날씨 예보 데이터에서 물류 리스크(태풍, 폭설 등)를 찾아 리스트로 반환합니다.
         """
-        # 1. 기존의 데이터 수집 함수를 그대로 사용합니다.
-        daily_forecast = self._get_weather_forecast()
+        # 1. 대시보드와 같은 예보 데이터를 공유합니다. (이미 받았다면 재사용)
+        daily_forecast = self.get_forecast()
         if not daily_forecast:
             return []
 
@@ -49,112 +58,103 @@ class WeatherService:
     
 
     def create_dashboard_image(self, today_str):
-        """날씨 데이터로 대시보드 이미지를 생성하고, 파일 경로와 Base64 문자열을 딕셔너리로 반환합니다."""
-        # 1. 날짜가 포함된 고유한 파일명 생성
-        filename = f"images/weather_dashboard_{today_str}.png"
-        
+        """날씨 데이터로 대시보드 이미지를 생성하고, {'tiles': [{'artifact': Artifact, 'cid': ...}]}를 반환합니다."""
         try:
-            # 2. 날씨 데이터 수집 및 분석
-            weather_data = self._get_weather_forecast()
+            # 2. 날씨 데이터 수집 및 분석 (이미 받았다면 재사용)
+            weather_data = self.get_forecast()
             if not weather_data:
                 print("⚠️ 날씨 데이터를 수집하지 못해 대시보드 생성을 건너뜁니다.")
                 return None
             
             analyzed_data = self._analyze_weather_risk(weather_data)
 
-            # 3. Pillow를 사용하여 이미지 그리기
-            print("\n--- 🖼️ 대시보드 이미지 생성 시작 ---")
-            img_width, cell_height, top_margin = 1000, 100, 130 
-            img_height = top_margin + (cell_height * len(self.config.LOGISTICS_HUBS))
-            
-            font_path = self._get_font_path()
-            title_font = ImageFont.truetype(font_path, 32)
-            header_font = ImageFont.truetype(font_path, 18)
-            temp_font = ImageFont.truetype(font_path, 16)
-            risk_text_font = ImageFont.truetype(font_path, 14)
-
-            image = Image.new('RGB', (img_width, img_height), '#F9FAFB')
-            draw = ImageDraw.Draw(image)
-            
-            days = sorted(analyzed_data.keys())
+            # 예보 범위(오늘 ~ WEATHER_FORECAST_DAYS일 뒤)까지만 표시합니다.
+            last_day = (datetime.now(ZoneInfo('Asia/Seoul')) + timedelta(days=self.config.WEATHER_FORECAST_DAYS)).strftime('%Y%m%d')
+            days = [day for day in sorted(analyzed_data.keys()) if day <= last_day]
             if not days:
                 print("⚠️ 분석된 날씨 데이터가 없어 대시보드 생성을 중단합니다.")
                 return None
 
-            start_date = datetime.strptime(days[0], "%Y%m%d").strftime("%m/%d")
-            end_date = datetime.strptime(days[-1], "%Y%m%d").strftime("%m/%d")
-            draw.text((50, 30), f"권역별 주간 날씨 체크 ({start_date} ~ {end_date})", font=title_font, fill='#111827')
-
+            # 3. 권역을 여러 장으로 나눠 병렬로 그리기 (캐시된 배경 위에 날짜와 셀 내용만 덧그림)
+            print("\n--- 🖼️ 대시보드 이미지 생성 시작 ---")
             short_base_date, short_base_time = self._get_short_term_base_datetime()
             update_time_str = f"업데이트: {short_base_date[4:6]}/{short_base_date[6:8]} {short_base_time[:2]}:{short_base_time[2:]} 기준"
-            update_text_width = draw.textlength(update_time_str, font=temp_font)
-            draw.text((img_width - update_text_width - 50, 45), update_time_str, font=temp_font, fill='#6B7280')
-
-            regions = list(self.config.LOGISTICS_HUBS.keys())
-            cell_width = (img_width - 100) / len(days)
-            weekdays = ['월', '화', '수', '목', '금', '토', '일']
-
-            for i, day in enumerate(days):
-                dt = datetime.strptime(day, "%Y%m%d")
-                x = 100 + (i * cell_width)
-                header_text = f"{dt.strftime('%m/%d')}({weekdays[dt.weekday()]})"
-                text_width = draw.textlength(header_text, font=header_font)
-                draw.text((x + cell_width/2 - text_width/2, top_margin - 50), header_text, font=header_font, fill='#374151')
-
-            for j, region in enumerate(regions):
-                y = top_margin + (j * cell_height)
-                text_width = draw.textlength(region, font=header_font)
-                draw.text((50 - text_width/2 if 50 - text_width/2 > 0 else 5, y + cell_height/2 - 10), region, font=header_font, fill='#1F2937')
-                for i, day in enumerate(days):
-                    x = 100 + (i * cell_width)
-                    data = analyzed_data.get(day, {}).get(region)
-                    if data and data.get('min_temp'):
-                        risk_level = data.get('risk_level', '안전')
-                        risk_color = {'안전': '#FFFFFF', '주의': '#FFFBEB', '위험': '#FEF2F2'}.get(risk_level, '#FFFFFF')
-                        draw.rectangle([x, y, x + cell_width, y + cell_height], fill=risk_color, outline='#E5E7EB')
-                        weather_icon = self._get_weather_icon(data.get('icon_code', 'sunny'))
-                        if weather_icon: image.paste(weather_icon, (int(x + cell_width/2 - 20), int(y + 15)), weather_icon)
-                        min_t, max_t = data.get('min_temp', '-'), data.get('max_temp', '-')
-                        temp_text = f"{max_t}° / {min_t}°"
-                        text_width = draw.textlength(temp_text, font=temp_font)
-                        draw.text((x + cell_width/2 - text_width/2, y + 60), temp_text, font=temp_font, fill='#4B5563')
-                        risk_text = data.get('risk_text', '')
-                        if risk_text and risk_text not in ["비", "눈"]:
-                            text_width = draw.textlength(risk_text, font=risk_text_font)
-                            text_color = {'주의': '#D97706', '위험': '#DC2626'}.get(risk_level)
-                            draw.text((x + cell_width/2 - text_width/2, y + 80), risk_text, font=risk_text_font, fill=text_color)
-                    else:
-                        draw.rectangle([x, y, x + cell_width, y + cell_height], fill='#F3F4F6', outline='#E5E7EB')
-                        text_width = draw.textlength("정보 없음", font=header_font)
-                        draw.text((x + cell_width/2 - text_width/2, y + cell_height/2 - 10), "정보 없음", font=header_font, fill='#9CA3AF')
-            
-            # 4. 이미지 파일로 저장 (이메일 첨부용)
-            image.save(filename)
-            print(f"✅ 7일 예보 대시보드 이미지 '{filename}' 저장 완료!")
-
-            # 5. 저장된 파일을 Base64로 변환 (웹페이지 삽입용)
-            base64_image = image_to_base64_string(filename)
+            image_format = self.config.DASHBOARD_IMAGE_FORMAT.upper()
+            from dashboard_renderer import render_dashboard_tiles # PIL은 대시보드를 그릴 때만 필요합니다.
+            tile_images = render_dashboard_tiles(
+                analyzed_data, days, update_time_str, self.config.LOGISTICS_HUBS.keys(),
+                hubs_per_tile=self.config.DASHBOARD_HUBS_PER_TILE, image_format=image_format
+            )
             
-            # 6. 최종 결과인 딕셔너리 반환
-            return {"filepath": filename, "base64": base64_image}
+            # 4. 메모리의 이미지 바이트를 그대로 넘깁니다. (웹페이지 삽입과 메일 첨부 모두 파일을 다시 읽지 않음)
+            extension = 'webp' if image_format == 'WEBP' else 'png'
+            tiles = []
+            for i, image_bytes in enumerate(tile_images):
+                suffix = f"_{i + 1}" if i else ""
+                tiles.append({
+                    "artifact": Artifact(image_bytes, f"weather_dashboard_{today_str}{suffix}.{extension}", f"image/{extension}"),
+                    "cid": f"weather_dashboard{suffix}",
+                })
+            print(f"✅ {len(days)}일 예보 대시보드 이미지 {len(tiles)}장 생성 완료! ({sum(t['artifact'].size for t in tiles) / 1024:.0f}KB)")
+
+            # 5. 최종 결과인 딕셔너리 반환
+            return {"tiles": tiles}
 
         except Exception as e:
             print(f"❌ 날씨 대시보드 이미지 생성 실패: {e}")
             return None
-            return None
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.config.WEATHER_MAX_CONCURRENCY)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_forecast(self):
+        """권역별 7일 예보를 한 번만 수집하고, 이후 호출에서는 같은 결과를 반환합니다."""
+        with self._forecast_lock:
+            if self._forecast_result is None:
+                self._forecast_result = self._get_weather_forecast()
+            return self._forecast_result
 
     def _get_weather_forecast(self):
         print("\n--- ☀️ 7일 날씨 데이터 수집 및 가공 시작 ---")
+        self._prune_cache()
         short_base_date, short_base_time = self._get_short_term_base_datetime()
         mid_base_datetime = self._get_mid_term_base_datetime()
 
-        all_regions_forecast = {}
+        # 권역별 단기/중기기온/중기육상 요청을 모은 뒤, 같은 격자/예보구역 요청은 하나로 합칩니다.
+        # 단기: (nx, ny, base_date, base_time) / 중기: (엔드포인트, regId, tmFc)
+        unique_requests, hub_request_keys = {}, {}
         for region_name, hub_info in self.config.LOGISTICS_HUBS.items():
+            short_key = ('short', hub_info['nx'], hub_info['ny'], short_base_date, short_base_time)
+            temp_key = ('mid_temp', hub_info['regId_temp'], mid_base_datetime)
+            land_key = ('mid_land', hub_info['regId_land'], mid_base_datetime)
+            unique_requests.setdefault(short_key, lambda h=hub_info: self._fetch_short_term_forecast(h, short_base_date, short_base_time))
+            unique_requests.setdefault(temp_key, lambda h=hub_info: self._fetch_mid_term_temp_forecast(h, mid_base_datetime))
+            unique_requests.setdefault(land_key, lambda h=hub_info: self._fetch_mid_term_land_forecast(h, mid_base_datetime))
+            hub_request_keys[region_name] = {'short': short_key, 'mid_temp': temp_key, 'mid_land': land_key}
+        print(f"   ㄴ 요청 {len(hub_request_keys) * 3}건 중 중복을 제외한 {len(unique_requests)}건을 조회합니다.")
+
+        with self._retry_lock:
+            self._retries_left = self.config.WEATHER_RETRY_BUDGET
+            self._backoff_until = 0.0
+        with ThreadPoolExecutor(max_workers=self.config.WEATHER_MAX_CONCURRENCY, thread_name_prefix='kma') as executor:
+            request_futures = {key: executor.submit(self._fetch_with_cache, key, fetch) for key, fetch in unique_requests.items()}
+        futures = {
+            (region_name, kind): request_futures[key]
+            for region_name, keys in hub_request_keys.items()
+            for kind, key in keys.items()
+        }
+
+        all_regions_forecast = {}
+        for region_name in self.config.LOGISTICS_HUBS:
             print(f"-> {region_name} 날씨 정보 처리 중...")
             try:
-                short_term_raw = self._fetch_short_term_forecast(hub_info, short_base_date, short_base_time)
-                mid_term_temp_raw = self._fetch_mid_term_temp_forecast(hub_info, mid_base_datetime)
-                mid_term_land_raw = self._fetch_mid_term_land_forecast(hub_info, mid_base_datetime)
+                short_term_raw = futures[(region_name, 'short')].result()
+                mid_term_temp_raw = futures[(region_name, 'mid_temp')].result()
+                mid_term_land_raw = futures[(region_name, 'mid_land')].result()
 
                 if short_term_raw or mid_term_temp_raw or mid_term_land_raw:
                     parsed_data = self._parse_forecast_data(short_term_raw, mid_term_temp_raw, mid_term_land_raw)
@@ -166,6 +166,48 @@ class WeatherService:
         
         return self._restructure_by_date(all_regions_forecast)
 
+    def _cache_path(self, request_key):
+        return os.path.join(self.config.WEATHER_CACHE_DIR, '_'.join(str(part) for part in request_key) + '.json')
+
+    def _fetch_with_cache(self, request_key, fetch):
+        """발표 기준시각이 포함된 요청 키로 응답을 디스크에 캐시합니다.
+
+        기상청 예보는 기준시각(base_time/tmFc)에만 갱신되므로, 같은 키의 응답은 다시 받을 필요가 없습니다.
+        """
+        path = self._cache_path(request_key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+            print(f"   ㄴ 예보 캐시 사용: {' / '.join(str(part) for part in request_key)}")
+            return items
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        items = fetch()
+        if items:
+            try:
+                os.makedirs(self.config.WEATHER_CACHE_DIR, exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(items, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"⚠️ 예보 캐시 저장 실패: {e}")
+        return items
+
+    def _prune_cache(self):
+        """기준시각이 지난 지 오래된 예보 캐시 파일을 정리합니다."""
+        if not os.path.isdir(self.config.WEATHER_CACHE_DIR):
+            return
+        expire_before = time.time() - self.config.WEATHER_CACHE_MAX_AGE_DAYS * 86400
+        for filename in os.listdir(self.config.WEATHER_CACHE_DIR):
+            path = os.path.join(self.config.WEATHER_CACHE_DIR, filename)
+            try:
+                if os.path.getmtime(path) < expire_before:
+                    os.remove(path)
+            except OSError:
+                pass
+
     def _parse_forecast_data(self, short_term, mid_term_temp, mid_term_land):
         # (이전과 동일한 코드)
         forecast = defaultdict(lambda: defaultdict(str))
@@ -188,7 +230,8 @@ class WeatherService:
         if mid_term_temp and isinstance(mid_term_temp, list) and mid_term_land and isinstance(mid_term_land, list):
             temp_item = mid_term_temp[0]
             land_item = mid_term_land[0]
-            for i in range(3, 8):
+            # 중기예보는 최대 10일 뒤까지 제공되며, 8일 이후는 오전/오후 구분 없이 wf{i} 하나만 있습니다.
+            for i in range(3, min(self.config.WEATHER_FORECAST_DAYS, 10) + 1):
                 date_str = (datetime.now(ZoneInfo('Asia/Seoul')) + timedelta(days=i)).strftime('%Y%m%d')
                 min_key, max_key = f'taMin{i}', f'taMax{i}'
                 if min_key in temp_item and max_key in temp_item:
@@ -198,6 +241,8 @@ class WeatherService:
                 if am_key in land_item and pm_key in land_item:
                     am_fcst, pm_fcst = land_item[am_key], land_item[pm_key]
                     forecast[date_str]['condition'] = am_fcst if am_fcst == pm_fcst else f"{am_fcst}/{pm_fcst}"
+                elif f'wf{i}' in land_item:
+                    forecast[date_str]['condition'] = land_item[f'wf{i}']
         return dict(forecast)
 
     def _restructure_by_date(self, all_regions_forecast):
@@ -235,70 +280,6 @@ class WeatherService:
                 weather['icon_code'] = icon_code
         return daily_forecast
 
-    def _draw_dashboard_image(self, analyzed_data):
-        # (이전과 동일한, 가운데 정렬된 코드)
-        try:
-            print("\n--- 🖼️ 대시보드 이미지 생성 시작 ---")
-            img_width, cell_height, top_margin = 1000, 100, 130 
-            img_height = top_margin + (cell_height * len(self.config.LOGISTICS_HUBS))
-            font_path = self._get_font_path()
-            title_font = ImageFont.truetype(font_path, 32)
-            header_font = ImageFont.truetype(font_path, 18)
-            temp_font = ImageFont.truetype(font_path, 16)
-            risk_text_font = ImageFont.truetype(font_path, 14)
-            image = Image.new('RGB', (img_width, img_height), '#F9FAFB')
-            draw = ImageDraw.Draw(image)
-            days = [(datetime.now(ZoneInfo('Asia/Seoul')) + timedelta(days=i)).strftime('%Y%m%d') for i in range(7)]
-            start_date = datetime.strptime(days[0], "%Y%m%d").strftime("%m/%d")
-            end_date = datetime.strptime(days[-1], "%Y%m%d").strftime("%m/%d")
-            draw.text((50, 30), f"권역별 주간 날씨 체크 ({start_date} ~ {end_date})", font=title_font, fill='#111827')
-            short_base_date, short_base_time = self._get_short_term_base_datetime()
-            update_time_str = f"업데이트: {short_base_date[4:6]}/{short_base_date[6:8]} {short_base_time[:2]}:{short_base_time[2:]} 기준"
-            update_text_width = draw.textlength(update_time_str, font=temp_font)
-            draw.text((img_width - update_text_width - 50, 45), update_time_str, font=temp_font, fill='#6B7280')
-            regions = list(self.config.LOGISTICS_HUBS.keys())
-            cell_width = (img_width - 100) / len(days)
-            weekdays = ['월', '화', '수', '목', '금', '토', '일']
-            for i, day in enumerate(days):
-                dt = datetime.strptime(day, "%Y%m%d")
-                x = 100 + (i * cell_width)
-                header_text = f"{dt.strftime('%m/%d')}({weekdays[dt.weekday()]})"
-                text_width = draw.textlength(header_text, font=header_font)
-                draw.text((x + cell_width/2 - text_width/2, top_margin - 50), header_text, font=header_font, fill='#374151')
-            for j, region in enumerate(regions):
-                y = top_margin + (j * cell_height)
-                text_width = draw.textlength(region, font=header_font)
-                draw.text((50 - text_width/2, y + cell_height/2 - 10), region, font=header_font, fill='#1F2937')
-                for i, day in enumerate(days):
-                    x = 100 + (i * cell_width)
-                    data = analyzed_data.get(day, {}).get(region)
-                    if data and data.get('min_temp'):
-                        risk_level = data.get('risk_level', '안전')
-                        risk_color = {'안전': '#FFFFFF', '주의': '#FFFBEB', '위험': '#FEF2F2'}.get(risk_level, '#FFFFFF')
-                        draw.rectangle([x, y, x + cell_width, y + cell_height], fill=risk_color, outline='#E5E7EB')
-                        weather_icon = self._get_weather_icon(data.get('icon_code', 'sunny'))
-                        if weather_icon: image.paste(weather_icon, (int(x + cell_width/2 - 20), int(y + 15)), weather_icon)
-                        min_t, max_t = data.get('min_temp', '-'), data.get('max_temp', '-')
-                        temp_text = f"{max_t}° / {min_t}°"
-                        text_width = draw.textlength(temp_text, font=temp_font)
-                        draw.text((x + cell_width/2 - text_width/2, y + 60), temp_text, font=temp_font, fill='#4B5563')
-                        risk_text = data.get('risk_text', '')
-                        if risk_text and risk_text not in ["비", "눈"]:
-                            text_width = draw.textlength(risk_text, font=risk_text_font)
-                            text_color = {'주의': '#D97706', '위험': '#DC2626'}.get(risk_level)
-                            draw.text((x + cell_width/2 - text_width/2, y + 80), risk_text, font=risk_text_font, fill=text_color)
-                    else:
-                        draw.rectangle([x, y, x + cell_width, y + cell_height], fill='#F3F4F6', outline='#E5E7EB')
-                        text_width = draw.textlength("정보 없음", font=header_font)
-                        draw.text((x + cell_width/2 - text_width/2, y + cell_height/2 - 10), "정보 없음", font=header_font, fill='#9CA3AF')
-            filename = "weather_dashboard.png"
-            image.save(filename)
-            print(f"✅ 7일 예보 대시보드 이미지 '{filename}' 저장 완료!")
-            return filename
-        except Exception as e:
-            print(f"❌ 이미지 생성 중 오류 발생: {e}")
-            return None
-    
     def _get_short_term_base_datetime(self):
         # (이전과 동일한 안정화된 코드)
         now = datetime.now(ZoneInfo('Asia/Seoul'))
@@ -320,19 +301,39 @@ class WeatherService:
         else: base_time = now.strftime('%Y%m%d') + "1800"
         return base_time
 
+    def _wait_for_backoff(self):
+        """다른 요청이 실패해 백오프 중이면 그 시각까지 함께 대기합니다."""
+        wait_time = self._backoff_until - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def _reserve_retry(self, attempt):
+        """공유 재시도 예산에서 1회를 차감하고 백오프 시각을 갱신합니다. 예산이 없으면 None을 반환합니다."""
+        with self._retry_lock:
+            if self._retries_left <= 0:
+                return None
+            self._retries_left -= 1
+            sleep_time = (attempt + 1) * 2 # 2초, 4초 대기
+            self._backoff_until = max(self._backoff_until, time.monotonic() + sleep_time)
+            return sleep_time
+
     def _fetch_api(self, url, params):
-        """ ✨ 재시도 로직과 URL 인코딩 문제를 해결한 최종 API 호출 함수 """
+        """ ✨ 재시도 로직과 URL 인코딩 문제를 해결한 최종 API 호출 함수
+
+        동시에 실행되는 요청들은 재시도 예산(WEATHER_RETRY_BUDGET)과 백오프 시각을 공유하므로,
+        서버 장애 시 모든 요청이 각자 재시도를 반복하며 대기 시간을 늘리지 않습니다.
+        """
+        # serviceKey는 이미 인코딩된 값이라 urlencode 대상에서 제외합니다.
+        service_key = params['serviceKey']
+        query_string = requests.models.urlencode({k: v for k, v in params.items() if k != 'serviceKey'})
+        request_url = f"{url}?serviceKey={service_key}&{query_string}"
+
         for attempt in range(3): # 최대 3번 재시도
+            self._wait_for_backoff()
+            response = None
             try:
-                service_key = params.pop('serviceKey')
-                query_string = requests.models.urlencode(params)
-                request_url = f"{url}?serviceKey={service_key}&{query_string}"
-                
                 response = self.session.get(request_url, timeout=15)
                 response.raise_for_status()
-                
-                # serviceKey를 다시 채워넣어 다음 재시도에 사용될 수 있도록 함
-                params['serviceKey'] = service_key
 
                 data = response.json()
                 if data.get('response', {}).get('header', {}).get('resultCode') == '00':
@@ -341,20 +342,22 @@ class WeatherService:
                     error_msg = data.get('response', {}).get('header', {}).get('resultMsg', 'Unknown Error')
                     print(f"   ㄴ API 오류 (시도 {attempt+1}/3): {error_msg}")
             
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 print(f"   ㄴ 요청 또는 파싱 오류 (시도 {attempt+1}/3): {e}")
-                if 'response' in locals():
-                    print(f"   ㄴ 서버 실제 응답: {response.text}")
+                if response is not None:
+                    print(f"   ㄴ 서버 실제 응답: {response.text[:300]}")
 
             # 실패 시 대기
             if attempt < 2:
-                sleep_time = (attempt + 1) * 2 # 2초, 4초 대기
+                sleep_time = self._reserve_retry(attempt)
+                if sleep_time is None:
+                    print("   ㄴ 공유 재시도 예산을 모두 사용해 재시도하지 않습니다.")
+                    break
                 print(f"   ... {sleep_time}초 후 재시도합니다 ...")
-                time.sleep(sleep_time)
         
-        return None # 3번 모두 실패하면 None 반환
+        return None # 모두 실패하면 None 반환
 
-    # (이하 _fetch_... , _get_weather_icon, _get_font_path 함수는 이전 최종본과 동일)
+    # (이하 _fetch_... 함수는 이전 최종본과 동일)
     def _fetch_short_term_forecast(self, hub_info, base_date, base_time):
         params = {'serviceKey': self.config.WEATHER_API_KEY, 'dataType': 'JSON', 'numOfRows': '1000', 'base_date': base_date, 'base_time': base_time, 'nx': str(hub_info['nx']), 'ny': str(hub_info['ny'])}
         return self._fetch_api(self.short_term_url, params)
@@ -367,25 +370,6 @@ class WeatherService:
         params = {'serviceKey': self.config.WEATHER_API_KEY, 'dataType': 'JSON', 'regId': hub_info['regId_land'], 'tmFc': base_datetime}
         return self._fetch_api(self.mid_term_land_url, params)
 
-    def _get_weather_icon(self, icon_code):
-        icon_map = {'sunny': 'assets/sunny.png', 'cloudy': 'assets/cloudy.png', 'rain': 'assets/rain.png', 'snow': 'assets/snow.png'}
-        path = icon_map.get(icon_code, 'assets/sunny.png')
-        if not os.path.exists(path):
-            print(f"⚠️ 아이콘 파일 '{path}'을 찾을 수 없습니다.")
-            return None
-        return Image.open(path).convert("RGBA").resize((40, 40))
-
-    def _get_font_path(self):
-        local_font_path = "assets/NanumGothicBold.ttf"
-        if os.path.exists(local_font_path): return local_font_path
-        system_name = platform.system()
-        if system_name == 'Windows': return 'malgun.ttf'
-        elif system_name == 'Darwin': return '/System/Library/Fonts/AppleSDGothicNeo.ttc'
-        else:
-            if os.path.exists('/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf'):
-                return '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf'
-        raise FileNotFoundError("적절한 한글 폰트를 찾을 수 없습니다. 'assets' 폴더에 NanumGothicBold.ttf를 넣어주세요.")
-
 if __name__ == '__main__':
     config = Config()
     weather_service = WeatherService(config)